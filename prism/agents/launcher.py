@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -13,6 +12,7 @@ from prism.agents.config import (
 )
 from prism.agents.context_generator import generate_context_file, output_file_for_tool
 from prism.config import load_global_config
+from prism.utils.executables import find_executable
 
 _TOOL_BINARY: dict[str, str] = {
     "claude_code": "claude",
@@ -41,7 +41,7 @@ class LaunchResult:
 
 
 def _tool_installed(tool: str) -> bool:
-    return shutil.which(_TOOL_BINARY.get(tool, tool)) is not None
+    return find_executable(_TOOL_BINARY.get(tool, tool)) is not None
 
 
 def _flux_healthy() -> bool:
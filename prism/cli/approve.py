@@ -2,9 +2,6 @@
 
 import click
 
-from prism.pipeline.pr_manager import PRManager
-from prism.qa.approval_workflow import QAApprovalWorkflow
-
 
 @click.command(name="approve")
 @click.option("--pr", type=int, help="Número del PR")
@@ -18,6 +15,8 @@ def approve_pr(pr: int, task_id: str, message: str, qa_agent: str):
         prism approve --pr 123
         prism approve --task TASK-42 --message "Excelente implementación"
     """
+    from prism.pipeline.pr_manager import PRManager
+    from prism.qa.approval_workflow import QAApprovalWorkflow
 
     # Si tenemos task_id pero no pr, necesitamos obtener el PR number
     if task_id and not pr:
@@ -33,7 +32,10 @@ def approve_pr(pr: int, task_id: str, message: str, qa_agent: str):
 
     # Aprobar en el workflow
     workflow = QAApprovalWorkflow()
-    workflow.approve(pr, message, qa_agent, task_id or "unknown")
+    try:
+        workflow.approve(pr, message, qa_agent, task_id or "unknown")
+    finally:
+        workflow.shutdown()
 
     # Aprobar en GitHub
     try:
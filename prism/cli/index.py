@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 import click
@@ -7,6 +8,7 @@ import yaml
 from rich.console import Console
 
 from prism.config import GLOBAL_CONFIG_DIR, load_global_config
+from prism.memory.onnx_encoder import prepare_onnx_model
 from prism.memory.store import SkillStore, load_skill_from_file
 
 console = Console()
@@ -35,20 +37,21 @@ def rebuild(verbose: bool) -> None:
     embeddings = load_global_config().memory.embeddings_enabled
     valid, invalid = [], []
 
+    for md_file in _iter_skill_files(mem_dir):
+        skill = load_skill_from_file(md_file)
+        if skill is None:
+            invalid.append(md_file)
+            if verbose:
+                console.print(f"[yellow]  ⚠ invalid frontmatter: {md_file}[/yellow]")
+            continue
+        skill.file_path = md_file
+        valid.append(skill)
+        if verbose:
+            console.print(f"  ✓ {skill.frontmatter.skill_id}")
+
     with SkillStore(_db_path(), embeddings) as store:
         store.clear()
-        for md_file in _iter_skill_files(mem_dir):
-            skill = load_skill_from_file(md_file)
-            if skill is None:
-                invalid.append(md_file)
-                if verbose:
-                    console.print(f"[yellow]  ⚠ invalid frontmatter: {md_file}[/yellow]")
-                continue
-            skill.file_path = md_file
-            store.upsert(skill)
-            valid.append(skill)
-            if verbose:
-                console.print(f"  ✓ {skill.frontmatter.skill_id}")
+        store.upsert_many(valid)
 
     _write_index_yaml(mem_dir, valid)
     console.print(f"[green]✅ Index rebuilt — {len(valid)} skills indexed[/green]")
@@ -56,6 +59,16 @@ def rebuild(verbose: bool) -> None:
         console.print(f"[yellow]⚠  {len(invalid)} files with invalid frontmatter (use --verbose to list)[/yellow]")
 
 
+@index.command(name="prepare-model")
+def prepare_model() -> None:
+    """Download and quantize the int8 ONNX embedding model."""
+    path = prepare_onnx_model(_memory_dir() / "models")
+    if path is None:
+        console.print("[yellow]⚠  ONNX model not prepared (needs onnxruntime, transformers and huggingface_hub; see log)[/yellow]")
+        sys.exit(1)
+    console.print(f"[green]✅ ONNX model ready: {path}[/green]")
+
+
 def _iter_skill_files(mem_dir: Path):
     for subdir in _MEMORY_SUBDIRS:
         yield from (mem_dir / subdir).glob("*.md")
@@ -79,10 +79,14 @@ def _run_deduplication(
     }
 
 
-def _run_conflict_detection(skills, project_cfg, dry_run: bool = False) -> dict:
+def _run_conflict_detection(
+    skills, project_cfg, dry_run: bool = False, auto: bool = False
+) -> dict:
     """Detect conflicts between skills."""
-    # Limit to avoid excessive API calls
-    conflicts = find_all_conflicts(skills[:30], max_pairs=20)
+    # Limit to avoid excessive API calls; unattended runs can wait for a batch
+    conflicts = find_all_conflicts(
+        skills[:30], max_pairs=20, batch_threshold=16 if auto else None
+    )
 
     tasks_created = 0
     if conflicts and not dry_run:
@@ -219,7 +223,9 @@ def optimize(dry_run: bool, auto: bool, confirm: bool, project_dir: str) -> None
 
             # 5. Conflict Detection
             console.print("[bold]5. Conflict Detection (Haiku)[/bold]")
-            conflict_result = _run_conflict_detection(skills, project_cfg, dry_run)
+            conflict_result = _run_conflict_detection(
+                skills, project_cfg, dry_run, auto
+            )
             console.print(
                 f"   {conflict_result['conflicts']} conflicts — {conflict_result['action']}"
             )
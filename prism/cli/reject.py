@@ -2,9 +2,6 @@
 
 import click
 
-from prism.pipeline.pr_manager import PRManager
-from prism.qa.approval_workflow import QAApprovalWorkflow
-
 
 @click.command(name="reject")
 @click.option("--pr", type=int, help="Número del PR")
@@ -18,6 +15,8 @@ def reject_pr(pr: int, task_id: str, reason: str, qa_agent: str):
         prism reject --pr 123 --reason "Falta manejo de errores"
         prism reject --task TASK-42 --reason "Cobertura solo 60%"
     """
+    from prism.pipeline.pr_manager import PRManager
+    from prism.qa.approval_workflow import QAApprovalWorkflow
 
     if task_id and not pr:
         click.echo(f"🔍 Buscando PR para task {task_id}...")
@@ -30,7 +29,10 @@ def reject_pr(pr: int, task_id: str, reason: str, qa_agent: str):
 
     # Rechazar en el workflow
     workflow = QAApprovalWorkflow()
-    workflow.reject(pr, reason, qa_agent, task_id or "unknown")
+    try:
+        workflow.reject(pr, reason, qa_agent, task_id or "unknown")
+    finally:
+        workflow.shutdown()
 
     # Solicitar cambios en GitHub
     try:
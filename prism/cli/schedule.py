@@ -18,15 +18,11 @@ _CRON_JOB = "0 9 * * 0 {} prism optimize --auto > ~/.prism/optimizer.log 2>&1"
 
 def _get_prism_path() -> str:
     """Get the path to the prism executable."""
-    # Try to find prism in PATH
-    try:
-        result = subprocess.run(
-            ["which", "prism"], capture_output=True, text=True, check=True
-        )
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # Fallback: assume it's installed via uv
-        return "~/.local/bin/prism"
+    # Look prism up on PATH in-process rather than forking `which`
+    from prism.utils.executables import find_executable
+
+    # Fallback: assume it's installed via uv
+    return find_executable("prism") or "~/.local/bin/prism"
 
 
 def _install_cron() -> bool:
@@ -2,14 +2,13 @@
 
 import click
 
-from prism.pipeline.orchestrator import PipelineOrchestrator
-
 
 @click.command(name="submit-for-qa")
 @click.option("--task-id", required=True, help="ID del task a enviar a QA")
 @click.option("--message", help="Mensaje descriptivo de los cambios")
 def submit_for_qa(task_id: str, message: str):
     """Envía un task a QA para revisión manual (alternativa al webhook)."""
+    from prism.pipeline.orchestrator import PipelineOrchestrator
 
     click.echo(f"🚀 Enviando task {task_id} a QA...")
 
@@ -14,6 +14,8 @@ from prism.spec.augmenter import is_augmented
 
 console = Console()
 
+_MAPPING_SCHEMA = 2
+
 
 @click.command()
 @click.option("--project-id", default="", help="Flux project ID (overrides project.yaml)")
@@ -34,8 +36,10 @@ def sync(project_id: str, project_dir: str, dry_run: bool) -> None:
             "flux_project_id not set. Use --project-id or set it in .prism/project.yaml"
         )
 
-    mapping = _load_mapping(proj_dir)
-    _normalize_mapping(mapping)
+    data = _load_project_data(proj_dir)
+    mapping = data.get("flux_task_map", {})
+    if data.get("flux_task_map_schema") != _MAPPING_SCHEMA:
+        _normalize_mapping(mapping)
     counts = _sync_epics(epics, flux_id, client, mapping, dry_run)
     if not dry_run:
         _save_mapping(proj_dir, mapping)
@@ -55,12 +59,15 @@ def _resolve_tasks_file(proj_dir: Path) -> Path:
     return latest
 
 
-def _load_mapping(proj_dir: Path) -> dict:
+def _load_project_data(proj_dir: Path) -> dict:
     yaml_path = proj_dir / ".prism" / "project.yaml"
     if not yaml_path.exists():
         return {}
-    data = yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
-    return data.get("flux_task_map", {})
+    return yaml.safe_load(yaml_path.read_text(encoding="utf-8")) or {}
+
+
+def _load_mapping(proj_dir: Path) -> dict:
+    return _load_project_data(proj_dir).get("flux_task_map", {})
 
 
 def _save_mapping(proj_dir: Path, mapping: dict) -> None:
@@ -71,17 +78,20 @@ def _save_mapping(proj_dir: Path, mapping: dict) -> None:
         else {}
     )
     data["flux_task_map"] = mapping
+    data["flux_task_map_schema"] = _MAPPING_SCHEMA
     yaml_path.write_text(
         yaml.dump(data, default_flow_style=False), encoding="utf-8"
     )
 
 
+def _is_legacy_entry(key: str, value) -> bool:
+    return isinstance(value, str) and not key.startswith("__epic__")
+
+
 def _normalize_mapping(mapping: dict) -> None:
-    for key, value in list(mapping.items()):
-        if key.startswith("__epic__"):
-            continue
-        if isinstance(value, str):
-            mapping[key] = {"flux_id": value, "content_hash": ""}
+    legacy = [(k, v) for k, v in mapping.items() if _is_legacy_entry(k, v)]
+    for key, value in legacy:
+        mapping[key] = {"flux_id": value, "content_hash": ""}
 
 
 def _task_content_hash(task) -> str:
@@ -3,9 +3,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
-import yaml
 from pydantic import BaseModel, Field
 
+from prism.utils.yaml_utils import read_yaml
+
 GLOBAL_CONFIG_DIR = Path.home() / ".prism"
 GLOBAL_CONFIG_PATH = GLOBAL_CONFIG_DIR / "prism.config.yaml"
 
@@ -71,20 +72,13 @@ class ProjectConfig(BaseModel):
     agent_roles: dict[str, AgentRoleDefault] = Field(default_factory=dict)
 
 
-def _read_yaml(path: Path) -> dict:
-    if not path.exists():
-        return {}
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
-
-
 def load_global_config() -> PrismConfig:
-    data = _read_yaml(GLOBAL_CONFIG_PATH)
+    data = read_yaml(GLOBAL_CONFIG_PATH)
     return PrismConfig.model_validate(data) if data else PrismConfig()
 
 
 def load_project_config(project_dir: Path) -> ProjectConfig:
-    data = _read_yaml(project_dir / ".prism" / "project.yaml")
+    data = read_yaml(project_dir / ".prism" / "project.yaml")
     return ProjectConfig.model_validate(data) if data else ProjectConfig()
 
 
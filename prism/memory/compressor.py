@@ -5,12 +5,13 @@ from __future__ import annotations
 import json
 import os
 import shutil
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from prism.config import GLOBAL_CONFIG_DIR
+from prism.memory.llm import loads_json
 from prism.memory.schemas import Skill
 
 
@@ -59,8 +60,7 @@ def _backup_original(skill: Skill) -> Path:
     backup_dir = GLOBAL_CONFIG_DIR / "memory" / "episodes" / "compressed"
     backup_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_name = f"{skill.frontmatter.skill_id}_{timestamp}.md"
+    backup_name = f"{skill.frontmatter.skill_id}_{time.time_ns()}.md"
     backup_path = backup_dir / backup_name
 
     if skill.file_path and skill.file_path.exists():
@@ -69,10 +69,20 @@ def _backup_original(skill: Skill) -> Path:
     return backup_path
 
 
+def _backup_sort_key(path: Path, skill_id: str) -> int:
+    """Order backups by the numeric suffix in their filename.
+
+    Legacy ``YYYYmmdd_HHMMSS`` names collapse to a smaller integer than
+    ``time_ns`` suffixes, so they still sort as older.
+    """
+    suffix = path.stem[len(skill_id) + 1 :].replace("_", "")
+    return int(suffix) if suffix.isdigit() else 0
+
+
 def _parse_compression_response(text: str) -> Optional[tuple[str, str, int]]:
     """Parse the LLM response and return (title, content, tokens)."""
     try:
-        data = json.loads(text.strip())
+        data = loads_json(text)
         return (data.get("title", ""), data.get("content", ""), data.get("tokens", 0))
     except (json.JSONDecodeError, KeyError):
         return None
@@ -219,7 +229,7 @@ def restore_original(skill_id: str) -> bool:
     # Find most recent backup for this skill
     backups = sorted(
         backup_dir.glob(f"{skill_id}_*.md"),
-        key=lambda p: p.stat().st_mtime,
+        key=lambda p: _backup_sort_key(p, skill_id),
         reverse=True,
     )
 
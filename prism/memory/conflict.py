@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from dataclasses import dataclass
+from itertools import islice
 from typing import Optional
 
+from prism.memory.conflict_cache import ConflictCache, pair_key
+from prism.memory.dedup import domain_candidate_pairs
+from prism.memory.llm import (
+    TokenBudgetTracker,
+    create_with_backoff,
+    estimate_tokens,
+    loads_json,
+    run_message_batch,
+)
 from prism.memory.schemas import Skill
 
 
@@ -20,6 +31,8 @@ class ConflictResult:
     resolution_hint: str
 
 
+_CONTENT_HEAD_CHARS = 2000
+
 _CONFLICT_PROMPT = """\
 You are analyzing two software development skills to detect if they contain contradictory or incompatible instructions.
 
@@ -52,8 +65,16 @@ Respond with a single JSON object:
 """
 
 
-def _build_conflict_prompt(skill_a: Skill, skill_b: Skill) -> str:
-    """Build the prompt for conflict detection."""
+def _build_conflict_prompt(
+    skill_a: Skill,
+    skill_b: Skill,
+    content_a: Optional[str] = None,
+    content_b: Optional[str] = None,
+) -> str:
+    """Build the prompt for conflict detection.
+
+    ``content_a``/``content_b`` let bulk callers pass pre-truncated content.
+    """
     domains_a = set(skill_a.frontmatter.domain_tags)
     domains_b = set(skill_b.frontmatter.domain_tags)
     overlap = domains_a & domains_b
@@ -62,9 +83,13 @@ def _build_conflict_prompt(skill_a: Skill, skill_b: Skill) -> str:
 
     return _CONFLICT_PROMPT.format(
         title_a=skill_a.title,
-        content_a=skill_a.content[:2000],
+        content_a=(
+            skill_a.content[:_CONTENT_HEAD_CHARS] if content_a is None else content_a
+        ),
         title_b=skill_b.title,
-        content_b=skill_b.content[:2000],
+        content_b=(
+            skill_b.content[:_CONTENT_HEAD_CHARS] if content_b is None else content_b
+        ),
         domains=domain_str,
     )
 
@@ -72,17 +97,50 @@ def _build_conflict_prompt(skill_a: Skill, skill_b: Skill) -> str:
 def _parse_conflict_response(text: str) -> Optional[ConflictResult]:
     """Parse the LLM response."""
     try:
-        data = json.loads(text.strip())
-        return ConflictResult(
-            skill_a="",  # Will be filled by caller
-            skill_b="",  # Will be filled by caller
-            conflict_detected=data.get("conflict_detected", False),
-            conflict_type=data.get("conflict_type", "none"),
-            description=data.get("description", ""),
-            resolution_hint=data.get("resolution_hint", ""),
-        )
+        data = loads_json(text)
     except json.JSONDecodeError:
         return None
+    # Valid JSON that isn't an object ([1], "x") is as unusable as bad JSON
+    if not isinstance(data, dict):
+        return None
+    return ConflictResult(
+        skill_a="",  # Will be filled by caller
+        skill_b="",  # Will be filled by caller
+        conflict_detected=data.get("conflict_detected", False),
+        conflict_type=data.get("conflict_type", "none"),
+        description=data.get("description", ""),
+        resolution_hint=data.get("resolution_hint", ""),
+    )
+
+
+def _should_skip_pair(skill_a: Skill, skill_b: Skill) -> bool:
+    """Return True for pairs that cannot conflict or are already flagged."""
+    # Skip if no domain overlap
+    domains_a = set(skill_a.frontmatter.domain_tags)
+    domains_b = set(skill_b.frontmatter.domain_tags)
+    if not domains_a & domains_b:
+        return True
+
+    # Skip if same skill
+    if skill_a.frontmatter.skill_id == skill_b.frontmatter.skill_id:
+        return True
+
+    # Skip if either is already marked as conflicted
+    return (
+        skill_a.frontmatter.status == "conflicted"
+        or skill_b.frontmatter.status == "conflicted"
+    )
+
+
+def _conflict_from_text(
+    text: str, skill_a: Skill, skill_b: Skill
+) -> Optional[ConflictResult]:
+    result = _parse_conflict_response(text)
+    if result and result.conflict_detected:
+        result.skill_a = skill_a.frontmatter.skill_id
+        result.skill_b = skill_b.frontmatter.skill_id
+        return result
+    return None
 
 
 def detect_conflict(
@@ -102,21 +160,7 @@ def detect_conflict(
     Returns:
         ConflictResult if conflict detected, None otherwise or on error
     """
-    # Skip if no domain overlap
-    domains_a = set(skill_a.frontmatter.domain_tags)
-    domains_b = set(skill_b.frontmatter.domain_tags)
-    if not domains_a & domains_b:
-        return None
-
-    # Skip if same skill
-    if skill_a.frontmatter.skill_id == skill_b.frontmatter.skill_id:
-        return None
-
-    # Skip if either is already marked as conflicted
-    if (
-        skill_a.frontmatter.status == "conflicted"
-        or skill_b.frontmatter.status == "conflicted"
-    ):
+    if _should_skip_pair(skill_a, skill_b):
         return None
 
     if dry_run:
@@ -135,32 +179,91 @@ def detect_conflict(
         return None
 
     try:
-        import anthropic
+        key = pair_key(skill_a, skill_b, model)
+        with ConflictCache() as cache:
+            text = cache.get(key)
+            if text is None or _parse_conflict_response(text) is None:
+                import anthropic
 
-        client = anthropic.Anthropic(api_key=api_key)
+                client = anthropic.Anthropic(api_key=api_key)
 
-        prompt = _build_conflict_prompt(skill_a, skill_b)
+                prompt = _build_conflict_prompt(skill_a, skill_b)
 
-        message = client.messages.create(
-            model=model,
-            max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}],
-        )
+                message = client.messages.create(
+                    model=model,
+                    max_tokens=1024,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                text = message.content[0].text
+                # Only verdicts that parse are worth remembering
+                if _parse_conflict_response(text) is not None:
+                    cache.put(key, text)
 
-        result = _parse_conflict_response(message.content[0].text)
-        if result and result.conflict_detected:
-            result.skill_a = skill_a.frontmatter.skill_id
-            result.skill_b = skill_b.frontmatter.skill_id
-            return result
+        return _conflict_from_text(text, skill_a, skill_b)
 
+    except Exception:
         return None
 
+
+async def _arequest_conflict(
+    client,
+    prompt: str,
+    model: str,
+    semaphore: asyncio.Semaphore,
+    tracker: TokenBudgetTracker,
+) -> Optional[str]:
+    """Send one conflict prompt on a shared async client; None on error."""
+    try:
+        async with semaphore:
+            slot = await tracker.acquire(estimate_tokens(prompt, 1024))
+            message = await create_with_backoff(
+                client,
+                model=model,
+                max_tokens=1024,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            usage = message.usage
+            tracker.record(slot, usage.input_tokens + usage.output_tokens)
+        return message.content[0].text
     except Exception:
         return None
 
 
+async def _arequest_all(
+    prompts: list[str], model: str, max_in_flight: int, api_key: str
+) -> dict[int, str]:
+    import anthropic
+
+    semaphore = asyncio.Semaphore(max_in_flight)
+    tracker = TokenBudgetTracker()
+    # Retries are handled by create_with_backoff
+    async with anthropic.AsyncAnthropic(api_key=api_key, max_retries=0) as client:
+        texts = await asyncio.gather(
+            *(
+                _arequest_conflict(client, prompt, model, semaphore, tracker)
+                for prompt in prompts
+            )
+        )
+    return {idx: text for idx, text in enumerate(texts) if text is not None}
+
+
+def _request_batch(prompts: list[str], model: str, api_key: str) -> dict[int, str]:
+    """Send all prompts as one Message Batch (half price, no RPM pressure)."""
+    try:
+        import anthropic
+
+        client = anthropic.Anthropic(api_key=api_key)
+        return run_message_batch(client, prompts, model, max_tokens=1024)
+    except Exception:
+        return {}
+
+
 def find_all_conflicts(
-    skills: list[Skill], model: str = "claude-haiku-4-5-20251001", max_pairs: int = 50
+    skills: list[Skill],
+    model: str = "claude-haiku-4-5-20251001",
+    max_pairs: int = 50,
+    max_in_flight: int = 5,
+    batch_threshold: Optional[int] = None,
 ) -> list[ConflictResult]:
     """Find all conflicting skill pairs in a list.
 
@@ -168,35 +271,67 @@ def find_all_conflicts(
         skills: List of skills to check
         model: Model to use for detection
         max_pairs: Maximum number of pairs to check (to limit API calls)
+        max_in_flight: Maximum number of concurrent API calls
+        batch_threshold: If set, use the Message Batches API once at least
+            this many pairs are queued. Cheaper but may take minutes, so
+            meant for unattended runs.
 
     Returns:
         List of detected conflicts
     """
-    conflicts = []
-    checked = 0
-
-    # Prioritize checking skills in the same domain
-    domain_groups = {}
-    for skill in skills:
-        for domain in skill.frontmatter.domain_tags:
-            if domain not in domain_groups:
-                domain_groups[domain] = []
-            domain_groups[domain].append(skill)
-
-    # Check within each domain group
-    for domain, group in domain_groups.items():
-        n = len(group)
-        for i in range(n):
-            for j in range(i + 1, n):
-                if checked >= max_pairs:
-                    break
-
-                result = detect_conflict(group[i], group[j], model)
-                checked += 1
-
-                if result and result.conflict_detected:
-                    conflicts.append(result)
+    # Only skills sharing a domain can conflict; each pair is checked once
+    pairs = [
+        (i, j)
+        for i, j in islice(domain_candidate_pairs(skills), max_pairs)
+        if not _should_skip_pair(skills[i], skills[j])
+    ]
 
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not pairs or not api_key:
+        return []
+
+    keys = [pair_key(skills[i], skills[j], model) for i, j in pairs]
+    with ConflictCache() as cache:
+        # Unchanged pairs reuse the verdict from a previous run
+        # (entries that no longer parse are asked again)
+        texts = {
+            n: text
+            for n, key in enumerate(keys)
+            if (text := cache.get(key)) and _parse_conflict_response(text) is not None
+        }
+        missing = [n for n in range(len(pairs)) if n not in texts]
+
+        # Slice each skill's content once, however many pairs it appears in
+        heads = {
+            idx: skills[idx].content[:_CONTENT_HEAD_CHARS]
+            for n in missing
+            for idx in pairs[n]
+        }
+        prompts = [
+            _build_conflict_prompt(skills[i], skills[j], heads[i], heads[j])
+            for i, j in (pairs[n] for n in missing)
+        ]
+
+        if not prompts:
+            fresh = {}
+        elif batch_threshold is not None and len(prompts) >= batch_threshold:
+            fresh = _request_batch(prompts, model, api_key)
+        else:
+            fresh = asyncio.run(_arequest_all(prompts, model, max_in_flight, api_key))
+
+        for k, text in fresh.items():
+            texts[missing[k]] = text
+            # An unparseable reply would otherwise read as "no conflict" for
+            # the cache's whole TTL; leave it out so the pair is retried
+            if _parse_conflict_response(text) is not None:
+                cache.put(keys[missing[k]], text)
+
+    conflicts = []
+    for n in sorted(texts):
+        i, j = pairs[n]
+        result = _conflict_from_text(texts[n], skills[i], skills[j])
+        if result:
+            conflicts.append(result)
     return conflicts
 
 
@@ -0,0 +1,73 @@
+"""Conflict Cache — remember LLM conflict verdicts for unchanged skill pairs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from prism.config import GLOBAL_CONFIG_DIR
+from prism.memory.schemas import Skill
+
+_DDL = """
+CREATE TABLE IF NOT EXISTS conflict_cache (
+    key         TEXT PRIMARY KEY,
+    result_json TEXT NOT NULL,
+    ts          REAL NOT NULL
+)
+"""
+
+_DEFAULT_TTL_DAYS = 30
+
+
+def _skill_hash(skill: Skill) -> str:
+    text = f"{skill.title}\n{skill.content}"
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def pair_key(skill_a: Skill, skill_b: Skill, model: str) -> str:
+    """Order-independent key for a pair: changes if either skill's text does."""
+    sides = sorted((s.frontmatter.skill_id, _skill_hash(s)) for s in (skill_a, skill_b))
+    blob = json.dumps([sides, model])
+    return hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+
+
+class ConflictCache:
+    """SQLite-backed map of pair key -> raw LLM response text."""
+
+    def __init__(
+        self, db_path: Optional[Path] = None, ttl_days: int = _DEFAULT_TTL_DAYS
+    ):
+        self._db_path = db_path or GLOBAL_CONFIG_DIR / "memory" / "conflict_cache.db"
+        self._ttl = ttl_days * 86400
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> ConflictCache:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self._db_path)
+        self._conn.execute(_DDL)
+        self._conn.execute(
+            "DELETE FROM conflict_cache WHERE ts < ?", (time.time() - self._ttl,)
+        )
+        self._conn.commit()
+        return self
+
+    def __exit__(self, *_) -> None:
+        if self._conn:
+            self._conn.commit()
+            self._conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT result_json FROM conflict_cache WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, text: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO conflict_cache(key, result_json, ts) VALUES(?,?,?)",
+            (key, text, time.time()),
+        )
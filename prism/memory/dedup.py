@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
 import re
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import combinations
 from math import log, sqrt
-from typing import Optional
+from operator import attrgetter
+from typing import Iterable, Iterator, Optional
 
 from prism.memory.schemas import Skill
 
+# Term frequencies depend only on the text; IDF only on the set of texts
+_TF_CACHE: dict[str, dict[str, float]] = {}
+_IDF_CACHE: dict[tuple[str, ...], dict[str, float]] = {}
+_SIGNATURE_CACHE: dict[str, int] = {}
+_CACHE_MAX_ENTRIES = 10_000
+
+_TOKEN_RE = re.compile(r"\b[a-z][a-z0-9_]*\b")
+
+# Approximate prefilter: SimHash bits allowed to differ, min vocabulary ratio
+_MAX_SIGNATURE_DISTANCE = 16
+_MIN_LENGTH_RATIO = 0.5
+
 
 @dataclass
 class SimilarityResult:
@@ -22,9 +39,7 @@ class SimilarityResult:
 
 def _tokenize(text: str) -> list[str]:
     """Simple tokenization: lowercase, alphanumeric only."""
-    text = text.lower()
-    tokens = re.findall(r"\b[a-z][a-z0-9_]*\b", text)
-    return tokens
+    return _TOKEN_RE.findall(text.lower())
 
 
 def _compute_tf(tokens: list[str]) -> dict[str, float]:
@@ -36,7 +51,7 @@ def _compute_tf(tokens: list[str]) -> dict[str, float]:
     return {term: count / total_tokens for term, count in token_counts.items()}
 
 
-def _compute_idf(documents: list[list[str]]) -> dict[str, float]:
+def _compute_idf(documents: list[Iterable[str]]) -> dict[str, float]:
     """Compute inverse document frequency."""
     num_docs = len(documents)
     if num_docs == 0:
@@ -61,35 +76,262 @@ def _compute_idf(documents: list[list[str]]) -> dict[str, float]:
     return idf
 
 
-def _compute_tfidf_vector(tokens: list[str], idf: dict[str, float]) -> dict[str, float]:
-    """Compute TF-IDF vector for a document."""
-    tf = _compute_tf(tokens)
+def _content_key(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _cached_tf(key: str, text: str) -> dict[str, float]:
+    """Return the term frequencies of ``text``, tokenizing it only once."""
+    tf = _TF_CACHE.get(key)
+    if tf is None:
+        tf = _compute_tf(_tokenize(text))
+        _remember(_TF_CACHE, key, tf)
+    return tf
+
+
+def _remember(cache: dict, key: str, value) -> None:
+    """Insert into a per-document cache, evicting the oldest entry when full."""
+    if len(cache) >= _CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _cached_idf(keys: list[str], tfs: list[dict[str, float]]) -> dict[str, float]:
+    """Return the IDF for this corpus, reusing it if the corpus is unchanged."""
+    corpus = tuple(sorted(keys))
+    idf = _IDF_CACHE.get(corpus)
+    if idf is None:
+        _IDF_CACHE.clear()  # only the latest corpus is worth keeping
+        idf = _IDF_CACHE[corpus] = _compute_idf(tfs)
+    return idf
+
+
+def _signature(key: str, tf: dict[str, float]) -> int:
+    """64-bit SimHash of a document, weighted by term frequency."""
+    sig = _SIGNATURE_CACHE.get(key)
+    if sig is not None:
+        return sig
+    weights = [0.0] * 64
+    for term, tf_value in tf.items():
+        digest = hashlib.blake2b(term.encode(), digest_size=8).digest()
+        h = int.from_bytes(digest, "big")
+        for bit in range(64):
+            weights[bit] += tf_value if h >> bit & 1 else -tf_value
+    sig = sum(1 << bit for bit, w in enumerate(weights) if w > 0)
+    _remember(_SIGNATURE_CACHE, key, sig)
+    return sig
+
+
+def _may_be_similar(sig_a: int, len_a: int, sig_b: int, len_b: int) -> bool:
+    """Cheap SimHash / vocabulary-size check run before the full cosine."""
+    if min(len_a, len_b) < _MIN_LENGTH_RATIO * max(len_a, len_b):
+        return False
+    return (sig_a ^ sig_b).bit_count() <= _MAX_SIGNATURE_DISTANCE
+
+
+def _compute_tfidf_vector(tf: dict[str, float], idf: dict[str, float]) -> dict[str, float]:
+    """Compute TF-IDF vector for a document from its term frequencies."""
     tfidf = {}
     for term, tf_value in tf.items():
         tfidf[term] = tf_value * idf.get(term, 0.0)
     return tfidf
 
 
-def _cosine_similarity(vec_a: dict[str, float], vec_b: dict[str, float]) -> float:
-    """Compute cosine similarity between two vectors."""
-    # Get all unique terms
-    all_terms = set(vec_a.keys()) | set(vec_b.keys())
-
-    # Compute dot product
-    dot_product = sum(vec_a.get(term, 0.0) * vec_b.get(term, 0.0) for term in all_terms)
+def _vector_norm(vec: dict[str, float]) -> float:
+    return sqrt(sum(v * v for v in vec.values()))
 
-    # Compute magnitudes
-    mag_a = sqrt(sum(v**2 for v in vec_a.values()))
-    mag_b = sqrt(sum(v**2 for v in vec_b.values()))
 
-    if mag_a == 0 or mag_b == 0:
+def _cosine_similarity(
+    vec_a: dict[str, float], vec_b: dict[str, float], norm_a: float, norm_b: float
+) -> float:
+    """Compute cosine similarity between two vectors with precomputed norms."""
+    if norm_a == 0 or norm_b == 0:
         return 0.0
 
-    return dot_product / (mag_a * mag_b)
+    # Terms missing from either side contribute nothing: walk the smaller dict
+    small, big = (vec_a, vec_b) if len(vec_a) <= len(vec_b) else (vec_b, vec_a)
+    dot_product = sum(w * big.get(term, 0.0) for term, w in small.items())
+
+    return dot_product / (norm_a * norm_b)
+
+
+def _term_triplets(
+    vectors: list[dict[str, float]],
+) -> tuple[list[int], list[int], list[float], int]:
+    """Flatten TF-IDF dicts into (row, term id, weight) triplets."""
+    vocab: dict[str, int] = {}
+    rows, cols, vals = [], [], []
+    for i, vec in enumerate(vectors):
+        for term, weight in vec.items():
+            rows.append(i)
+            cols.append(vocab.setdefault(term, len(vocab)))
+            vals.append(weight)
+    return rows, cols, vals, max(len(vocab), 1)
+
+
+def _sparse_similar_pairs(
+    vectors: list[dict[str, float]], threshold: float
+) -> Optional[list[tuple[int, int, float]]]:
+    """Score every pair at once as a sparse ``X @ X.T`` on L2-normalized rows.
+
+    Returns None when numpy/scipy are not installed. Weights come from
+    ``_compute_tfidf_vector`` so scores match the pure-Python loop exactly.
+    """
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        return None
+
+    rows, cols, vals, n_terms = _term_triplets(vectors)
+    matrix = sparse.csr_matrix((vals, (rows, cols)), shape=(len(vectors), n_terms))
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    matrix = sparse.diags(1.0 / norms) @ matrix
+
+    # Keep the strict upper triangle and threshold on the stored values only
+    sims = sparse.triu(matrix @ matrix.T, k=1).tocoo()
+    keep = sims.data >= threshold
+    return list(
+        zip(sims.row[keep].tolist(), sims.col[keep].tolist(), sims.data[keep].tolist())
+    )
+
+
+# Largest matrix the dense fallback allocates (~160MB of float64): caps both
+# the documents x terms matrix and each block of the similarity product
+_DENSE_MAX_CELLS = 20_000_000
+
+
+def _dense_similar_pairs(
+    vectors: list[dict[str, float]], threshold: float
+) -> Optional[list[tuple[int, int, float]]]:
+    """Same as ``_sparse_similar_pairs`` with a dense matrix, for numpy-only
+    installs. Returns None without numpy or when the matrix would be too big.
+
+    Similarities are computed a block of rows at a time so the N x N product
+    never exists whole.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    rows, cols, vals, n_terms = _term_triplets(vectors)
+    if len(vectors) * n_terms > _DENSE_MAX_CELLS:
+        return None
+
+    matrix = np.zeros((len(vectors), n_terms))
+    matrix[rows, cols] = vals
+    norms = np.linalg.norm(matrix, axis=1)
+    norms[norms == 0] = 1.0
+    matrix /= norms[:, None]
+
+    n = len(vectors)
+    block = max(1, _DENSE_MAX_CELLS // n)
+    scored = []
+    for start in range(0, n, block):
+        # Rows start..stop against columns start..n: the upper triangle of
+        # this band sits on the band's own diagonal
+        sims = matrix[start:start + block] @ matrix[start:].T
+        ii, jj = np.nonzero(np.triu(sims >= threshold, k=1))
+        scored += [
+            (start + int(i), start + int(j), float(sims[i, j])) for i, j in zip(ii, jj)
+        ]
+    return scored
+
+
+def _vectorized_similar_pairs(
+    vectors: list[dict[str, float]], threshold: float
+) -> Optional[list[tuple[int, int, float]]]:
+    """Score all pairs with numpy (sparse, then dense); None if unavailable."""
+    scored = _sparse_similar_pairs(vectors, threshold)
+    if scored is None:
+        scored = _dense_similar_pairs(vectors, threshold)
+    return scored
+
+
+def _python_similar_pairs(
+    vectors: list[dict[str, float]] | dict[int, dict[str, float]],
+    threshold: float,
+    pairs: Iterable[tuple[int, int]],
+) -> list[tuple[int, int, float]]:
+    """Score candidate pairs one by one with ``_cosine_similarity``."""
+    indexed = vectors.items() if isinstance(vectors, dict) else enumerate(vectors)
+    norms = {i: _vector_norm(vec) for i, vec in indexed}
+    scored = []
+    for i, j in pairs:
+        similarity = _cosine_similarity(vectors[i], vectors[j], norms[i], norms[j])
+        if similarity >= threshold:
+            scored.append((i, j, similarity))
+    return scored
+
+
+def _score_chunk(
+    vectors: dict[int, dict[str, float]],
+    pairs: list[tuple[int, int]],
+    threshold: float,
+) -> list[tuple[int, int, float]]:
+    """Worker entry point: score a chunk of pairs with only the vectors it needs."""
+    return _python_similar_pairs(vectors, threshold, pairs)
+
+
+def _parallel_similar_pairs(
+    vectors: list[dict[str, float]],
+    threshold: float,
+    pairs: Iterable[tuple[int, int]],
+    workers: int,
+) -> list[tuple[int, int, float]]:
+    """Spread pure-Python pair scoring over a process pool."""
+    pairs = list(pairs)
+    size = max(1, -(-len(pairs) // workers))
+    chunks = [pairs[k : k + size] for k in range(0, len(pairs), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _score_chunk,
+                {idx: vectors[idx] for pair in chunk for idx in pair},
+                chunk,
+                threshold,
+            )
+            for chunk in chunks
+        ]
+        return [hit for future in futures for hit in future.result()]
+
+
+def _shares_domain(skill_a: Skill, skill_b: Skill) -> bool:
+    return bool(
+        set(skill_a.frontmatter.domain_tags) & set(skill_b.frontmatter.domain_tags)
+    )
+
+
+def domain_candidate_pairs(skills: list[Skill]) -> Iterator[tuple[int, int]]:
+    """Yield index pairs ``(i, j)``, ``i < j``, of skills sharing a domain tag.
+
+    Pairs are enumerated per domain through an inverted index, so skills with
+    no tag in common are never visited. A pair sharing several tags is
+    yielded only once.
+    """
+    by_domain: dict[str, list[int]] = defaultdict(list)
+    for idx, skill in enumerate(skills):
+        for domain in dict.fromkeys(skill.frontmatter.domain_tags):
+            by_domain[domain].append(idx)
+
+    seen: set[tuple[int, int]] = set()
+    for members in by_domain.values():
+        for pair in combinations(members, 2):
+            if pair in seen:
+                continue
+            seen.add(pair)
+            yield pair
 
 
 def find_duplicates(
-    skills: list[Skill], threshold: float = 0.8, group_by_domain: bool = True
+    skills: list[Skill],
+    threshold: float = 0.8,
+    group_by_domain: bool = True,
+    approximate: bool = False,
+    top_k: Optional[int] = None,
+    workers: Optional[int] = None,
 ) -> list[SimilarityResult]:
     """Find potentially duplicate skills using TF-IDF similarity.
 
@@ -97,6 +339,13 @@ def find_duplicates(
         skills: List of skills to check
         threshold: Minimum similarity score (0.0-1.0) to consider duplicates
         group_by_domain: If True, only compare skills with shared domain_tags
+        approximate: If True and pairs are scored one by one (no numpy,
+            or a corpus too large for the dense path without scipy), skip
+            pairs whose SimHash signatures or vocabulary sizes differ too
+            much. Faster on large corpora but may miss borderline pairs.
+        top_k: If set, return only the k most similar pairs
+        workers: If > 1 and numpy is unavailable, score pairs in that many
+            processes. Only worth it for corpora in the thousands.
 
     Returns:
         List of SimilarityResult for pairs exceeding threshold
@@ -105,62 +354,81 @@ def find_duplicates(
         return []
 
     # Prepare documents (combine title + content for each skill)
-    documents = []
+    keys, tfs = [], []
     for skill in skills:
         text = f"{skill.title}\n{skill.content}"
-        documents.append(_tokenize(text))
+        key = _content_key(text)
+        keys.append(key)
+        tfs.append(_cached_tf(key, text))
 
     # Compute IDF across all documents
-    idf = _compute_idf(documents)
+    idf = _cached_idf(keys, tfs)
 
     # Compute TF-IDF vectors
-    vectors = [_compute_tfidf_vector(doc, idf) for doc in documents]
-
-    # Find similar pairs
-    duplicates = []
-    n = len(skills)
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            skill_a = skills[i]
-            skill_b = skills[j]
-
-            # Check domain/type grouping
-            same_domain = bool(
-                set(skill_a.frontmatter.domain_tags)
-                & set(skill_b.frontmatter.domain_tags)
+    vectors = [_compute_tfidf_vector(tf, idf) for tf in tfs]
+
+    # Score pairs: one matmul when numpy is available, otherwise pair by pair
+    scored = _vectorized_similar_pairs(vectors, threshold)
+    if scored is None:
+        n = len(skills)
+        pairs = (
+            domain_candidate_pairs(skills)
+            if group_by_domain
+            else combinations(range(n), 2)
+        )
+        if approximate:
+            sigs = [_signature(key, tf) for key, tf in zip(keys, tfs)]
+            lens = [len(tf) for tf in tfs]
+            pairs = (
+                (i, j)
+                for i, j in pairs
+                if _may_be_similar(sigs[i], lens[i], sigs[j], lens[j])
             )
-            same_type = skill_a.frontmatter.type == skill_b.frontmatter.type
-
-            if group_by_domain and not same_domain:
-                continue
-
-            # Compute similarity
-            similarity = _cosine_similarity(vectors[i], vectors[j])
+        if workers and workers > 1:
+            scored = _parallel_similar_pairs(vectors, threshold, pairs, workers)
+        else:
+            scored = _python_similar_pairs(vectors, threshold, pairs)
 
-            if similarity >= threshold:
-                duplicates.append(
-                    SimilarityResult(
-                        skill_a=skill_a.frontmatter.skill_id,
-                        skill_b=skill_b.frontmatter.skill_id,
-                        similarity=similarity,
-                        same_domain=same_domain,
-                        same_type=same_type,
-                    )
-                )
+    duplicates = _similarity_results(skills, scored, group_by_domain)
 
     # Sort by similarity descending
-    duplicates.sort(key=lambda x: x.similarity, reverse=True)
-
-    return duplicates
+    by_similarity = attrgetter("similarity")
+    if top_k is not None:
+        return heapq.nlargest(top_k, duplicates, key=by_similarity)
+    return sorted(duplicates, key=by_similarity, reverse=True)
+
+
+def _similarity_results(
+    skills: list[Skill],
+    scored: Iterable[tuple[int, int, float]],
+    group_by_domain: bool,
+) -> Iterator[SimilarityResult]:
+    for i, j, similarity in scored:
+        skill_a = skills[i]
+        skill_b = skills[j]
+
+        # Check domain/type grouping
+        same_domain = _shares_domain(skill_a, skill_b)
+        if group_by_domain and not same_domain:
+            continue
+
+        yield SimilarityResult(
+            skill_a=skill_a.frontmatter.skill_id,
+            skill_b=skill_b.frontmatter.skill_id,
+            similarity=similarity,
+            same_domain=same_domain,
+            same_type=skill_a.frontmatter.type == skill_b.frontmatter.type,
+        )
 
 
 def get_duplicates_for_skill(
     skill: Skill, all_skills: list[Skill], threshold: float = 0.8
 ) -> list[SimilarityResult]:
     """Find duplicates for a specific skill."""
+    # Compare ids: dataclass == would compare every field, content included
+    sid = skill.frontmatter.skill_id
     results = find_duplicates(
-        [skill] + [s for s in all_skills if s != skill], threshold
+        [skill] + [s for s in all_skills if s.frontmatter.skill_id != sid], threshold
     )
     return [r for r in results if skill.frontmatter.skill_id in (r.skill_a, r.skill_b)]
 
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 from typing import Optional
 
+from prism.memory.llm import (
+    TokenBudgetTracker,
+    create_with_backoff,
+    estimate_tokens,
+    loads_json,
+    run_message_batch,
+)
 from prism.memory.schemas import EvaluationDecision, EvaluationResult
 
 _EVAL_PROMPT = """\
@@ -36,14 +44,21 @@ Respond with a single JSON object only — no markdown, no explanation:
 """
 
 
-def _build_prompt(content: str, existing_ids: list[str]) -> str:
-    existing = "\n".join(f"- {sid}" for sid in existing_ids) or "(none)"
+def _format_existing(existing_ids: list[str]) -> str:
+    """Bullet list of known skill ids for the prompt's existing-skills section."""
+    return "\n".join(f"- {sid}" for sid in existing_ids) or "(none)"
+
+
+def _build_prompt(content: str, existing_ids: list[str], existing: Optional[str] = None) -> str:
+    """Fill the evaluation prompt; pass ``existing`` to reuse a formatted id list."""
+    if existing is None:
+        existing = _format_existing(existing_ids)
     return _EVAL_PROMPT.format(content=content[:3000], existing=existing)
 
 
 def _parse_response(text: str) -> EvaluationResult:
     try:
-        data = json.loads(text.strip())
+        data = loads_json(text)
         return EvaluationResult(
             decision=data.get("decision", "NOOP"),
             skill_id=data.get("skill_id", ""),
@@ -75,3 +90,69 @@ def evaluate(content: str, existing_ids: Optional[list[str]] = None, model: str
         return _parse_response(message.content[0].text)
     except Exception as exc:
         return _fallback_result(f"Evaluator error: {exc}")
+
+
+async def _aevaluate(client, prompt: str, model: str, semaphore, tracker) -> EvaluationResult:
+    """Evaluate one prompt within the shared concurrency and token budget."""
+    try:
+        async with semaphore:
+            slot = await tracker.acquire(estimate_tokens(prompt, 512))
+            message = await create_with_backoff(
+                client,
+                model=model,
+                max_tokens=512,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            tracker.record(slot, message.usage.input_tokens + message.usage.output_tokens)
+        return _parse_response(message.content[0].text)
+    except Exception as exc:
+        return _fallback_result(f"Evaluator error: {exc}")
+
+
+async def _aevaluate_all(
+    prompts: list[str], model: str, api_key: str, max_in_flight: int
+) -> list[EvaluationResult]:
+    """Evaluate prompts concurrently in real time; results keep the prompts' order."""
+    import anthropic
+
+    semaphore = asyncio.Semaphore(max_in_flight)
+    tracker = TokenBudgetTracker()
+    async with anthropic.AsyncAnthropic(api_key=api_key, max_retries=0) as client:
+        tasks = [_aevaluate(client, p, model, semaphore, tracker) for p in prompts]
+        return list(await asyncio.gather(*tasks))
+
+
+def evaluate_batch(
+    contents: list[str],
+    existing_ids: Optional[list[str]] = None,
+    model: str = "claude-haiku-4-5-20251001",
+    use_batch: bool = True,
+    max_in_flight: int = 5,
+) -> list[EvaluationResult]:
+    """Evaluate many items at once; results are in the same order as ``contents``.
+
+    With ``use_batch`` the items go out as one Message Batch (half price, may take
+    minutes); otherwise they are sent concurrently in real time.
+    """
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        reason = "ANTHROPIC_API_KEY not set — skipping LLM evaluation"
+        return [_fallback_result(reason) for _ in contents]
+    existing = _format_existing(existing_ids or [])
+    prompts = [_build_prompt(c, [], existing) for c in contents]
+    if not use_batch:
+        return asyncio.run(_aevaluate_all(prompts, model, api_key, max_in_flight))
+    try:
+        import anthropic
+        client = anthropic.Anthropic(api_key=api_key)
+        texts = run_message_batch(client, prompts, model, max_tokens=512)
+    except Exception as exc:
+        return [_fallback_result(f"Evaluator error: {exc}") for _ in contents]
+
+    results = []
+    for idx in range(len(contents)):
+        if idx in texts:
+            results.append(_parse_response(texts[idx]))
+        else:
+            results.append(_fallback_result("Batch request failed"))
+    return results
@@ -0,0 +1,146 @@
+"""LLM Calls — shared Anthropic helpers for bulk memory jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from collections import deque
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+DEFAULT_TOKENS_PER_MINUTE = 50_000
+DEFAULT_BATCH_MAX_WAIT = 30 * 60.0
+
+
+class TokenBudgetTracker:
+    """Rolling one-minute token budget shared by concurrent LLM calls.
+
+    Skill prompts carry up to a few thousand characters each, so bulk jobs
+    hit the tokens-per-minute limit long before the requests-per-minute one.
+    Callers reserve an estimate before sending and record the real usage
+    once the response arrives.
+    """
+
+    def __init__(
+        self, tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE, window: float = 60.0
+    ):
+        self._limit = tokens_per_minute
+        self._window = window
+        self._spent: deque[list[float]] = deque()  # [timestamp, tokens]
+        self._lock = asyncio.Lock()
+
+    def _used(self, now: float) -> float:
+        while self._spent and now - self._spent[0][0] >= self._window:
+            self._spent.popleft()
+        return sum(tokens for _, tokens in self._spent)
+
+    async def acquire(self, estimated_tokens: int) -> list[float]:
+        """Wait until ``estimated_tokens`` fit in the window, then reserve them."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                used = self._used(now)
+                if not self._spent or used + estimated_tokens <= self._limit:
+                    break
+                await asyncio.sleep(self._spent[0][0] + self._window - now)
+            slot = [now, float(estimated_tokens)]
+            self._spent.append(slot)
+            return slot
+
+    @staticmethod
+    def record(slot: list[float], actual_tokens: int) -> None:
+        """Replace a reservation's estimate with the tokens actually used."""
+        slot[1] = float(actual_tokens)
+
+
+def loads_json(text: str):
+    """Parse a model's JSON reply; surrounding whitespace is allowed.
+
+    Uses orjson when installed. Its decode error subclasses
+    ``json.JSONDecodeError``, so callers catch the same exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    return len(prompt) // 4 + max_tokens
+
+
+async def create_with_backoff(client, max_attempts: int = 5, **kwargs):
+    """Call ``client.messages.create``, backing off on 429/5xx/connection errors.
+
+    Honors the ``retry-after`` header when the API sends one, otherwise
+    waits ``2**attempt`` seconds plus jitter.
+    """
+    import anthropic
+
+    retryable = (
+        anthropic.RateLimitError,
+        anthropic.InternalServerError,
+        anthropic.APIConnectionError,
+    )
+    for attempt in range(max_attempts):
+        try:
+            return await client.messages.create(**kwargs)
+        except retryable as err:
+            if attempt == max_attempts - 1:
+                raise
+            response = getattr(err, "response", None)
+            retry_after = response.headers.get("retry-after") if response else None
+            delay = float(retry_after) if retry_after else float(2**attempt)
+            await asyncio.sleep(delay + random.random())
+
+
+def run_message_batch(
+    client,
+    prompts: list[str],
+    model: str,
+    max_tokens: int,
+    poll_interval: float = 10.0,
+    max_wait: float = DEFAULT_BATCH_MAX_WAIT,
+) -> dict[int, str]:
+    """Run prompts through the Message Batches API and wait for the results.
+
+    Batches are billed at half the real-time price and don't count against
+    the per-minute limits, at the cost of latency (minutes, up to 24h). After
+    ``max_wait`` seconds the batch is canceled and whatever finished by then
+    is returned.
+
+    Returns:
+        Mapping of prompt index to response text; failed requests are omitted
+    """
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": f"req-{idx}",
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            }
+            for idx, prompt in enumerate(prompts)
+        ]
+    )
+
+    deadline = time.monotonic() + max_wait
+    while batch.processing_status != "ended":
+        if time.monotonic() >= deadline and batch.processing_status != "canceling":
+            batch = client.messages.batches.cancel(batch.id)
+            continue
+        time.sleep(poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    texts = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            idx = int(entry.custom_id.removeprefix("req-"))
+            texts[idx] = entry.result.message.content[0].text
+    return texts
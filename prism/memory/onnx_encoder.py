@@ -0,0 +1,130 @@
+"""ONNX Encoder — int8-quantized MiniLM for CPU embedding without PyTorch."""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+from pathlib import Path
+from typing import Optional
+
+log = logging.getLogger("prism.embeddings")
+
+_HF_REPO = "sentence-transformers/all-MiniLM-L6-v2"
+# Stored with each embedding; int8 vectors must not be compared with fp32 ones
+ONNX_MODEL_NAME = "all-MiniLM-L6-v2-int8-onnx"
+_INT8_NAME = "minilm-int8.onnx"
+_MAX_SEQ_LENGTH = 256
+
+
+class OnnxEncoder:
+    """Drop-in for the subset of ``SentenceTransformer.encode`` PRISM uses."""
+
+    def __init__(self, session, tokenizer):
+        self._session = session
+        self._tokenizer = tokenizer
+        self._input_names = {i.name for i in session.get_inputs()}
+
+    def encode(
+        self,
+        texts,
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        **_,
+    ):
+        import numpy as np
+
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        out = []
+        for start in range(0, len(batch), batch_size):
+            enc = self._tokenizer(
+                batch[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=_MAX_SEQ_LENGTH,
+                return_tensors="np",
+            )
+            feeds = {k: v.astype(np.int64) for k, v in enc.items() if k in self._input_names}
+            hidden = self._session.run(None, feeds)[0]
+            # Mean-pool token embeddings over the attention mask
+            mask = enc["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            out.append(pooled.astype(np.float32))
+        embs = np.concatenate(out) if out else np.empty((0, 0), dtype=np.float32)
+        if normalize_embeddings:
+            embs /= np.linalg.norm(embs, axis=1, keepdims=True) + 1e-9
+        return embs[0] if single else embs
+
+
+def _ensure_int8_model(models_dir: Path) -> Path:
+    """Download the fp32 ONNX export once and quantize it to int8."""
+    int8_path = models_dir / _INT8_NAME
+    if int8_path.exists():
+        return int8_path
+    from huggingface_hub import hf_hub_download
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    models_dir.mkdir(parents=True, exist_ok=True)
+    fp32_path = hf_hub_download(_HF_REPO, "onnx/model.onnx")
+    tmp_path = int8_path.with_suffix(".tmp")
+    quantize_dynamic(fp32_path, str(tmp_path), weight_type=QuantType.QInt8)
+    tmp_path.replace(int8_path)
+    return int8_path
+
+
+def _onnx_available() -> bool:
+    return all(
+        importlib.util.find_spec(name) is not None
+        for name in ("onnxruntime", "transformers", "huggingface_hub")
+    )
+
+
+def onnx_model_ready(models_dir: Path) -> bool:
+    """Whether ``load_onnx_encoder`` can load without preparing anything."""
+    return (models_dir / _INT8_NAME).exists() and _onnx_available()
+
+
+def prepare_onnx_model(models_dir: Path) -> Optional[Path]:
+    """Download and quantize the model ahead of time (network, tens of seconds).
+
+    Meant for warmup threads and explicit CLI steps, never the search path.
+
+    Returns:
+        Path of the int8 model, or None if onnxruntime isn't installed or
+        preparing it failed (the error is logged)
+    """
+    if not _onnx_available():
+        return None
+    try:
+        return _ensure_int8_model(models_dir)
+    except Exception:
+        log.warning("could not prepare the int8 ONNX model", exc_info=True)
+        return None
+
+
+def load_onnx_encoder(models_dir: Path) -> Optional[OnnxEncoder]:
+    """Return the int8 ONNX encoder if it was prepared, else None.
+
+    Never downloads; see ``prepare_onnx_model``.
+
+    Args:
+        models_dir: Directory caching the quantized model
+
+    Returns:
+        OnnxEncoder, or None if onnxruntime/transformers are missing, the
+        model isn't prepared yet or fails to load (callers fall back to
+        sentence-transformers)
+    """
+    int8_path = models_dir / _INT8_NAME
+    if not onnx_model_ready(models_dir):
+        return None
+    try:
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        session = ort.InferenceSession(str(int8_path), providers=["CPUExecutionProvider"])
+        tokenizer = AutoTokenizer.from_pretrained(_HF_REPO)
+    except Exception:
+        log.warning("could not load the int8 ONNX model from %s", int8_path, exc_info=True)
+        return None
+    return OnnxEncoder(session, tokenizer)
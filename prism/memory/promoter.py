@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import defaultdict
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -22,7 +24,7 @@ class PromotionCandidate:
 
 
 def analyze_usage_patterns(
-    skills: list[Skill], min_project_count: int = 3
+    skills: list[Skill], min_project_count: int = 3, top_k: Optional[int] = None
 ) -> list[PromotionCandidate]:
     """Analyze skills to find promotion candidates.
 
@@ -33,64 +35,60 @@ def analyze_usage_patterns(
     Args:
         skills: List of skills to analyze
         min_project_count: Minimum number of projects to consider for promotion
+        top_k: If set, return only the k most widely used candidates
 
     Returns:
         List of promotion candidates
     """
     candidates = []
 
-    # Group by project_origin to count project usage
+    # Read each frontmatter once: (skill_id, type, scope, reuse_count)
+    rows = []
     project_usage = defaultdict(set)  # skill_id -> set of projects
-    skill_by_id = {}
-
     for skill in skills:
-        sid = skill.frontmatter.skill_id
-        project_usage[sid].add(skill.frontmatter.project_origin)
-        skill_by_id[sid] = skill
+        fm = skill.frontmatter
+        rows.append((fm.skill_id, fm.type, fm.scope, fm.reuse_count))
+        project_usage[fm.skill_id].add(fm.project_origin)
+
+    # Count total unique projects in memory
+    total_projects = len(set().union(*project_usage.values()))
 
     # Analyze each skill
-    for skill in skills:
-        sid = skill.frontmatter.skill_id
-        projects = project_usage[sid]
-        project_count = len(projects)
+    for sid, skill_type, scope, reuse_count in rows:
+        project_count = len(project_usage[sid])
 
         # Check 1: Gotcha -> Pattern promotion
-        if skill.frontmatter.type == "gotcha" and project_count >= min_project_count:
+        if skill_type == "gotcha" and project_count >= min_project_count:
             candidates.append(
                 PromotionCandidate(
                     skill_id=sid,
                     current_type="gotcha",
                     proposed_type="pattern",
-                    usage_count=skill.frontmatter.reuse_count,
+                    usage_count=reuse_count,
                     project_count=project_count,
                     reason=f"Used across {project_count} projects — consider elevating to reusable pattern",
                 )
             )
 
         # Check 2: Project -> Global scope promotion
-        if skill.frontmatter.scope == "project":
-            # Count total unique projects in memory
-            all_projects = set()
-            for s in skills:
-                all_projects.add(s.frontmatter.project_origin)
-
-            total_projects = len(all_projects)
+        if scope == "project":
             if total_projects > 0 and project_count >= total_projects:
                 candidates.append(
                     PromotionCandidate(
                         skill_id=sid,
-                        current_type=skill.frontmatter.type,
-                        proposed_type=skill.frontmatter.type,  # Same type, just scope change
-                        usage_count=skill.frontmatter.reuse_count,
+                        current_type=skill_type,
+                        proposed_type=skill_type,  # Same type, just scope change
+                        usage_count=reuse_count,
                         project_count=project_count,
                         reason=f"Used in all {project_count} known projects — consider global scope",
                     )
                 )
 
     # Sort by project count (most universal first)
-    candidates.sort(key=lambda x: x.project_count, reverse=True)
-
-    return candidates
+    by_project_count = attrgetter("project_count")
+    if top_k is not None:
+        return heapq.nlargest(top_k, candidates, key=by_project_count)
+    return sorted(candidates, key=by_project_count, reverse=True)
 
 
 def apply_promotion(
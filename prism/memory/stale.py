@@ -33,12 +33,15 @@ def _parse_date(date_value) -> Optional[date]:
         return None
 
 
-def check_staleness(skill: Skill, default_review_after: int = 90) -> StalenessResult:
+def check_staleness(
+    skill: Skill, default_review_after: int = 90, today: Optional[date] = None
+) -> StalenessResult:
     """Check if a skill has become stale (not used recently).
 
     Args:
         skill: The skill to check
         default_review_after: Default days before marking stale if not specified
+        today: Reference date (defaults to date.today())
 
     Returns:
         StalenessResult with staleness details
@@ -47,7 +50,7 @@ def check_staleness(skill: Skill, default_review_after: int = 90) -> StalenessRe
     last_used = _parse_date(skill.frontmatter.last_used)
     review_after = skill.frontmatter.review_after or default_review_after
 
-    today = date.today()
+    today = today or date.today()
 
     if last_used is None:
         # Never used - check creation date
@@ -93,11 +96,12 @@ def find_stale_skills(
         List of stale skills (only those that are actually stale)
     """
     results = []
+    today = date.today()
     for skill in skills:
         if skill.frontmatter.status == "deprecated":
             continue  # Skip already deprecated skills
 
-        result = check_staleness(skill, default_review_after)
+        result = check_staleness(skill, default_review_after, today)
         if result.is_stale:
             results.append(result)
 
@@ -1,20 +1,41 @@
 from __future__ import annotations
 
+import dataclasses
 import hashlib
-import io
-import pickle
+import queue
 import re
 import sqlite3
-from datetime import date, datetime
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
-import frontmatter as fm
+import yaml
 
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # optional speedup
+    _blake3 = None
+
+try:
+    import numpy as np
+except ImportError:  # embeddings extra not installed
+    np = None
+
+from prism.memory.onnx_encoder import (
+    ONNX_MODEL_NAME,
+    OnnxEncoder,
+    load_onnx_encoder,
+    onnx_model_ready,
+    prepare_onnx_model,
+)
 from prism.memory.schemas import Skill, SkillFrontmatter, SearchResult
 
 DB_DEFAULT = Path.home() / ".prism" / "memory" / "index.db"
 _MODEL_NAME = "all-MiniLM-L6-v2"
+_MODELS_DIR = DB_DEFAULT.parent / "models"
 
 _DDL = """
 CREATE VIRTUAL TABLE IF NOT EXISTS skills_fts USING fts5(
@@ -37,6 +58,7 @@ CREATE TABLE IF NOT EXISTS skills_meta (
     review_after INTEGER,
     verified_by  TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_meta_status ON skills_meta(status);
 """
 
 _META_INSERT = """
@@ -45,21 +67,214 @@ INSERT OR REPLACE INTO skills_meta
 VALUES (?,?,?,?,?,?,?,?)
 """
 
+# Rank inside the CTE so the planner keeps the FTS5 index path even with
+# metadata predicates, then join metadata for the winning rows only
+_FTS_SEARCH = """
+WITH hits AS (
+    SELECT skill_id, bm25(skills_fts) AS score FROM skills_fts
+    WHERE skills_fts MATCH ? ORDER BY score LIMIT ?
+)
+SELECT h.skill_id, m.file_path, h.score, m.reuse_count
+FROM hits h JOIN skills_meta m ON m.skill_id = h.skill_id
+WHERE m.file_path IS NOT NULL{status_filter}
+ORDER BY h.score
+LIMIT ?
+"""
+
+# Over-fetch FTS hits when filtering so enough survive the predicate
+_FILTER_OVERFETCH = 3
+
+_EMB_INSERT = """
+INSERT OR REPLACE INTO skill_embeddings
+(skill_id, embedding, model, content_hash, generated_at)
+VALUES (?,?,?,?,?)
+"""
+
+_ENCODE_BATCH_SIZE = 32
+
+# Stay under SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds (999)
+_MAX_SQL_VARS = 900
+
+_SANITIZE_RE = re.compile(r"[^\w\s]")
+
+_FM_BOUNDARY = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_DEFAULT_READERS = 4
+# Room for the fixed queries plus the IN (...) variants of every batch size
+_STATEMENT_CACHE_SIZE = 512
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+_FTS_COLUMNS = "skill_id, title, content, domain_tags, type, status, stack_context"
+
+# FTS5 honours OR REPLACE on an explicit rowid, so one statement replaces a
+# skill's row without scanning the table for its skill_id
+_FTS_UPSERT = f"""
+INSERT OR REPLACE INTO skills_fts(rowid, {_FTS_COLUMNS}) VALUES (?,?,?,?,?,?,?,?)
+"""
+
 _MODEL_CACHE: dict = {}
+_MODEL_LOCK = threading.Lock()
+
+# path -> ((mtime_ns, size), Skill), least recently used first
+_SKILL_CACHE: OrderedDict[str, tuple[tuple[int, int], Skill]] = OrderedDict()
+_SKILL_CACHE_SIZE = 1024
+_SKILL_CACHE_LOCK = threading.Lock()
 
 
 def _load_model():
+    """Prefer the int8 ONNX encoder; fall back to sentence-transformers."""
+    # The lock makes a caller wait for an in-flight warmup instead of
+    # loading a second copy
+    with _MODEL_LOCK:
+        if _MODEL_NAME in _MODEL_CACHE:
+            return _MODEL_CACHE[_MODEL_NAME]
+        model = load_onnx_encoder(_MODELS_DIR)
+        if model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                return None
+            model = SentenceTransformer(_MODEL_NAME)
+        _MODEL_CACHE[_MODEL_NAME] = model
+        return model
+
+
+def _model_name(model) -> str:
+    """Name stored with the embeddings ``model`` produces."""
+    return ONNX_MODEL_NAME if isinstance(model, OnnxEncoder) else _MODEL_NAME
+
+
+def _expected_model_name() -> str:
+    """Name of the model ``_load_model`` returns, without loading it."""
+    model = _MODEL_CACHE.get(_MODEL_NAME)
+    if model is not None:
+        return _model_name(model)
+    return ONNX_MODEL_NAME if onnx_model_ready(_MODELS_DIR) else _MODEL_NAME
+
+
+def _warm_model() -> None:
+    """Load the model and run one encode so the first real query is fast."""
+    # Outside the lock: a search arriving meanwhile falls back to
+    # sentence-transformers instead of waiting on the download
+    prepare_onnx_model(_MODELS_DIR)
     try:
-        from sentence_transformers import SentenceTransformer
-        if _MODEL_NAME not in _MODEL_CACHE:
-            _MODEL_CACHE[_MODEL_NAME] = SentenceTransformer(_MODEL_NAME)
-        return _MODEL_CACHE[_MODEL_NAME]
-    except ImportError:
-        return None
+        model = _load_model()
+        if model is not None:
+            model.encode("warmup")
+    except Exception:
+        pass  # the real call reports the error
+
+
+def _load_vec(conn: sqlite3.Connection) -> bool:
+    """Load the sqlite-vec extension into ``conn`` if it is installed."""
+    try:
+        import sqlite_vec
+        conn.enable_load_extension(True)
+        sqlite_vec.load(conn)
+        conn.enable_load_extension(False)
+        return True
+    except (ImportError, AttributeError, sqlite3.OperationalError):
+        return False
+
+
+def _embedding_to_blob(emb) -> bytes:
+    return np.ascontiguousarray(emb, dtype=np.float32).tobytes()
+
+
+def _blob_to_embedding(blob: bytes):
+    return np.frombuffer(blob, dtype=np.float32)
+
+
+def _fts_rowid(skill_id: str) -> int:
+    """Stable FTS rowid for a skill, so rows can be replaced by primary key."""
+    digest = hashlib.blake2b(skill_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _migrate_embeddings(conn: sqlite3.Connection) -> bool:
+    """Rewrite pickled embedding blobs from older indexes as raw float32.
+
+    Unreadable (corrupt) blobs are dropped; embeddings are recomputed on
+    demand. Returns False, leaving the step pending, while numpy is missing.
+    """
+    import pickle  # only ever needed for this one-time conversion
+
+    rows = conn.execute(
+        "SELECT skill_id, embedding FROM skill_embeddings WHERE embedding IS NOT NULL"
+    ).fetchall()
+    updates, unreadable = [], []
+    for row in rows:
+        try:
+            emb = pickle.loads(row["embedding"])
+        except ImportError:
+            return False  # numpy missing; migrate once the embeddings extra is installed
+        except Exception:
+            unreadable.append((row["skill_id"],))
+            continue
+        updates.append((_embedding_to_blob(emb), row["skill_id"]))
+    conn.executemany("UPDATE skill_embeddings SET embedding = ? WHERE skill_id = ?", updates)
+    conn.executemany("DELETE FROM skill_embeddings WHERE skill_id = ?", unreadable)
+    return True
+
+
+def _migrate_fts_rowids(conn: sqlite3.Connection) -> bool:
+    """Re-key FTS rows from auto-assigned rowids to ``_fts_rowid``.
+
+    Idempotent: only rows not already on their stable rowid are touched. If
+    a skill has both, the keyed row is the newer write and wins.
+    """
+    rows = conn.execute(f"SELECT rowid, {_FTS_COLUMNS} FROM skills_fts").fetchall()
+    keyed = {row[1] for row in rows if row[0] == _fts_rowid(row[1])}
+    stale = [row for row in rows if row[0] != _fts_rowid(row[1])]
+    if stale:
+        conn.executemany("DELETE FROM skills_fts WHERE rowid = ?", [(row[0],) for row in stale])
+        conn.executemany(
+            _FTS_UPSERT,
+            [(_fts_rowid(row[1]), *row[1:]) for row in stale if row[1] not in keyed],
+        )
+    return True
+
+
+# Each step upgrades user_version by one
+_MIGRATIONS = (_migrate_embeddings, _migrate_fts_rowids)
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    blocked = False
+    for target, step in enumerate(_MIGRATIONS[version:], start=version + 1):
+        # A step that can't finish yet must not hold back the ones after it
+        # (they are idempotent and rerun until the version catches up)
+        blocked |= not step(conn)
+        if not blocked:
+            conn.execute(f"PRAGMA user_version = {target}")
 
 
 def _content_hash(text: str) -> str:
-    return hashlib.md5(text.encode()).hexdigest()
+    """Hash skill text, tagged with the algorithm so mixed-era rows compare."""
+    data = text.encode("utf-8", "ignore")
+    if _blake3 is not None:
+        return "b3:" + _blake3(data).hexdigest()
+    return "b2:" + hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _hash_matches(stored: str, text: str) -> bool:
+    data = text.encode("utf-8", "ignore")
+    algo, _, digest = stored.partition(":")
+    if algo == "b3":
+        return _blake3 is not None and digest == _blake3(data).hexdigest()
+    if algo == "b2":
+        return digest == hashlib.blake2b(data, digest_size=16).hexdigest()
+    # Untagged hashes are MD5 from older indexes
+    return stored == hashlib.md5(text.encode()).hexdigest()
 
 
 def _extract_title(content: str) -> str:
@@ -70,165 +285,396 @@ def _extract_title(content: str) -> str:
 
 
 def _sanitize_query(query: str) -> str:
-    return re.sub(r"[^\w\s]", " ", query).strip()
+    return _SANITIZE_RE.sub(" ", query).strip()
+
+
+def _split_frontmatter(text: str) -> tuple[dict, str]:
+    """Split ``---`` YAML frontmatter from the body, like python-frontmatter.
+
+    Parsing here lets us use libyaml's C loader; the post object that
+    ``frontmatter.load`` builds is never needed.
+    """
+    text = text.strip()
+    if not _FM_BOUNDARY.match(text):
+        return {}, text
+    try:
+        _, raw, content = _FM_BOUNDARY.split(text, 2)
+    except ValueError:
+        return {}, text
+    metadata = yaml.load(raw, Loader=_YAML_LOADER)
+    return (metadata if isinstance(metadata, dict) else {}), content.strip()
+
+
+def _format_frontmatter(metadata: dict, content: str) -> str:
+    """Inverse of ``_split_frontmatter``; byte-identical to ``frontmatter.dumps``."""
+    header = yaml.dump(
+        metadata, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True
+    ).strip()
+    return f"---\n{header}\n---\n\n{content}\n".strip()
+
+
+def _copy_skill(skill: Skill) -> Skill:
+    # Callers mutate frontmatter (reuse counts, status), so never hand out
+    # the cached instance itself
+    return dataclasses.replace(skill, frontmatter=skill.frontmatter.model_copy(deep=True))
 
 
 def load_skill_from_file(path: Path) -> Optional[Skill]:
-    if not path.exists():
+    """Parse a skill file, reusing the previous parse while the file is unchanged."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return None
-    post = fm.load(str(path))
+    key = str(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _SKILL_CACHE_LOCK:
+        hit = _SKILL_CACHE.get(key)
+        if hit and hit[0] == stamp:
+            _SKILL_CACHE.move_to_end(key)
+            return _copy_skill(hit[1])
+    # One read and one decode; skip the text layer's incremental decoder
+    text = path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    metadata, content = _split_frontmatter(text)
     try:
-        meta = SkillFrontmatter.model_validate(post.metadata)
+        meta = SkillFrontmatter.model_validate(metadata)
     except Exception:
         return None
-    return Skill(
+    skill = Skill(
         frontmatter=meta,
-        title=_extract_title(post.content),
-        content=post.content,
+        title=_extract_title(content),
+        content=content,
         file_path=path,
     )
+    with _SKILL_CACHE_LOCK:
+        _SKILL_CACHE[key] = (stamp, skill)
+        _SKILL_CACHE.move_to_end(key)
+        if len(_SKILL_CACHE) > _SKILL_CACHE_SIZE:
+            _SKILL_CACHE.popitem(last=False)
+    return _copy_skill(skill)
 
 
 def save_skill_to_file(skill: Skill, memory_dir: Path) -> Path:
     subdir = memory_dir / skill.frontmatter.subdir()
     subdir.mkdir(parents=True, exist_ok=True)
     path = subdir / f"{skill.frontmatter.skill_id}.md"
-    post = fm.Post(skill.content, **skill.frontmatter.model_dump(mode="json"))
     with open(path, "w") as f:
-        f.write(fm.dumps(post))
+        f.write(_format_frontmatter(skill.frontmatter.model_dump(mode="json"), skill.content))
+    # mtime granularity can hide a rewrite, so drop the cached parse
+    with _SKILL_CACHE_LOCK:
+        _SKILL_CACHE.pop(str(path), None)
     return path
 
 
 class SkillStore:
-    def __init__(self, db_path: Path = DB_DEFAULT, embeddings_enabled: bool = False):
+    """Skill index backed by SQLite in WAL mode.
+
+    Writes go through a single writer connection guarded by a lock; reads
+    borrow from a small pool of reader connections, so pipeline roles that
+    share the index don't queue behind each other.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DB_DEFAULT,
+        embeddings_enabled: bool = False,
+        readers: int = _DEFAULT_READERS,
+    ):
         self._db_path = db_path
         self._embeddings_enabled = embeddings_enabled
-        self._conn: Optional[sqlite3.Connection] = None
+        self._max_readers = readers
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        self._opened: list[sqlite3.Connection] = []
+        self._vec = False
+
+    @property
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        return self._writer
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_path, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        self._vec = _load_vec(conn)
+        return conn
 
     def __enter__(self) -> SkillStore:
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(self._db_path)
-        self._conn.row_factory = sqlite3.Row
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
         for stmt in _DDL.strip().split(";"):
             if stmt.strip():
-                self._conn.execute(stmt)
-        self._conn.commit()
+                self._writer.execute(stmt)
+        _migrate(self._writer)
+        self._writer.commit()
+        if self._embeddings_enabled and _MODEL_NAME not in _MODEL_CACHE:
+            # Daemon thread: short commands that never embed don't wait on it
+            threading.Thread(target=_warm_model, name="prism-model-warmup", daemon=True).start()
         return self
 
     def __exit__(self, *_) -> None:
-        if self._conn:
-            self._conn.close()
+        for conn in self._opened:
+            conn.close()
+        self._opened.clear()
+        self._readers = queue.Queue()
+        if self._writer:
+            self._writer.close()
+
+    @contextmanager
+    def _borrow_reader(self) -> Iterator[sqlite3.Connection]:
+        """Check a reader connection out of the pool, opening one if allowed."""
+        with self._pool_lock:
+            grow = self._readers.empty() and len(self._opened) < self._max_readers
+            if grow:
+                self._opened.append(self._connect())
+                self._readers.put(self._opened[-1])
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def _store_embeddings(self, rows: list[tuple[str, str, object]], model_name: str) -> None:
+        with self._write_lock:
+            _embedding_upsert_raw(self._writer, rows, model_name)
+            self._writer.commit()
 
     def upsert(self, skill: Skill) -> None:
-        _fts_upsert(self._conn, skill)
-        _meta_upsert(self._conn, skill)
-        if self._embeddings_enabled:
-            _embedding_upsert(self._conn, skill)
-        self._conn.commit()
+        self.upsert_many([skill])
+
+    def upsert_many(self, skills: Iterable[Skill]) -> None:
+        """Index several skills in one transaction (one commit, one fsync)."""
+        # Last write wins for repeated skill_ids, as with sequential upserts
+        batch = list({s.frontmatter.skill_id: s for s in skills}.values())
+        if not batch:
+            return
+        with self._write_lock, self._writer:
+            _fts_upsert(self._writer, batch)
+            self._writer.executemany(_META_INSERT, [_meta_row(s) for s in batch])
+            if self._embeddings_enabled:
+                _embedding_upsert(self._writer, batch)
 
     def delete(self, skill_id: str) -> None:
-        for table in ("skills_fts", "skills_meta", "skill_embeddings"):
-            self._conn.execute(f"DELETE FROM {table} WHERE skill_id = ?", (skill_id,))
-        self._conn.commit()
+        with self._write_lock:
+            self._writer.execute(
+                "DELETE FROM skills_fts WHERE rowid = ?", (_fts_rowid(skill_id),)
+            )
+            for table in ("skills_meta", "skill_embeddings"):
+                self._writer.execute(f"DELETE FROM {table} WHERE skill_id = ?", (skill_id,))
+            self._writer.commit()
 
     def get(self, skill_id: str) -> Optional[Skill]:
-        row = self._conn.execute(
-            "SELECT file_path FROM skills_meta WHERE skill_id = ?", (skill_id,)
-        ).fetchone()
+        with self._borrow_reader() as conn:
+            row = conn.execute(
+                "SELECT file_path FROM skills_meta WHERE skill_id = ?", (skill_id,)
+            ).fetchone()
         if not row or not row["file_path"]:
             return None
         return load_skill_from_file(Path(row["file_path"]))
 
     def list_all(self, status: str = "active") -> list[Skill]:
-        rows = self._conn.execute(
-            "SELECT skill_id FROM skills_meta WHERE status = ?", (status,)
-        ).fetchall()
-        return [s for sid in rows if (s := self.get(sid["skill_id"]))]
-
-    def search(self, query: str, top_k: int = 10) -> list[SearchResult]:
-        hits = _fts_search(self._conn, query, limit=50)
-        if not hits:
-            return []
-        if self._embeddings_enabled:
-            return _hybrid_rerank(self._conn, hits, query, top_k)
-        return [SearchResult(skill=s, score=sc, fts_score=sc) for s, sc in hits[:top_k] if s]
+        with self._borrow_reader() as conn:
+            rows = conn.execute(
+                "SELECT file_path FROM skills_meta WHERE status = ? AND file_path IS NOT NULL",
+                (status,),
+            ).fetchall()
+        return [s for row in rows if (s := load_skill_from_file(Path(row["file_path"])))]
+
+    def search(
+        self, query: str, top_k: int = 10, status: Optional[str] = None
+    ) -> list[SearchResult]:
+        with self._borrow_reader() as conn:
+            hits = _fts_search(conn, query, limit=50, status=status)
+            if not hits:
+                return []
+            if self._embeddings_enabled:
+                return _hybrid_rerank(
+                    conn, hits, query, top_k, self._store_embeddings, vec=self._vec
+                )
+        return _load_results(((fp, sc, sc, 0.0) for _, fp, sc, _ in hits), top_k)
+
+    def search_batch(
+        self, queries: list[str], top_k: int = 10, status: Optional[str] = None
+    ) -> list[list[SearchResult]]:
+        """Run ``search`` for several queries, encoding them in one forward pass.
+
+        Returns one result list per query, in order.
+        """
+        with self._borrow_reader() as conn:
+            hits = [_fts_search(conn, query, limit=50, status=status) for query in queries]
+            model = _load_model() if self._embeddings_enabled and any(hits) else None
+            if model is None:
+                return [
+                    _load_results(((fp, sc, sc, 0.0) for _, fp, sc, _ in h), top_k)
+                    for h in hits
+                ]
+            pending = [idx for idx, h in enumerate(hits) if h]
+            embs = model.encode(
+                [queries[idx] for idx in pending],
+                batch_size=_ENCODE_BATCH_SIZE,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+            query_embs = dict(zip(pending, embs))
+            # Candidate embeddings persisted for one query are cached for the next
+            return [
+                _hybrid_rerank(
+                    conn, h, queries[idx], top_k, self._store_embeddings,
+                    vec=self._vec, query_emb=query_embs[idx],
+                )
+                if h else []
+                for idx, h in enumerate(hits)
+            ]
 
     def clear(self) -> None:
-        for table in ("skills_fts", "skills_meta", "skill_embeddings"):
-            self._conn.execute(f"DELETE FROM {table}")
-        self._conn.commit()
+        with self._write_lock:
+            for table in ("skills_fts", "skills_meta", "skill_embeddings"):
+                self._writer.execute(f"DELETE FROM {table}")
+            self._writer.commit()
 
     def count(self) -> int:
-        return self._conn.execute("SELECT COUNT(*) FROM skills_meta").fetchone()[0]
-
-
-def _fts_upsert(conn: sqlite3.Connection, skill: Skill) -> None:
-    fm_data = skill.frontmatter
-    conn.execute("DELETE FROM skills_fts WHERE skill_id = ?", (fm_data.skill_id,))
-    conn.execute(
-        "INSERT INTO skills_fts(skill_id,title,content,domain_tags,type,status,stack_context) VALUES(?,?,?,?,?,?,?)",
-        (fm_data.skill_id, skill.title, skill.content,
-         " ".join(fm_data.domain_tags), fm_data.type, fm_data.status,
-         " ".join(fm_data.stack_context)),
+        with self._borrow_reader() as conn:
+            return conn.execute("SELECT COUNT(*) FROM skills_meta").fetchone()[0]
+
+
+def _fts_upsert(conn: sqlite3.Connection, skills: list[Skill]) -> None:
+    conn.executemany(
+        _FTS_UPSERT,
+        [
+            (_fts_rowid(s.frontmatter.skill_id), s.frontmatter.skill_id, s.title, s.content,
+             " ".join(s.frontmatter.domain_tags), s.frontmatter.type, s.frontmatter.status,
+             " ".join(s.frontmatter.stack_context))
+            for s in skills
+        ],
     )
 
 
-def _meta_upsert(conn: sqlite3.Connection, skill: Skill) -> None:
+def _meta_row(skill: Skill) -> tuple:
     fm_data = skill.frontmatter
-    values = (
+    return (
         fm_data.skill_id, str(skill.file_path) if skill.file_path else None,
         str(fm_data.created), str(fm_data.last_used) if fm_data.last_used else None,
         fm_data.reuse_count, fm_data.status, fm_data.review_after, fm_data.verified_by,
     )
-    conn.execute(_META_INSERT, values)
 
 
-def _embedding_upsert(conn: sqlite3.Connection, skill: Skill) -> None:
+def _stored_hashes(
+    conn: sqlite3.Connection, skill_ids: list[str], model_name: str
+) -> dict[str, str]:
+    """Fetch content hashes of embeddings made by ``model_name``, a few hundred ids per query."""
+    have: dict[str, str] = {}
+    for start in range(0, len(skill_ids), _MAX_SQL_VARS):
+        chunk = skill_ids[start:start + _MAX_SQL_VARS]
+        placeholders = ",".join("?" * len(chunk))
+        have.update(conn.execute(
+            f"SELECT skill_id, content_hash FROM skill_embeddings WHERE skill_id IN ({placeholders}) "
+            "AND model = ?",
+            [*chunk, model_name],
+        ).fetchall())
+    return have
+
+
+def _embedding_upsert(conn: sqlite3.Connection, skills: list[Skill]) -> None:
+    """Embed the skills whose text (or embedding model) changed since their stored embedding."""
+    texts = {s.frontmatter.skill_id: f"{s.title} {s.content}" for s in skills}
+
+    def changed_since(model_name: str) -> list[tuple[str, str]]:
+        have = _stored_hashes(conn, list(texts), model_name)
+        return [
+            (sid, text) for sid, text in texts.items()
+            if sid not in have or not _hash_matches(have[sid], text)
+        ]
+
+    expected = _expected_model_name()
+    changed = changed_since(expected)
+    # A no-op reindex never needs the model loaded
+    if not changed:
+        return
     model = _load_model()
     if model is None:
         return
-    text = f"{skill.title} {skill.content}"
-    chash = _content_hash(text)
-    existing = conn.execute(
-        "SELECT content_hash FROM skill_embeddings WHERE skill_id = ?",
-        (skill.frontmatter.skill_id,),
-    ).fetchone()
-    if existing and existing["content_hash"] == chash:
-        return
-    emb = model.encode(text)
-    blob = pickle.dumps(emb)
-    conn.execute(
-        "INSERT OR REPLACE INTO skill_embeddings(skill_id,embedding,model,content_hash,generated_at) VALUES(?,?,?,?,?)",
-        (skill.frontmatter.skill_id, blob, _MODEL_NAME, chash, datetime.utcnow().isoformat()),
+    model_name = _model_name(model)
+    if model_name != expected:
+        changed = changed_since(model_name)
+    changed.sort(key=lambda c: len(c[1]))
+    embs = model.encode(
+        [text for _, text in changed],
+        batch_size=_ENCODE_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
     )
+    _embedding_upsert_raw(
+        conn, [(sid, text, emb) for (sid, text), emb in zip(changed, embs)], model_name
+    )
+
 
+def _embedding_upsert_raw(
+    conn: sqlite3.Connection, rows: list[tuple[str, str, object]], model_name: str
+) -> None:
+    """Store embeddings computed elsewhere, given as (skill_id, text, embedding)."""
+    now = datetime.utcnow().isoformat()
+    conn.executemany(
+        _EMB_INSERT,
+        [(sid, _embedding_to_blob(emb), model_name, _content_hash(text), now) for sid, text, emb in rows],
+    )
 
-def _fts_search(conn: sqlite3.Connection, query: str, limit: int = 50) -> list[tuple[Skill, float]]:
+
+def _fts_search(
+    conn: sqlite3.Connection,
+    query: str,
+    limit: int = 50,
+    status: Optional[str] = None,
+) -> list[tuple[str, str, float, int]]:
+    """Return (skill_id, file_path, fts_score, reuse_count) for the best FTS hits.
+
+    Skill files are not read here; callers load only the hits they keep.
+    ``status`` restricts hits to skills with that metadata status.
+    """
     safe_query = _sanitize_query(query)
     if not safe_query:
         return []
+    if status is None:
+        sql, params = _FTS_SEARCH.format(status_filter=""), (safe_query, limit, limit)
+    else:
+        sql = _FTS_SEARCH.format(status_filter=" AND m.status = ?")
+        params = (safe_query, limit * _FILTER_OVERFETCH, status, limit)
     try:
-        rows = conn.execute(
-            "SELECT skill_id, bm25(skills_fts) as score FROM skills_fts WHERE skills_fts MATCH ? ORDER BY score LIMIT ?",
-            (safe_query, limit),
-        ).fetchall()
+        rows = conn.execute(sql, params).fetchall()
     except sqlite3.OperationalError:
         return []
-    results = []
-    for row in rows:
-        skill = _load_by_id(conn, row["skill_id"])
-        if skill:
-            results.append((skill, abs(row["score"])))
-    return results
+    return [
+        (row["skill_id"], row["file_path"], abs(row["score"]), row["reuse_count"] or 0)
+        for row in rows
+    ]
 
 
-def _load_by_id(conn: sqlite3.Connection, skill_id: str) -> Optional[Skill]:
-    row = conn.execute(
-        "SELECT file_path FROM skills_meta WHERE skill_id = ?", (skill_id,)
-    ).fetchone()
-    if not row or not row["file_path"]:
-        return None
-    return load_skill_from_file(Path(row["file_path"]))
+def _load_results(
+    ranked: Iterable[tuple[str, float, float, float]],
+    top_k: int,
+    loaded: Optional[dict[str, Skill]] = None,
+) -> list[SearchResult]:
+    """Load skill files for ranked (file_path, score, fts, semantic) rows.
+
+    Stops once ``top_k`` skills have loaded; unreadable files are skipped.
+    """
+    loaded = loaded or {}
+    results: list[SearchResult] = []
+    for fp, score, fts_sc, sem in ranked:
+        if len(results) >= top_k:
+            break
+        skill = loaded.get(fp) or load_skill_from_file(Path(fp))
+        if skill:
+            results.append(SearchResult(skill=skill, score=score, fts_score=fts_sc, semantic_score=sem))
+    return results
 
 
 def _get_cached_embedding(conn: sqlite3.Connection, skill_id: str):
@@ -236,35 +682,122 @@ def _get_cached_embedding(conn: sqlite3.Connection, skill_id: str):
         "SELECT embedding FROM skill_embeddings WHERE skill_id = ?", (skill_id,)
     ).fetchone()
     if row and row["embedding"]:
-        return pickle.loads(row["embedding"])
+        return _blob_to_embedding(row["embedding"])
     return None
 
 
-def _cosine_sim(a, b) -> float:
-    import numpy as np
-    denom = float(np.linalg.norm(a) * np.linalg.norm(b))
-    return float(np.dot(a, b) / denom) if denom > 1e-9 else 0.0
+def _cached_embeddings(conn: sqlite3.Connection, skill_ids: list[str], model_name: str) -> dict:
+    placeholders = ",".join("?" * len(skill_ids))
+    rows = conn.execute(
+        f"SELECT skill_id, embedding FROM skill_embeddings WHERE skill_id IN ({placeholders}) "
+        "AND embedding IS NOT NULL AND model = ?",
+        [*skill_ids, model_name],
+    ).fetchall()
+    return {row["skill_id"]: _blob_to_embedding(row["embedding"]) for row in rows}
+
+
+def _vec_similarities(
+    conn: sqlite3.Connection, skill_ids: list[str], query_emb, model_name: str
+) -> Optional[dict[str, float]]:
+    """Cosine similarity of stored embeddings to the query, computed by sqlite-vec.
+
+    Only embeddings made by ``model_name`` are scored. Returns None when SQLite can't score them (e.g. a blob of another width),
+    so the caller falls back to NumPy.
+    """
+    placeholders = ",".join("?" * len(skill_ids))
+    try:
+        rows = conn.execute(
+            f"SELECT skill_id, 1 - vec_distance_cosine(embedding, ?) FROM skill_embeddings "
+            f"WHERE skill_id IN ({placeholders}) AND embedding IS NOT NULL AND model = ?",
+            [_embedding_to_blob(query_emb), *skill_ids, model_name],
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    return {row[0]: float(row[1]) for row in rows}
 
 
 def _hybrid_rerank(
     conn: sqlite3.Connection,
-    candidates: list[tuple[Skill, float]],
+    candidates: list[tuple[str, str, float, int]],
     query: str,
     top_k: int,
+    persist: Optional[Callable[[list[tuple[str, str, object]], str], None]] = None,
+    vec: bool = False,
+    query_emb=None,
 ) -> list[SearchResult]:
+    """Blend BM25, embedding similarity and reuse into one score.
+
+    With ``vec`` (sqlite-vec loaded on ``conn``) stored embeddings are scored
+    inside SQLite; otherwise they are fetched and scored with NumPy.
+    Embeddings computed for uncached candidates are handed to ``persist``
+    (defaults to writing them through ``conn``) with the model's name;
+    embeddings stored by another model count as uncached. ``query_emb``
+    skips encoding the query when the caller already batched it.
+    """
     model = _load_model()
     if model is None:
-        return [SearchResult(skill=s, score=sc, fts_score=sc) for s, sc in candidates[:top_k]]
-    import numpy as np
-    query_emb = model.encode(query)
-    fts_max = max(sc for _, sc in candidates) or 1.0
-    scored: list[SearchResult] = []
-    for skill, fts_sc in candidates:
-        cached = _get_cached_embedding(conn, skill.frontmatter.skill_id)
-        emb = cached if cached is not None else model.encode(f"{skill.title} {skill.content}")
-        sem = _cosine_sim(query_emb, emb)
-        reuse = min(skill.frontmatter.reuse_count / 10.0, 1.0)
+        return _load_results(((fp, sc, sc, 0.0) for _, fp, sc, _ in candidates), top_k)
+    if query_emb is None:
+        query_emb = model.encode(query, normalize_embeddings=True)
+    model_name = _model_name(model)
+    skill_ids = [sid for sid, _, _, _ in candidates]
+    sems: dict[int, float] = {}
+    cached: dict = {}
+    stored = _vec_similarities(conn, skill_ids, query_emb, model_name) if vec else None
+    if stored is not None:
+        sems = {idx: stored[sid] for idx, sid in enumerate(skill_ids) if sid in stored}
+    else:
+        cached = _cached_embeddings(conn, skill_ids, model_name)
+    embs = {}
+    loaded: dict[str, Skill] = {}
+    missing: list[tuple[int, str]] = []
+    for idx, (skill_id, fp, _, _) in enumerate(candidates):
+        if idx in sems:
+            continue
+        if skill_id in cached:
+            embs[idx] = cached[skill_id]
+            continue
+        # Only candidates without a stored embedding need their file read
+        skill = load_skill_from_file(Path(fp))
+        if skill:
+            loaded[fp] = skill
+            missing.append((idx, f"{skill.title} {skill.content}"))
+    if missing:
+        # One batched forward pass for every uncached candidate; sorting by
+        # length keeps similarly sized texts in the same padded batch
+        missing.sort(key=lambda m: len(m[1]))
+        new_embs = model.encode(
+            [text for _, text in missing],
+            batch_size=_ENCODE_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        for (idx, _), emb in zip(missing, new_embs):
+            embs[idx] = emb
+        rows = [(candidates[idx][0], text, embs[idx]) for idx, text in missing]
+        if persist is not None:
+            persist(rows, model_name)
+        else:
+            _embedding_upsert_raw(conn, rows, model_name)
+            conn.commit()
+    if embs:
+        # Cosine similarity for the rest in one matrix-vector product;
+        # cached rows may predate normalization, so normalize them here
+        order = sorted(embs)
+        mat = np.stack([embs[idx] for idx in order]).astype(np.float32, copy=False)
+        mat /= np.linalg.norm(mat, axis=1, keepdims=True) + 1e-9
+        query_emb = query_emb / (np.linalg.norm(query_emb) + 1e-9)
+        sems.update(zip(order, (mat @ query_emb).tolist()))
+    if not sems:
+        return []
+    fts_max = max(sc for _, _, sc, _ in candidates) or 1.0
+    ranked = []
+    for idx in sorted(sems):
+        sem = sems[idx]
+        _, fp, fts_sc, reuse_count = candidates[idx]
+        reuse = min(reuse_count / 10.0, 1.0)
         score = (fts_sc / fts_max) * 0.4 + sem * 0.4 + reuse * 0.2
-        scored.append(SearchResult(skill=skill, score=score, fts_score=fts_sc, semantic_score=sem))
-    scored.sort(key=lambda r: r.score, reverse=True)
-    return scored[:top_k]
+        ranked.append((fp, score, fts_sc, sem))
+    ranked.sort(key=lambda r: r[1], reverse=True)
+    return _load_results(ranked, top_k, loaded)
@@ -0,0 +1,139 @@
+"""Async PR Manager - Concurrent GitHub API calls for bulk QA work.
+
+Reviewing or polling many PRs with ``PRManager`` costs one round trip per
+PR in sequence; ``AsyncPRManager`` issues them concurrently over one pooled
+connection set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Optional
+
+import httpx
+
+from prism.pipeline.pr_manager import _APPROVAL_BODY, _CHANGES_BODY
+
+
+class AsyncPRManager:
+    """Async counterpart of ``PRManager``'s review and status calls.
+
+    Use as an async context manager::
+
+        async with AsyncPRManager() as prs:
+            statuses = await prs.bulk_get_status([12, 13, 14])
+    """
+
+    def __init__(self, max_connections: int = 20):
+        self.token = os.environ.get("GITHUB_TOKEN")
+        self.repo = os.environ.get("GITHUB_REPO", "user/repo")
+        self.api_base = f"https://api.github.com/repos/{self.repo}"
+        self.max_connections = max_connections
+        self.client: Optional[httpx.AsyncClient] = None
+
+        if not self.token:
+            raise RuntimeError("GITHUB_TOKEN no está configurado")
+
+    async def __aenter__(self) -> AsyncPRManager:
+        self.client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"token {self.token}",
+                "Accept": "application/vnd.github.v3+json",
+            },
+            limits=httpx.Limits(max_connections=self.max_connections),
+            timeout=30,
+        )
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.client.aclose()
+        self.client = None
+
+    async def approve_pr(
+        self, pr_number: int, message: str, qa_agent: str = "qa-agent"
+    ):
+        """Approve a PR as QA.
+
+        Args:
+            pr_number: PR number
+            message: Approval message
+            qa_agent: Name of QA agent
+        """
+        data = {
+            "body": _APPROVAL_BODY.format(message=message, qa_agent=qa_agent),
+            "event": "APPROVE",
+        }
+        response = await self.client.post(
+            f"{self.api_base}/pulls/{pr_number}/reviews", json=data
+        )
+        response.raise_for_status()
+
+    async def request_changes(
+        self, pr_number: int, message: str, qa_agent: str = "qa-agent"
+    ):
+        """Request changes on a PR.
+
+        Args:
+            pr_number: PR number
+            message: Change request message
+            qa_agent: Name of QA agent
+        """
+        data = {
+            "body": _CHANGES_BODY.format(message=message, qa_agent=qa_agent),
+            "event": "REQUEST_CHANGES",
+        }
+        response = await self.client.post(
+            f"{self.api_base}/pulls/{pr_number}/reviews", json=data
+        )
+        response.raise_for_status()
+
+    async def add_pr_comment(self, pr_number: int, message: str) -> Optional[dict]:
+        """Add a comment to a PR.
+
+        Args:
+            pr_number: PR number
+            message: Comment message
+
+        Returns:
+            Comment data or None if failed
+        """
+        try:
+            response = await self.client.post(
+                f"{self.api_base}/issues/{pr_number}/comments",
+                json={"body": message},
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError:
+            return None
+
+    async def get_pr_status(self, pr_number: int) -> Optional[dict]:
+        """Get current status of a PR.
+
+        Args:
+            pr_number: PR number
+
+        Returns:
+            PR data or None
+        """
+        try:
+            response = await self.client.get(f"{self.api_base}/pulls/{pr_number}")
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError:
+            return None
+
+    async def bulk_get_status(self, pr_numbers: list[int]) -> dict[int, Optional[dict]]:
+        """Fetch the status of several PRs concurrently.
+
+        Args:
+            pr_numbers: PR numbers to query
+
+        Returns:
+            Mapping of PR number to PR data (None where the call failed)
+        """
+        statuses = await asyncio.gather(
+            *(self.get_pr_status(n) for n in pr_numbers)
+        )
+        return dict(zip(pr_numbers, statuses))
@@ -6,12 +6,116 @@ Enforces resource limits per role (architect: 1, dev: 2, test: 2).
 
 from __future__ import annotations
 
-import subprocess
+import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 import docker
+import yaml
+
+from prism.qa.container_access import ContainerAccess
+
+COMPOSE_FILE = Path(__file__).parent.parent / "docker" / "docker-compose.test.yml"
+_TEST_SERVICE = "prism-test"
+_PORT_POLL_ATTEMPTS = 50
+_PORT_POLL_INTERVAL = 0.1
+
+
+def _read_env_file(path: Path) -> dict[str, str]:
+    """``KEY=VALUE`` lines of a compose env_file; blanks and comments skipped."""
+    env = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            key, _, value = line.partition("=")
+            env[key.strip()] = value.strip()
+    return env
+
+
+def _compose_service_kwargs(service: dict, compose_dir: Path) -> dict:
+    """Translate one compose service into ``containers.run`` keyword arguments.
+
+    Only static settings are kept; per-launch values (name, environment,
+    labels, network) are filled in by ``launch_test_container``. As with
+    docker compose, relative bind mounts and env_files are resolved against
+    ``compose_dir``.
+    """
+    kwargs: dict = {"image": service["image"]}
+
+    ports = {}
+    for spec in service.get("ports", []):
+        host, _, container = str(spec).rpartition(":")
+        ports[f"{container}/tcp"] = int(host) if host else None
+    if ports:
+        kwargs["ports"] = ports
+
+    volumes = {}
+    for spec in service.get("volumes", []):
+        source, target, *mode = spec.split(":")
+        if source.startswith("."):
+            source = str((compose_dir / source).resolve())
+        elif source.startswith("~"):
+            source = str(Path(source).expanduser())
+        volumes[source] = {"bind": target, "mode": mode[0] if mode else "rw"}
+    if volumes:
+        kwargs["volumes"] = volumes
+
+    env_files = service.get("env_file", [])
+    environment = {}
+    for env_file in [env_files] if isinstance(env_files, str) else env_files:
+        environment.update(_read_env_file(compose_dir / env_file))
+    if environment:
+        kwargs["environment"] = environment
+
+    resources = service.get("deploy", {}).get("resources", {})
+    limits = resources.get("limits", {})
+    if "cpus" in limits:
+        kwargs["nano_cpus"] = int(float(limits["cpus"]) * 1e9)
+    if "memory" in limits:
+        kwargs["mem_limit"] = str(limits["memory"]).lower()
+    reservation = resources.get("reservations", {}).get("memory")
+    if reservation:
+        kwargs["mem_reservation"] = str(reservation).lower()
+
+    return kwargs
+
+
+def _compose_build_kwargs(service: dict, compose_dir: Path) -> Optional[dict]:
+    """``images.build`` kwargs for a service's ``build`` section, if any."""
+    build = service.get("build")
+    if not build:
+        return None
+    return {
+        "path": str((compose_dir / build.get("context", ".")).resolve()),
+        "dockerfile": build.get("dockerfile", "Dockerfile"),
+        "tag": service["image"],
+    }
+
+
+def load_compose_template(path: Path = COMPOSE_FILE) -> dict[str, dict]:
+    """Parse a compose file into per-service run and build kwargs.
+
+    Returns:
+        Mapping of service name to ``{"run": {...}, "build": {...} | None}``
+    """
+    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    return {
+        name: {
+            "run": _compose_service_kwargs(service, path.parent),
+            "build": _compose_build_kwargs(service, path.parent),
+        }
+        for name, service in data.get("services", {}).items()
+    }
+
+
+def _web_terminal_url(container) -> Optional[str]:
+    ports = container.attrs["NetworkSettings"]["Ports"]
+    if ports and "7681/tcp" in ports and ports["7681/tcp"]:
+        host_port = ports["7681/tcp"][0]["HostPort"]
+        return f"http://localhost:{host_port}"
+    return None
 
 
 @dataclass
@@ -27,6 +131,37 @@ class TestContainer:
     role: str = "developer"  # architect, developer, test, optimizer
 
 
+def _summary_to_model(attrs: dict) -> TestContainer:
+    """Build a TestContainer from a sparse ``containers.list`` entry.
+
+    List summaries already carry labels, published ports and a status line,
+    so no per-container inspect or exec is needed. Gate progress is only
+    visible as the HEALTHCHECK result here; ``get_container_status`` reads
+    the exact status file.
+    """
+    labels = attrs.get("Labels") or {}
+    web_url = next(
+        (
+            f"http://localhost:{port['PublicPort']}"
+            for port in attrs.get("Ports") or []
+            if port.get("PrivatePort") == 7681 and port.get("PublicPort")
+        ),
+        None,
+    )
+    status = labels.get("prism.test.status", "unknown")
+    if "(healthy)" in attrs.get("Status", ""):
+        status = "ready_for_qa"
+    return TestContainer(
+        id=attrs["Id"],
+        name=(attrs.get("Names") or ["/"])[0].lstrip("/"),
+        task_id=labels.get("prism.test.task", "unknown"),
+        branch=labels.get("prism.test.branch", "unknown"),
+        status=status,
+        web_terminal_url=web_url,
+        role=labels.get("prism.test.role", "developer"),
+    )
+
+
 class ContainerManager:
     """Manages test containers with resource limits per role."""
 
@@ -48,8 +183,14 @@ class ContainerManager:
                 "Asegúrate de que Docker esté instalado y corriendo."
             )
 
+        # Read once; the environment doesn't change between launches
+        self._github_token = os.environ.get("GITHUB_TOKEN")
+        self._github_repo = os.environ.get("GITHUB_REPO", "user/repo")
+        self._flux_webhook = os.environ.get("FLUX_WEBHOOK_URL", "")
+
         self.network_name = "prism-test-network"
         self._ensure_network()
+        self._compose_template = load_compose_template()
 
     def _ensure_network(self):
         """Ensure the test network exists."""
@@ -84,69 +225,55 @@ class ContainerManager:
         print(f"🐳 Creando contenedor: {container_name}")
 
         try:
-            # Build docker command
+            if not self._github_token:
+                raise RuntimeError("GITHUB_TOKEN no está configurado")
+
             env_vars = {
                 "TASK_ID": task_id,
                 "GIT_BRANCH": branch,
-                "GITHUB_TOKEN": self._get_github_token(),
-                "GITHUB_REPO": self._get_github_repo(),
-                "FLUX_WEBHOOK_URL": self._get_flux_webhook(),
+                "GITHUB_TOKEN": self._github_token,
+                "GITHUB_REPO": self._github_repo,
+                "FLUX_WEBHOOK_URL": self._flux_webhook,
                 "PRISM_ROLE": role,
             }
 
-            # Run container with docker-compose for better resource management
-            compose_file = (
-                Path(__file__).parent.parent / "docker" / "docker-compose.test.yml"
-            )
-
-            # Set environment for compose
-            compose_env = {
-                **env_vars,
-                "CONTAINER_NAME": container_name,
-            }
-
-            # Use docker compose run
-            cmd = [
-                "docker",
-                "compose",
-                "-f",
-                str(compose_file),
-                "run",
-                "-d",
-                "--rm",
-                "--name",
-                container_name,
-                "prism-test",
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                env={**subprocess.os.environ, **compose_env},
+            # Create the container straight through the daemon API instead
+            # of forking the compose CLI for every launch
+            service = self._compose_template[_TEST_SERVICE]
+            kwargs = dict(service["run"])
+            kwargs.update(
+                name=container_name,
+                environment={**kwargs.get("environment", {}), **env_vars},
+                labels={
+                    "prism.test.task": task_id,
+                    "prism.test.branch": branch,
+                    "prism.test.role": role,
+                    "prism.test.status": "creating",
+                },
+                network=self.network_name,
+                detach=True,
+                auto_remove=True,
             )
-
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to start container: {result.stderr}")
-
-            container_id = result.stdout.strip()
-
-            # Get the actual container object
-            container = self.client.containers.get(container_name)
-
-            # Wait a moment for ttyd to start
-            import time
-
-            time.sleep(3)
-
-            # Get the assigned port
-            container.reload()
-            ports = container.attrs["NetworkSettings"]["Ports"]
-
+            try:
+                container = self.client.containers.run(**kwargs)
+            except docker.errors.ImageNotFound:
+                if not service["build"]:
+                    raise
+                self.client.images.build(**service["build"])
+                container = self.client.containers.run(**kwargs)
+            # It may replace a container that exited on its own (auto_remove)
+            # and whose port mapping is still cached
+            ContainerAccess().invalidate(task_id)
+
+            # Host ports are published when the container starts; poll
+            # briefly instead of sleeping a fixed amount
             web_url = None
-            if ports and "7681/tcp" in ports and ports["7681/tcp"]:
-                host_port = ports["7681/tcp"][0]["HostPort"]
-                web_url = f"http://localhost:{host_port}"
+            for _ in range(_PORT_POLL_ATTEMPTS):
+                container.reload()
+                web_url = _web_terminal_url(container)
+                if web_url:
+                    break
+                time.sleep(_PORT_POLL_INTERVAL)
 
             return TestContainer(
                 id=container.id,
@@ -165,14 +292,12 @@ class ContainerManager:
         """Check and enforce resource limits per role."""
         limit = self.ROLE_LIMITS.get(role, 2)
 
-        # Count running containers by role
+        # Count running containers by role (one sparse list call)
         containers = self.client.containers.list(
-            filters={"label": "prism.test.task"}, all=False
+            filters={"label": f"prism.test.role={role}"}, all=False, sparse=True
         )
 
-        role_count = sum(
-            1 for c in containers if c.labels.get("prism.test.role") == role
-        )
+        role_count = len(containers)
 
         if role_count >= limit:
             raise RuntimeError(
@@ -180,27 +305,6 @@ class ContainerManager:
                 f"Espera a que termine uno existente."
             )
 
-    def _get_github_token(self) -> str:
-        """Get GitHub token from environment."""
-        import os
-
-        token = os.environ.get("GITHUB_TOKEN")
-        if not token:
-            raise RuntimeError("GITHUB_TOKEN no está configurado")
-        return token
-
-    def _get_github_repo(self) -> str:
-        """Get GitHub repo from environment."""
-        import os
-
-        return os.environ.get("GITHUB_REPO", "user/repo")
-
-    def _get_flux_webhook(self) -> str:
-        """Get Flux webhook URL from environment."""
-        import os
-
-        return os.environ.get("FLUX_WEBHOOK_URL", "")
-
     def get_container_status(self, task_id: str) -> Optional[TestContainer]:
         """Get status of a test container.
 
@@ -212,16 +316,9 @@ class ContainerManager:
         """
         try:
             container_name = f"prism-test-{task_id}"
+            # get() already inspects the container; no reload needed
             container = self.client.containers.get(container_name)
-
-            # Get web terminal URL
-            container.reload()
-            ports = container.attrs["NetworkSettings"]["Ports"]
-
-            web_url = None
-            if ports and "7681/tcp" in ports and ports["7681/tcp"]:
-                host_port = ports["7681/tcp"][0]["HostPort"]
-                web_url = f"http://localhost:{host_port}"
+            web_url = _web_terminal_url(container)
 
             # Check actual status from file if available
             status = container.labels.get("prism.test.status", "unknown")
@@ -253,6 +350,9 @@ class ContainerManager:
         Args:
             task_id: The task ID
         """
+        # A relaunched container gets a new port mapping
+        ContainerAccess().invalidate(task_id)
+
         try:
             container_name = f"prism-test-{task_id}"
             container = self.client.containers.get(container_name)
@@ -275,18 +375,13 @@ class ContainerManager:
             List of TestContainer instances
         """
         try:
+            # sparse=True keeps this to a single API call; the default
+            # inspects every container again
             containers = self.client.containers.list(
-                filters={"label": "prism.test.task"}, all=False
+                filters={"label": "prism.test.task"}, all=False, sparse=True
             )
 
-            result = []
-            for container in containers:
-                task_id = container.labels.get("prism.test.task", "unknown")
-                status = self.get_container_status(task_id)
-                if status:
-                    result.append(status)
-
-            return result
+            return [_summary_to_model(c.attrs) for c in containers]
 
         except Exception as e:
             print(f"Error listando contenedores: {e}")
@@ -321,23 +416,45 @@ class ContainerManager:
             return 1, "", str(e)
 
     def wait_for_ready(
-        self, task_id: str, timeout: int = 600, poll_interval: int = 5
+        self, task_id: str, timeout: int = 600, poll_interval: int = 30
     ) -> bool:
         """Wait for a container to be ready for QA.
 
+        Readiness and exits arrive as Docker events (the image's HEALTHCHECK
+        turns healthy once ``/tmp/prism_status`` says ``ready_for_qa``), so
+        they are seen immediately. Failed gates produce no event because the
+        container stays up for debugging; that case is caught by a status
+        check every ``poll_interval`` seconds.
+
         Args:
             task_id: The task ID
             timeout: Maximum time to wait in seconds
-            poll_interval: Seconds between checks
+            poll_interval: Seconds between fallback status checks
 
         Returns:
             True if ready, False if timeout or error
         """
-        import time
-
         start = time.time()
+        deadline = start + timeout
+        since = int(start)
+        filters = {
+            "container": f"prism-test-{task_id}",
+            "event": ["health_status", "die"],
+        }
+
+        while time.time() < deadline:
+            until = int(min(time.time() + poll_interval, deadline)) + 1
+            # Streams until ``until``, then the generator ends
+            for event in self.client.events(
+                since=since, until=until, filters=filters, decode=True
+            ):
+                action = event.get("status") or event.get("Action", "")
+                if action == "health_status: healthy":
+                    return True
+                if action == "die":
+                    return False  # Container died
+            since = until
 
-        while time.time() - start < timeout:
             status = self.get_container_status(task_id)
 
             if not status:
@@ -349,6 +466,4 @@ class ContainerManager:
             if status.status == "failed":
                 return False
 
-            time.sleep(poll_interval)
-
         return False  # Timeout
@@ -127,7 +127,6 @@ Estado: ⏳ Ejecutando quality gates...
         success = self.container_manager.wait_for_ready(
             task_id=task_id,
             timeout=600,
-            poll_interval=5,
         )
 
         if not success:
@@ -7,11 +7,106 @@ from __future__ import annotations
 
 import os
 import re
+import shlex
 import subprocess
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import requests
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+if TYPE_CHECKING:
+    import requests
+
+
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+_DASH_RUN_RE = re.compile(r"[-\s]+")
+
+_STATUS_TTL = 30.0
+_STATUS_CACHE_SIZE = 512
+
+_PR_BODY_TEMPLATE = """## Description
+{description}
+
+## Task
+- **ID:** {task_id}
+- **Title:** {task_title}
+
+## PRISM Quality Checklist
+- [x] Implementation complete
+- [x] Unit tests implemented
+- [x] Integration tests implemented
+- [x] Coverage >= 80%
+- [x] Linting passes
+- [x] Type checking passes
+
+## QA Review
+Este PR ha pasado todos los quality gates automáticos y está listo para revisión QA.
+
+### Para revisar:
+1. Esperar confirmación de que el contenedor de test está listo
+2. Abrir el terminal web desde la tarjeta de Flux
+3. Ejecutar tests adicionales si es necesario
+4. Aprobar o solicitar cambios
+
+---
+*Automáticamente generado por PRISM*
+"""
+
+_APPROVAL_BODY = """✅ **QA Approval**
+
+{message}
+
+**Revisado por:** {qa_agent}
+**Estado:** Todos los quality gates pasaron y el código ha sido revisado.
+
+**Nota:** Este PR está listo para merge manual.
+"""
+
+_CHANGES_BODY = """❌ **QA Review: Changes Requested**
+
+{message}
+
+**Revisado por:** {qa_agent}
+
+Por favor realizar las correcciones solicitadas.
+"""
+
+
+def _github_session(token: str) -> requests.Session:
+    """Build a keep-alive session carrying the GitHub auth headers.
+
+    Transient 502/503/504 responses are retried with backoff. Only idempotent
+    methods are retried on a bad status, so a POST is never sent twice once
+    GitHub has received it.
+    """
+    # requests (and urllib3) cost ~50ms to import; only pay it when used
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update(
+        {
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github.v3+json",
+        }
+    )
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry),
+    )
+    return session
 
 
 @dataclass
@@ -37,6 +132,13 @@ class PRManager:
         if not self.token:
             raise RuntimeError("GITHUB_TOKEN no está configurado")
 
+        self.session = _github_session(self.token)
+        self._token_verified = False
+        # pr_number -> (fetched_at, etag, data)
+        self._status_cache: OrderedDict[int, tuple[float, Optional[str], dict]] = (
+            OrderedDict()
+        )
+
     def create_pr_from_task(
         self,
         task_id: str,
@@ -53,6 +155,9 @@ class PRManager:
         Returns:
             PullRequest instance
         """
+        # Fail before pushing a branch the PR could never be opened for
+        self.verify_token()
+
         # Generate branch name
         branch_name = self._generate_branch_name(task_id, task_title)
 
@@ -76,11 +181,38 @@ class PRManager:
             task_id=task_id,
         )
 
+    def verify_token(self):
+        """Check the token against ``GET /user``, once per manager.
+
+        Only a 401 means the token is bad. App installation tokens and the
+        Actions ``GITHUB_TOKEN`` get 403 on ``/user`` but can still open PRs,
+        and 5xx/rate limits say nothing about the token, so those pass.
+
+        Raises:
+            RuntimeError: If GitHub rejects the token
+        """
+        if self._token_verified:
+            return
+        response = self.session.get("https://api.github.com/user")
+        if response.status_code == 401:
+            raise RuntimeError("GITHUB_TOKEN inválido o expirado")
+        self._token_verified = response.ok
+
+    def _post_json(self, url: str, data: dict) -> requests.Response:
+        """POST a JSON payload, encoded with orjson when it's installed."""
+        if orjson is None:
+            return self.session.post(url, json=data)
+        return self.session.post(
+            url,
+            data=orjson.dumps(data),
+            headers={"Content-Type": "application/json"},
+        )
+
     def _generate_branch_name(self, task_id: str, title: str) -> str:
         """Generate a valid branch name from task info."""
         # Clean title: lowercase, special chars to hyphens
-        clean_title = re.sub(r"[^\w\s-]", "", title.lower())
-        clean_title = re.sub(r"[-\s]+", "-", clean_title)
+        clean_title = _NON_WORD_RE.sub("", title.lower())
+        clean_title = _DASH_RUN_RE.sub("-", clean_title)
 
         # Truncate if too long
         if len(clean_title) > 50:
@@ -94,49 +226,30 @@ class PRManager:
         task_id: str,
         description: str,
     ):
-        """Create branch locally and commit changes."""
-        # Configure git if not already configured
-        try:
-            subprocess.run(
-                ["git", "config", "user.email"],
-                capture_output=True,
-                check=True,
-            )
-        except subprocess.CalledProcessError:
-            subprocess.run(
-                ["git", "config", "user.email", "prism@localhost"],
-                check=True,
-            )
-            subprocess.run(
-                ["git", "config", "user.name", "PRISM Agent"],
-                check=True,
-            )
-
-        # Create and checkout branch
-        subprocess.run(
-            ["git", "checkout", "-b", branch_name],
-            capture_output=True,
-            check=True,
-        )
+        """Create branch locally and commit changes.
 
-        # Stage all changes
-        subprocess.run(
-            ["git", "add", "-A"],
-            capture_output=True,
-            check=True,
-        )
-
-        # Commit
+        All git steps run as one ``&&`` chain in a single bash process, so
+        the first failing step stops the rest just like ``check=True`` did.
+        """
         commit_msg = f"feat: {description or 'Implement task'}\n\nTask: {task_id}"
-        subprocess.run(
-            ["git", "commit", "-m", commit_msg],
-            capture_output=True,
-            check=True,
+        branch = shlex.quote(branch_name)
+        script = " && ".join(
+            [
+                # Configure git if not already configured
+                "(git config --get user.email >/dev/null 2>&1 || "
+                "(git config user.email prism@localhost && "
+                "git config user.name 'PRISM Agent'))",
+                f"git checkout -b {branch}",
+                "git add -A",
+                f"git commit -m {shlex.quote(commit_msg)}",
+                # Explicit refspec: no DWIM ref lookup on either side
+                f"git push -u origin HEAD:refs/heads/{branch}",
+            ]
         )
-
-        # Push to origin
         subprocess.run(
-            ["git", "push", "-u", "origin", branch_name],
+            script,
+            shell=True,
+            executable="/bin/bash",
             capture_output=True,
             check=True,
         )
@@ -149,11 +262,6 @@ class PRManager:
         base: str,
     ) -> dict:
         """Create PR via GitHub API."""
-        headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
         data = {
             "title": title,
             "body": body,
@@ -161,44 +269,18 @@ class PRManager:
             "base": base,
         }
 
-        response = requests.post(
-            f"{self.api_base}/pulls",
-            headers=headers,
-            json=data,
-        )
+        response = self._post_json(f"{self.api_base}/pulls", data)
         response.raise_for_status()
 
         return response.json()
 
     def _generate_pr_body(self, task_id: str, task_title: str, description: str) -> str:
         """Generate PR body with PRISM checklist."""
-        return f"""## Description
-{description or task_title}
-
-## Task
-- **ID:** {task_id}
-- **Title:** {task_title}
-
-## PRISM Quality Checklist
-- [x] Implementation complete
-- [x] Unit tests implemented
-- [x] Integration tests implemented
-- [x] Coverage >= 80%
-- [x] Linting passes
-- [x] Type checking passes
-
-## QA Review
-Este PR ha pasado todos los quality gates automáticos y está listo para revisión QA.
-
-### Para revisar:
-1. Esperar confirmación de que el contenedor de test está listo
-2. Abrir el terminal web desde la tarjeta de Flux
-3. Ejecutar tests adicionales si es necesario
-4. Aprobar o solicitar cambios
-
----
-*Automáticamente generado por PRISM*
-"""
+        return _PR_BODY_TEMPLATE.format(
+            task_id=task_id,
+            task_title=task_title,
+            description=description or task_title,
+        )
 
     def approve_pr(self, pr_number: int, message: str, qa_agent: str = "qa-agent"):
         """Approve a PR as QA.
@@ -208,30 +290,16 @@ Este PR ha pasado todos los quality gates automáticos y está listo para revisi
             message: Approval message
             qa_agent: Name of QA agent
         """
-        headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
         # Create approving review
         data = {
-            "body": f"""✅ **QA Approval**
-
-{message}
-
-**Revisado por:** {qa_agent}
-**Estado:** Todos los quality gates pasaron y el código ha sido revisado.
-
-**Nota:** Este PR está listo para merge manual.
-""",
+            "body": _APPROVAL_BODY.format(message=message, qa_agent=qa_agent),
             "event": "APPROVE",
         }
 
-        response = requests.post(
-            f"{self.api_base}/pulls/{pr_number}/reviews",
-            headers=headers,
-            json=data,
+        response = self._post_json(
+            f"{self.api_base}/pulls/{pr_number}/reviews", data
         )
+        self._status_cache.pop(pr_number, None)
         response.raise_for_status()
 
     def request_changes(self, pr_number: int, message: str, qa_agent: str = "qa-agent"):
@@ -242,28 +310,15 @@ Este PR ha pasado todos los quality gates automáticos y está listo para revisi
             message: Change request message
             qa_agent: Name of QA agent
         """
-        headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
         data = {
-            "body": f"""❌ **QA Review: Changes Requested**
-
-{message}
-
-**Revisado por:** {qa_agent}
-
-Por favor realizar las correcciones solicitadas.
-""",
+            "body": _CHANGES_BODY.format(message=message, qa_agent=qa_agent),
             "event": "REQUEST_CHANGES",
         }
 
-        response = requests.post(
-            f"{self.api_base}/pulls/{pr_number}/reviews",
-            headers=headers,
-            json=data,
+        response = self._post_json(
+            f"{self.api_base}/pulls/{pr_number}/reviews", data
         )
+        self._status_cache.pop(pr_number, None)
         response.raise_for_status()
 
     def add_pr_comment(self, pr_number: int, message: str) -> Optional[dict]:
@@ -276,19 +331,15 @@ Por favor realizar las correcciones solicitadas.
         Returns:
             Comment data or None if failed
         """
-        headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        import requests
 
         data = {"body": message}
 
         try:
-            response = requests.post(
-                f"{self.api_base}/issues/{pr_number}/comments",
-                headers=headers,
-                json=data,
+            response = self._post_json(
+                f"{self.api_base}/issues/{pr_number}/comments", data
             )
+            self._status_cache.pop(pr_number, None)
             response.raise_for_status()
             return response.json()
         except requests.RequestException:
@@ -297,23 +348,40 @@ Por favor realizar las correcciones solicitadas.
     def get_pr_status(self, pr_number: int) -> Optional[dict]:
         """Get current status of a PR.
 
+        Answers from cache for ``_STATUS_TTL`` seconds. After that the
+        request is sent with the cached ETag; a 304 reply doesn't count
+        against GitHub's rate limit and reuses the cached data.
+
         Args:
             pr_number: PR number
 
         Returns:
             PR data or None
         """
-        headers = {
-            "Authorization": f"token {self.token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        import requests
 
+        cached = self._status_cache.get(pr_number)
+        now = time.monotonic()
+        if cached and now - cached[0] < _STATUS_TTL:
+            self._status_cache.move_to_end(pr_number)
+            return cached[2]
+
+        headers = {"If-None-Match": cached[1]} if cached and cached[1] else None
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.api_base}/pulls/{pr_number}",
                 headers=headers,
             )
-            response.raise_for_status()
-            return response.json()
+            if response.status_code == 304 and cached:
+                data = cached[2]
+            else:
+                response.raise_for_status()
+                data = response.json()
         except requests.RequestException:
             return None
+
+        self._status_cache[pr_number] = (now, response.headers.get("ETag"), data)
+        self._status_cache.move_to_end(pr_number)
+        if len(self._status_cache) > _STATUS_CACHE_SIZE:
+            self._status_cache.popitem(last=False)
+        return data
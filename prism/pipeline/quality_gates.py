@@ -1,15 +1,21 @@
 """Quality Gates - Sequential fail-fast testing pipeline for PRISM.
 
 This module executes quality checks in sequence, failing immediately
-when any gate doesn't pass to provide fast feedback.
+when any gate doesn't pass to provide fast feedback. Gates can also run
+concurrently, cancelling the rest as soon as one fails.
 """
 
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import codecs
+import contextlib
+import io
 import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional
 
 
@@ -36,6 +42,209 @@ class QualityReport:
     failed_gate: Optional[str] = None
 
 
+def _is_pytest_gate(config: dict) -> bool:
+    return config["command"][0] == "pytest"
+
+
+def _runs_in_process(config: dict) -> bool:
+    """Pytest gates that can share the runner's interpreter.
+
+    Coverage gates always get their own process: by the time an in-process
+    session starts, ``prism`` is already imported, so pytest-cov would miss
+    its import-time lines and under-report against ``--cov-fail-under``.
+    """
+    return _is_pytest_gate(config) and not any(
+        arg.startswith("--cov") for arg in config["command"][1:]
+    )
+
+
+# Lines of gate output kept for the report; the rest is only streamed
+_MAX_OUTPUT_LINES = 200
+# Passing gates keep just the tail of their output (usually a summary line)
+_PASSED_OUTPUT_CHARS = 4096
+# Output shown for a failing gate when it wasn't streamed
+_FAILED_PREVIEW_CHARS = 2000
+_READ_CHUNK = 64 * 1024
+
+
+def _report_output(lines, passed: bool) -> str:
+    """Join kept output lines, trimmed to ``_PASSED_OUTPUT_CHARS`` if the gate passed."""
+    output = "".join(lines)
+    return output[-_PASSED_OUTPUT_CHARS:] if passed else output
+
+
+class _TailWriter(io.TextIOBase):
+    """Text stream keeping only the last ``_MAX_OUTPUT_LINES`` lines written.
+
+    With ``echo`` set, everything is also passed through to that stream.
+    """
+
+    def __init__(self, echo=None):
+        self.lines: deque[str] = deque(maxlen=_MAX_OUTPUT_LINES)
+        self._partial = ""
+        self._echo = echo
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if self._echo is not None:
+            self._echo.write(text)
+            self._echo.flush()
+        *complete, self._partial = (self._partial + text).split("\n")
+        self.lines.extend(line + "\n" for line in complete)
+        return len(text)
+
+    def getvalue(self) -> list[str]:
+        return [*self.lines, self._partial] if self._partial else list(self.lines)
+
+# pytest options whose value is passed as a separate argument
+_PYTEST_VALUE_OPTIONS = {"-p", "-k", "-m", "-c", "-o", "--rootdir", "--basetemp"}
+
+
+def _split_pytest_args(config: dict) -> tuple[list[str], list[tuple[str, ...]]]:
+    """Split a pytest gate's arguments into test paths and option groups.
+
+    An empty path list means the gate runs the whole suite.
+    """
+    paths: list[str] = []
+    options: list[tuple[str, ...]] = []
+    args = iter(config["command"][1:])
+    for arg in args:
+        if arg in _PYTEST_VALUE_OPTIONS:
+            options.append((arg, next(args, "")))
+        elif arg.startswith("-"):
+            options.append((arg,))
+        else:
+            paths.append(arg)
+    return paths, options
+
+
+class _OutcomeRecorder:
+    """pytest plugin recording where each test lives and whether it failed."""
+
+    def __init__(self):
+        self.paths: dict[str, Path] = {}
+        self.durations: dict[str, float] = {}
+        self.failed: set[str] = set()
+
+    def pytest_itemcollected(self, item):
+        self.paths[item.nodeid] = Path(str(item.path)).resolve()
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self.failed.add(report.nodeid)
+            self.paths.setdefault(report.nodeid, Path(str(report.fspath)).resolve())
+
+    def pytest_runtest_logreport(self, report):
+        self.durations[report.nodeid] = (
+            self.durations.get(report.nodeid, 0.0) + report.duration
+        )
+        if report.failed:
+            self.failed.add(report.nodeid)
+
+
+class PytestWorker:
+    """Runs every pytest-based gate in one in-process pytest session.
+
+    Spawning pytest once per gate repeats interpreter startup, plugin
+    loading, conftest imports and collection each time. The worker merges
+    the gates' paths and options into a single ``pytest.main`` call and
+    splits the outcome back into one ``GateResult`` per gate: gates with
+    explicit paths pass when their own tests do, gates covering the whole
+    suite use the session's exit code.
+
+    Output is kept and trimmed the same way as for subprocess gates, and
+    streamed live when ``verbose`` is set.
+
+    Coverage gates are not given to the worker (see ``_runs_in_process``).
+    Per-gate timeouts are not enforced: a thread running ``pytest.main``
+    can't be killed, so a hanging test hangs the runner. Modules imported
+    by an earlier run in the same process are reused, so use a fresh runner
+    process after changing code.
+    """
+
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+
+    def run(self, gates: list[dict]) -> dict[str, GateResult]:
+        """Run the given pytest gates together.
+
+        Args:
+            gates: Gate configuration dicts whose command starts with pytest
+
+        Returns:
+            Mapping of gate name to its GateResult
+        """
+        import pytest
+
+        paths: list[str] = []
+        options: list[tuple[str, ...]] = []
+        whole_suite = False
+        missing: dict[str, str] = {}
+        for config in gates:
+            gate_paths, gate_options = _split_pytest_args(config)
+            whole_suite |= not gate_paths
+            for path in gate_paths:
+                if not Path(path).exists():
+                    missing.setdefault(config["name"], path)
+                elif path not in paths:
+                    paths.append(path)
+            options += [opt for opt in gate_options if opt not in options]
+
+        recorder = _OutcomeRecorder()
+        buffer = _TailWriter(echo=sys.stdout if self.verbose else None)
+        start_time = time.time()
+        if whole_suite or paths:
+            args = [arg for opt in options for arg in opt]
+            args += [] if whole_suite else paths
+            with contextlib.redirect_stdout(buffer):
+                exit_code = int(pytest.main(args, plugins=[recorder]))
+        else:
+            exit_code = int(pytest.ExitCode.NO_TESTS_COLLECTED)
+        total_ms = int((time.time() - start_time) * 1000)
+        lines = buffer.getvalue()
+
+        results = {}
+        for config in gates:
+            cmd_str = " ".join(config["command"])
+            gate_paths = [Path(p).resolve() for p in _split_pytest_args(config)[0]]
+
+            if config["name"] in missing:
+                passed, duration_ms = False, 0
+                error = f"file or directory not found: {missing[config['name']]}"
+            elif not gate_paths:
+                passed, duration_ms = exit_code == 0, total_ms
+                error = None if passed else f"pytest exited with code {exit_code}"
+            else:
+                own = [
+                    nodeid
+                    for nodeid, path in recorder.paths.items()
+                    if any(path.is_relative_to(base) for base in gate_paths)
+                ]
+                failed = [nodeid for nodeid in own if nodeid in recorder.failed]
+                passed = bool(own) and not failed
+                duration_ms = int(
+                    sum(recorder.durations.get(nodeid, 0.0) for nodeid in own) * 1000
+                )
+                if failed:
+                    error = "Failed: " + ", ".join(failed)
+                elif not own:
+                    error = "No tests collected"
+                else:
+                    error = None
+
+            results[config["name"]] = GateResult(
+                name=config["name"],
+                passed=passed,
+                duration_ms=duration_ms,
+                output=_report_output(lines, passed),
+                error_output=error,
+                command=cmd_str,
+            )
+        return results
+
+
 class QualityGatesRunner:
     """Executes quality gates in fail-fast sequence.
 
@@ -85,6 +294,22 @@ class QualityGatesRunner:
         },
     ]
 
+    def __init__(self, in_process: bool = False, verbose: bool = False):
+        """Configure the runner.
+
+        Args:
+            in_process: Run the pytest-based gates in one in-process pytest
+                session (see ``PytestWorker``) instead of a process each;
+                coverage gates still run as a subprocess. Their timeouts
+                are not enforced in this mode
+            verbose: Stream every gate's output live; otherwise only the
+                tail of a failing gate's output is printed
+        """
+        self.in_process = in_process
+        self.verbose = verbose
+        self._worker = PytestWorker(verbose=verbose) if in_process else None
+        self._pytest_results: dict[str, GateResult] = {}
+
     def run_all(self, task_id: str) -> QualityReport:
         """Execute all gates in sequence.
 
@@ -94,8 +319,17 @@ class QualityGatesRunner:
         Returns:
             QualityReport with all results
         """
+        return asyncio.run(self.arun_all(task_id))
+
+    async def arun_all(self, task_id: str) -> QualityReport:
+        """Async ``run_all`` for callers that already run an event loop.
+
+        Cancelling it (Ctrl-C under ``asyncio.run``) terminates the gate
+        that is running before the cancellation propagates.
+        """
         results = []
         start_time = time.time()
+        self._pytest_results = {}
 
         print("\n" + "=" * 70)
         print(f"🔍 PRISM Quality Gates - Task: {task_id}")
@@ -106,7 +340,7 @@ class QualityGatesRunner:
             print(f"\n[{i}/{len(self.GATES)}] {gate_config['description']}")
             print("-" * 70)
 
-            result = self._run_gate(gate_config)
+            result = await self._adispatch_gate(gate_config)
             results.append(result)
 
             # Print result
@@ -142,72 +376,216 @@ class QualityGatesRunner:
             total_duration_ms=total_duration,
         )
 
-    def _run_gate(self, config: dict) -> GateResult:
-        """Execute a single quality gate.
+    # Gates whose checks are already run by another gate's command: coverage
+    # runs bare pytest, which collects every testpaths dir, integration
+    # included. Running both concurrently would also race on shared fixtures.
+    SUBSUMED_BY = {"unit_tests": "coverage", "integration_tests": "coverage"}
+
+    def run_all_parallel(self, task_id: str) -> QualityReport:
+        """Execute all gates concurrently, stopping at the first failure.
+
+        Wall time on a passing run is the slowest gate instead of the sum
+        of all of them. Gates subsumed by another configured gate are
+        skipped; gates still running when one fails are terminated and left
+        out of the report.
+
+        Args:
+            task_id: The task being tested
+
+        Returns:
+            QualityReport with the finished gates, in completion order
+        """
+        return asyncio.run(self._run_all_parallel(task_id))
+
+    async def _run_all_parallel(self, task_id: str) -> QualityReport:
+        start_time = time.time()
+        names = {g["name"] for g in self.GATES}
+        gates = [g for g in self.GATES if self.SUBSUMED_BY.get(g["name"]) not in names]
+
+        print("\n" + "=" * 70)
+        print(f"🔍 PRISM Quality Gates - Task: {task_id}")
+        print("=" * 70)
+        print(f"Parallel mode: {len(gates)} gates, stops at first failure\n")
+
+        pending = {
+            asyncio.create_task(
+                self._arun_gate(g, stream=self.verbose, label=g["name"])
+            )
+            for g in gates
+        }
+        results = []
+        failed_gate = None
+
+        while pending and failed_gate is None:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                result = task.result()
+                results.append(result)
+
+                status = "✅ PASS" if result.passed else "❌ FAIL"
+                print(f"{status} {result.name} ({result.duration_ms / 1000:.1f}s)")
+
+                if not result.passed and failed_gate is None:
+                    failed_gate = result.name
+
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        total_duration = int((time.time() - start_time) * 1000)
+
+        if failed_gate:
+            print(f"\n❌ GATE FAILED: {failed_gate}")
+            print("Pipeline stopped. Fix this issue before continuing.\n")
+        else:
+            print("\n" + "=" * 70)
+            print(f"✅ ALL GATES PASSED ({len(results)}/{len(results)})")
+            print(f"Total time: {total_duration / 1000:.1f}s")
+            print("=" * 70 + "\n")
+
+        return QualityReport(
+            task_id=task_id,
+            all_passed=failed_gate is None,
+            gates=results,
+            total_duration_ms=total_duration,
+            failed_gate=failed_gate,
+        )
+
+    async def _arun_gate(
+        self, config: dict, stream: bool = False, label: Optional[str] = None
+    ) -> GateResult:
+        """Execute a single quality gate as an asyncio subprocess.
 
         Args:
             config: Gate configuration dict
+            stream: Echo the gate's stdout live as it arrives
+            label: Prefix streamed lines with ``[label]`` so concurrent
+                gates' output can be told apart
 
         Returns:
-            GateResult with execution details
+            GateResult; the output (and stderr, as ``error_output``) keeps
+            the last ``_MAX_OUTPUT_LINES`` lines, the output trimmed to
+            ``_PASSED_OUTPUT_CHARS`` when the gate passes.
+            If cancelled, the gate's process is terminated first.
         """
         start_time = time.time()
         cmd_str = " ".join(config["command"])
 
         try:
-            result = subprocess.run(
-                config["command"],
-                capture_output=True,
-                text=True,
-                timeout=config["timeout"],
+            proc = await asyncio.create_subprocess_exec(
+                *config["command"],
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-
+        except FileNotFoundError:
             duration_ms = int((time.time() - start_time) * 1000)
-
-            # Print output for visibility
-            if result.stdout:
-                # Limit output length
-                output = result.stdout[:2000]
-                if len(result.stdout) > 2000:
-                    output += "\n... (output truncated)"
-                print(output)
+            error_msg = f"Command not found: {config['command'][0]}"
+            print(f"❌ {error_msg}")
 
             return GateResult(
                 name=config["name"],
-                passed=result.returncode == 0,
+                passed=False,
                 duration_ms=duration_ms,
-                output=result.stdout,
-                error_output=result.stderr if result.returncode != 0 else None,
+                output="",
+                error_output=error_msg,
                 command=cmd_str,
             )
 
-        except subprocess.TimeoutExpired as e:
-            duration_ms = int(config["timeout"] * 1000)
+        lines: deque[str] = deque(maxlen=_MAX_OUTPUT_LINES)
+        err_lines: deque[str] = deque(maxlen=_MAX_OUTPUT_LINES)
+
+        async def read_lines(reader, kept: deque[str], echo: bool):
+            # Chunked reads: a single huge line can't overrun the reader limit
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            partial = ""
+            while chunk := await reader.read(_READ_CHUNK):
+                text = decoder.decode(chunk)
+                if echo and label is None:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+                *complete, partial = (partial + text).split("\n")
+                if echo and label is not None and complete:
+                    # Whole lines only, so interleaved gates stay readable
+                    sys.stdout.write("".join(f"[{label}] {line}\n" for line in complete))
+                    sys.stdout.flush()
+                kept.extend(line + "\n" for line in complete)
+            partial += decoder.decode(b"", final=True)
+            if partial:
+                kept.append(partial)
+                if echo and label is not None:
+                    sys.stdout.write(f"[{label}] {partial}\n")
+                    sys.stdout.flush()
+
+        async def collect():
+            await asyncio.gather(
+                read_lines(proc.stdout, lines, stream),
+                read_lines(proc.stderr, err_lines, False),
+            )
+            await proc.wait()
+
+        try:
+            await asyncio.wait_for(collect(), timeout=config["timeout"])
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
             error_msg = f"Timeout after {config['timeout']}s"
             print(f"⏰ {error_msg}")
 
             return GateResult(
                 name=config["name"],
                 passed=False,
-                duration_ms=duration_ms,
-                output=e.stdout if e.stdout else "",
+                duration_ms=int(config["timeout"] * 1000),
+                output="".join(lines),
                 error_output=error_msg,
                 command=cmd_str,
             )
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.terminate()
+                await proc.wait()
+            raise
+
+        passed = proc.returncode == 0
+        output = _report_output(lines, passed)
+        if not passed and not stream and output:
+            print(output[-_FAILED_PREVIEW_CHARS:])
+
+        return GateResult(
+            name=config["name"],
+            passed=passed,
+            duration_ms=int((time.time() - start_time) * 1000),
+            output=output,
+            error_output="".join(err_lines) if not passed else None,
+            command=cmd_str,
+        )
 
-        except FileNotFoundError as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            error_msg = f"Command not found: {config['command'][0]}"
-            print(f"❌ {error_msg}")
-
-            return GateResult(
-                name=config["name"],
-                passed=False,
-                duration_ms=duration_ms,
-                output="",
-                error_output=error_msg,
-                command=cmd_str,
+    async def _adispatch_gate(self, config: dict) -> GateResult:
+        """Run a gate, sharing one pytest session between pytest gates."""
+        if not (self.in_process and _runs_in_process(config)):
+            return await self._arun_gate(config, stream=self.verbose)
+        if config["name"] not in self._pytest_results:
+            # Off the event loop: the project's own tests may call asyncio.run()
+            # (or use pytest-asyncio), which refuses to start inside a running loop
+            self._pytest_results = await asyncio.to_thread(
+                self._worker.run, [g for g in self.GATES if _runs_in_process(g)]
             )
+        result = self._pytest_results[config["name"]]
+        if not result.passed and not self.verbose and result.output:
+            print(result.output[-_FAILED_PREVIEW_CHARS:])
+        return result
+
+    def _run_gate(self, config: dict) -> GateResult:
+        """Execute a single quality gate.
+
+        Args:
+            config: Gate configuration dict
+
+        Returns:
+            GateResult with execution details
+        """
+        return asyncio.run(self._arun_gate(config, stream=self.verbose))
 
     def run_single(self, gate_name: str) -> GateResult:
         """Run a single gate by name.
@@ -269,6 +647,7 @@ def main():
 Examples:
   python -m prism.pipeline.quality_gates run --task-id TASK-42
   python -m prism.pipeline.quality_gates run --task-id TASK-42 --verbose
+  python -m prism.pipeline.quality_gates run --task-id TASK-42 --sequential
   python -m prism.pipeline.quality_gates single --gate linting
         """,
     )
@@ -282,11 +661,22 @@ Examples:
         required=True,
         help="Task ID for reporting",
     )
+    run_parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run gates one by one instead of concurrently",
+    )
+    run_parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run pytest gates in one in-process session (implies --sequential; "
+        "their timeouts are not enforced)",
+    )
     run_parser.add_argument(
         "--verbose",
         "-v",
         action="store_true",
-        help="Verbose output",
+        help="Stream gate output live and print the full report",
     )
 
     # Run single gate
@@ -304,10 +694,16 @@ Examples:
         parser.print_help()
         sys.exit(1)
 
-    runner = QualityGatesRunner()
+    runner = QualityGatesRunner(
+        in_process=getattr(args, "in_process", False),
+        verbose=getattr(args, "verbose", False),
+    )
 
     if args.command == "run":
-        report = runner.run_all(args.task_id)
+        if args.sequential or args.in_process:
+            report = runner.run_all(args.task_id)
+        else:
+            report = runner.run_all_parallel(args.task_id)
 
         if args.verbose:
             print(format_report(report))
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
+import contextlib
+import functools
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
 from rich.console import Console
 
 from prism.config import GLOBAL_CONFIG_DIR, GLOBAL_CONFIG_PATH
+from prism.utils.executables import find_executable
 
 console = Console()
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
 
 def check_docker() -> bool:
-    return shutil.which("docker") is not None
+    return find_executable("docker") is not None
 
 
 def has_prism_spec(project_dir: Path) -> bool:
@@ -35,24 +41,53 @@ def create_prism_dir(project_dir: Path) -> Path:
     return prism_dir
 
 
+# Global paths already set up by this process; onboarding several projects
+# in one run skips the repeated stats and mkdirs
+_GLOBAL_READY: set[Path] = set()
+
+
 def init_global_memory() -> Path:
     memory_dir = GLOBAL_CONFIG_DIR / "memory"
-    for subdir in ["skills", "gotchas", "decisions", "episodes"]:
-        (memory_dir / subdir).mkdir(parents=True, exist_ok=True)
+    if memory_dir not in _GLOBAL_READY:
+        # Create the parent chain once; the leaves then need a single mkdir each
+        os.makedirs(memory_dir, exist_ok=True)
+        for subdir in ["skills", "gotchas", "decisions", "episodes"]:
+            with contextlib.suppress(FileExistsError):
+                os.mkdir(memory_dir / subdir)
+        _GLOBAL_READY.add(memory_dir)
     return memory_dir
 
 
 def ensure_global_config() -> None:
+    if GLOBAL_CONFIG_PATH in _GLOBAL_READY:
+        return
     if not GLOBAL_CONFIG_PATH.exists():
-        GLOBAL_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        os.makedirs(GLOBAL_CONFIG_DIR, exist_ok=True)
         shutil.copy(TEMPLATES_DIR / "prism.config.yaml.template", GLOBAL_CONFIG_PATH)
+    _GLOBAL_READY.add(GLOBAL_CONFIG_PATH)
+
+
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+@functools.lru_cache(maxsize=64)
+def _read_template(path: Path, mtime_ns: int) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def _load_template(name: str) -> str:
+    # Keyed on path and mtime: an edited template is picked up by a
+    # long-running process, an unchanged one costs a stat instead of a read
+    path = TEMPLATES_DIR / name
+    return _read_template(path, os.stat(path).st_mtime_ns)
 
 
 def render_template(name: str, ctx: dict) -> str:
-    content = (TEMPLATES_DIR / name).read_text()
-    for key, val in ctx.items():
-        content = content.replace(f"{{{{ {key} }}}}", str(val))
-    return content
+    # One pass over the template; unknown placeholders are left as written
+    return _PLACEHOLDER_RE.sub(
+        lambda m: str(ctx.get(m.group(1), m.group(0))),
+        _load_template(name),
+    )
 
 
 def _write_template(dest: Path, template_name: str, ctx: dict) -> None:
@@ -80,19 +115,60 @@ def seed_skills(memory_dir: Path, force: bool = False) -> int:
     seed_dir = TEMPLATES_DIR / "skills" / "seed"
     skills_dir = memory_dir / "skills"
     skills_dir.mkdir(parents=True, exist_ok=True)
-    copied_count = 0
-    for skill_file in seed_dir.glob("*.md"):
-        dest = skills_dir / skill_file.name
-        if force or not dest.exists():
-            shutil.copy(skill_file, dest)
-            copied_count += 1
-    total_skills = len(list(skills_dir.glob("*.md")))
-    return total_skills
+    with os.scandir(skills_dir) as entries:
+        existing = {e.name for e in entries if e.name.endswith(".md") and e.is_file()}
+    total = set(existing)
+    pending = []
+    with os.scandir(seed_dir) as entries:
+        for entry in entries:
+            if not (entry.name.endswith(".md") and entry.is_file()):
+                continue
+            if force or entry.name not in existing:
+                pending.append((entry.path, skills_dir / entry.name))
+            total.add(entry.name)
+    if pending:
+        # copyfile skips the metadata copy and uses sendfile on Linux; the
+        # copies are independent, so overlap their I/O
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as pool:
+            list(pool.map(lambda pair: shutil.copyfile(*pair), pending))
+    return len(total)
+
+
+_CODE_EXTENSIONS = frozenset({".py", ".js", ".ts", ".go", ".rb", ".java", ".cs"})
+# Vendored, generated or VCS directories never decide whether a project has code
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".mypy_cache",
+        "dist",
+        "build",
+        ".tox",
+    }
+)
 
 
 def has_existing_code(project_dir: Path) -> bool:
-    extensions = {".py", ".js", ".ts", ".go", ".rb", ".java", ".cs"}
-    return any(f.suffix in extensions for f in project_dir.rglob("*") if f.is_file())
+    stack = [project_dir]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif (
+                    os.path.splitext(entry.name)[1] in _CODE_EXTENSIONS
+                    and entry.is_file()
+                ):
+                    return True
+    return False
 
 
 def _print_init_success(name: str, seed_count: int) -> None:
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import threading
 import time
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from typing import Optional
 
 from prism.pipeline.container_manager import ContainerManager
 from prism.pipeline.pr_manager import PRManager
 
+_CONTAINER_GRACE_SECONDS = 1800
+_REVIEW_HISTORY = 32
+
 
 @dataclass
 class QAReviewResult:
@@ -30,8 +34,15 @@ class QAApprovalWorkflow:
         self.container_manager = ContainerManager()
         self._monitored_prs = {}
         self._results = {}
+        # Set when a decision for the PR arrives; monitors block on it
+        self._events: dict[int, threading.Event] = {}
+        self._timers: dict[int, threading.Timer] = {}
         self._lock = threading.Lock()
 
+    def _decision_event(self, pr_number: int) -> threading.Event:
+        with self._lock:
+            return self._events.setdefault(pr_number, threading.Event())
+
     def start_monitoring(self, pr_number: int, container_name: str, task_id: str):
         """Start monitoring a PR for QA approval.
 
@@ -55,53 +66,71 @@ class QAApprovalWorkflow:
         """Monitor PR until QA approves or rejects."""
 
         max_wait = 3600 * 4  # 4 hours max
-        start = time.time()
-
-        while time.time() - start < max_wait:
-            with self._lock:
-                result = self._results.get(pr_number)
-
-            if result:
-                if result.approved:
-                    # Approve PR on GitHub
-                    try:
-                        self.pr_manager.approve_pr(
-                            pr_number,
-                            result.message,
-                            result.reviewed_by,
-                        )
-                        print(f"✅ PR #{pr_number} aprobado por {result.reviewed_by}")
-
-                        # Notify human
-                        self._notify_human_for_merge(pr_number, result)
-
-                    except Exception as e:
-                        print(f"❌ Error aprobando PR: {e}")
-
-                else:
-                    # Request changes
-                    try:
-                        self.pr_manager.request_changes(
-                            pr_number,
-                            result.message,
-                            result.reviewed_by,
-                        )
-                        print(f"❌ PR #{pr_number} rechazado")
-
-                    except Exception as e:
-                        print(f"❌ Error rechazando PR: {e}")
-
-                # Keep container for 30 more minutes then destroy
-                time.sleep(1800)
-                self.container_manager.destroy_container(task_id)
-                return
-
-            time.sleep(10)
-
-        # Timeout
-        print(f"⏰ Timeout esperando QA para PR #{pr_number}")
+
+        if not self._decision_event(pr_number).wait(timeout=max_wait):
+            # Timeout
+            print(f"⏰ Timeout esperando QA para PR #{pr_number}")
+            self._forget(pr_number)
+            self.container_manager.destroy_container(task_id)
+            return
+
+        with self._lock:
+            result = self._results[pr_number]
+        self._forget(pr_number)
+
+        if result.approved:
+            # Approve PR on GitHub
+            try:
+                self.pr_manager.approve_pr(
+                    pr_number,
+                    result.message,
+                    result.reviewed_by,
+                )
+                print(f"✅ PR #{pr_number} aprobado por {result.reviewed_by}")
+
+                # Notify human
+                self._notify_human_for_merge(pr_number, result)
+
+            except Exception as e:
+                print(f"❌ Error aprobando PR: {e}")
+
+        else:
+            # Request changes
+            try:
+                self.pr_manager.request_changes(
+                    pr_number,
+                    result.message,
+                    result.reviewed_by,
+                )
+                print(f"❌ PR #{pr_number} rechazado")
+
+            except Exception as e:
+                print(f"❌ Error rechazando PR: {e}")
+
+        # Keep container for 30 more minutes then destroy, without holding
+        # this thread for the wait
+        timer = threading.Timer(
+            _CONTAINER_GRACE_SECONDS,
+            self._destroy_after_grace,
+            args=(pr_number, task_id),
+        )
+        timer.daemon = True
+        with self._lock:
+            self._timers[pr_number] = timer
+        timer.start()
+
+    def _destroy_after_grace(self, pr_number: int, task_id: str):
+        with self._lock:
+            self._timers.pop(pr_number, None)
         self.container_manager.destroy_container(task_id)
 
+    def _forget(self, pr_number: int):
+        """Drop the decision state of a PR whose review is over."""
+        with self._lock:
+            self._results.pop(pr_number, None)
+            self._events.pop(pr_number, None)
+            self._monitored_prs.pop(pr_number, None)
+
     def approve(
         self,
         pr_number: int,
@@ -125,6 +154,7 @@ class QAApprovalWorkflow:
                 reviewed_by=qa_agent,
                 task_id=task_id,
             )
+            self._events.setdefault(pr_number, threading.Event()).set()
 
     def reject(
         self,
@@ -149,6 +179,15 @@ class QAApprovalWorkflow:
                 reviewed_by=qa_agent,
                 task_id=task_id,
             )
+            self._events.setdefault(pr_number, threading.Event()).set()
+
+    def shutdown(self):
+        """Cancel the pending container cleanups."""
+        with self._lock:
+            timers = list(self._timers.values())
+            self._timers.clear()
+        for timer in timers:
+            timer.cancel()
 
     def _notify_human_for_merge(self, pr_number: int, result: QAReviewResult):
         """Notify human that PR is ready for merge."""
@@ -180,17 +219,20 @@ class QAReviewStore:
 
     def __init__(self):
         self._reviews = {}
+        self._by_pr: dict[int, deque[QAReviewResult]] = defaultdict(
+            lambda: deque(maxlen=_REVIEW_HISTORY)
+        )
 
     def save_review(self, result: QAReviewResult):
         """Save a review result."""
         key = f"{result.pr_number}-{int(time.time())}"
         self._reviews[key] = result
+        self._by_pr[result.pr_number].append(result)
 
     def get_review(self, pr_number: int) -> Optional[QAReviewResult]:
         """Get latest review for a PR."""
-        # Find most recent review for this PR
-        matching = [r for r in self._reviews.values() if r.pr_number == pr_number]
-        return matching[-1] if matching else None
+        reviews = self._by_pr.get(pr_number)
+        return reviews[-1] if reviews else None
 
     def list_pending_reviews(self) -> list[int]:
         """List PRs pending review."""
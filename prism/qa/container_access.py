@@ -9,7 +9,40 @@ import subprocess
 from dataclasses import dataclass
 
 
-@dataclass
+def _resolve_port(container_name: str) -> str:
+    """Host port mapped to the container's web terminal (7681)."""
+    result = subprocess.run(
+        ["docker", "port", container_name, "7681"],
+        capture_output=True,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Contenedor no encontrado: {container_name}")
+
+    # Parse port
+    return result.stdout.strip().split(":")[-1]
+
+
+_DOCKER_CLIENT = None
+
+
+def _docker_client():
+    """Shared Docker SDK client, created on first use.
+
+    Polling QA decisions through the SDK reuses one API connection instead
+    of starting a ``docker exec`` CLI process per check. docker is imported
+    lazily so CLI commands that never exec don't pay for it.
+    """
+    global _DOCKER_CLIENT
+    if _DOCKER_CLIENT is None:
+        import docker
+
+        _DOCKER_CLIENT = docker.from_env()
+    return _DOCKER_CLIENT
+
+
+@dataclass(frozen=True)
 class ContainerSession:
     """Represents a session to access a test container."""
 
@@ -19,6 +52,12 @@ class ContainerSession:
     shell_command: str
 
 
+# task_id -> session of its container. A container's port mapping is fixed
+# for its lifetime, so monitors and card refreshes share one frozen session;
+# launch_test_container() and destroy_container() drop the entry.
+_SESSIONS: dict[str, ContainerSession] = {}
+
+
 class ContainerAccess:
     """Manages access to test containers for QA review."""
 
@@ -31,33 +70,30 @@ class ContainerAccess:
         Returns:
             ContainerSession with connection details
         """
-        container_name = f"prism-test-{task_id}"
-
-        # Get web terminal port
-        result = subprocess.run(
-            ["docker", "port", container_name, "7681"],
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode != 0:
-            raise RuntimeError(f"Contenedor no encontrado: {container_name}")
+        session = _SESSIONS.get(task_id)
+        if session is not None:
+            return session
 
-        # Parse port
-        port_info = result.stdout.strip()
-        host_port = port_info.split(":")[-1]
+        container_name = f"prism-test-{task_id}"
+        host_port = _resolve_port(container_name)
 
         web_url = f"http://localhost:{host_port}"
 
         # Local shell command
         shell_cmd = f"docker exec -it {container_name} /bin/bash"
 
-        return ContainerSession(
+        session = ContainerSession(
             task_id=task_id,
             container_name=container_name,
             web_terminal_url=web_url,
             shell_command=shell_cmd,
         )
+        _SESSIONS[task_id] = session
+        return session
+
+    def invalidate(self, task_id: str):
+        """Forget the cached session of a task's container."""
+        _SESSIONS.pop(task_id, None)
 
     def execute_in_container(
         self,
@@ -73,16 +109,25 @@ class ContainerAccess:
         Returns:
             Tuple of (exit_code, stdout, stderr)
         """
+        import docker
+
         container_name = f"prism-test-{task_id}"
 
-        result = subprocess.run(
-            ["docker", "exec", container_name, "/bin/bash", "-c", command],
-            capture_output=True,
-            text=True,
+        try:
+            container = _docker_client().containers.get(container_name)
+            exit_code, (stdout, stderr) = container.exec_run(
+                ["/bin/bash", "-c", command], demux=True
+            )
+        except docker.errors.DockerException as e:
+            # Same shape as a failed `docker exec`
+            return 1, "", str(e)
+
+        return (
+            exit_code,
+            (stdout or b"").decode(errors="replace"),
+            (stderr or b"").decode(errors="replace"),
         )
 
-        return result.returncode, result.stdout, result.stderr
-
     def check_status(self, task_id: str) -> str:
         """Check QA decision status in container.
 
@@ -1,51 +1,118 @@
 from __future__ import annotations
 
+import atexit
+import os
+import shutil
+import threading
 from pathlib import Path
 from typing import Optional
 
 from prism.board.task_mapper import ParsedTask, ParsedEpic, parse_tasks_md
 from prism.config import GLOBAL_CONFIG_DIR, load_global_config
 from prism.memory.injector import count_tokens
+from prism.memory.schemas import SearchResult
 from prism.memory.store import SkillStore
 
 _MARKER = "<!-- PRISM AUGMENTED -->"
 _PER_TASK_BUDGET = 500
 
+_SHARED_STORE: Optional[SkillStore] = None
+_SHARED_STORE_LOCK = threading.Lock()
+
 
 def is_augmented(path: Path) -> bool:
-    return path.exists() and _MARKER in path.read_text(encoding="utf-8")[:120]
+    # The marker sits on the first line; read only the head, not the whole file
+    try:
+        with path.open(encoding="utf-8") as f:
+            head = f.read(120)
+    except FileNotFoundError:
+        return False
+    return _MARKER in head
 
 
 def find_latest_tasks_md(specs_dir: Path) -> Optional[Path]:
-    candidates = sorted(specs_dir.rglob("tasks.md"), key=lambda p: p.stat().st_mtime, reverse=True)
-    return candidates[0] if candidates else None
+    # Single scandir pass keeping the newest match; DirEntry caches its stat
+    best, best_mtime = None, -1.0
+    stack = [str(specs_dir)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name == "tasks.md":
+                    mtime = entry.stat().st_mtime
+                    if mtime > best_mtime:
+                        best, best_mtime = entry.path, mtime
+    return Path(best) if best else None
+
+
+def _open_store() -> SkillStore:
+    cfg = load_global_config()
+    return SkillStore(GLOBAL_CONFIG_DIR / "memory" / "index.db", cfg.memory.embeddings_enabled)
 
 
-def augment_tasks_md(source: Path, force: bool = False) -> Path:
+def shared_store() -> SkillStore:
+    """Return a skill index kept open for the rest of the process.
+
+    Long-running callers (the file watcher) pass it to ``augment_tasks_md``
+    so each augmentation skips reopening the database.
+    """
+    global _SHARED_STORE
+    with _SHARED_STORE_LOCK:
+        if _SHARED_STORE is None:
+            _SHARED_STORE = _open_store().__enter__()
+            atexit.register(_SHARED_STORE.__exit__, None, None, None)
+        return _SHARED_STORE
+
+
+def augment_tasks_md(
+    source: Path, force: bool = False, store: Optional[SkillStore] = None
+) -> Path:
     output = source.with_name("tasks.prism.md")
     if is_augmented(output) and not force:
         return output
     epics = parse_tasks_md(source)
-    cfg = load_global_config()
-    db_path = GLOBAL_CONFIG_DIR / "memory" / "index.db"
-    with SkillStore(db_path, cfg.memory.embeddings_enabled) as store:
-        context_blocks = [_context_block(task, store) for epic in epics for task in epic.tasks]
-    parts = [_MARKER + "\n", source.read_text(encoding="utf-8")]
-    parts += [b for b in context_blocks if b]
-    output.write_text("".join(parts), encoding="utf-8")
+    tasks = [task for epic in epics for task in epic.tasks]
+    queries = [f"{t.title} {t.description}" for t in tasks]
+    if store is None:
+        with _open_store() as store:
+            found = store.search_batch(queries, top_k=5)
+    else:
+        found = store.search_batch(queries, top_k=5)
+    context_blocks = [_context_block(task, results) for task, results in zip(tasks, found)]
+    # Stream into a temp file so an interrupted run never leaves a marked,
+    # half-written output that is_augmented would treat as done
+    tmp_path = output.with_suffix(".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as out:
+            out.write(_MARKER + "\n")
+            with source.open(encoding="utf-8") as src:
+                shutil.copyfileobj(src, out)
+            out.writelines(b for b in context_blocks if b)
+        tmp_path.replace(output)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     return output
 
 
-def _context_block(task: ParsedTask, store: SkillStore) -> str:
-    results = store.search(f"{task.title} {task.description}", top_k=5)
+def _context_block(task: ParsedTask, results: list[SearchResult]) -> str:
     if not results:
         return ""
     lines = [f"\n\n---\n<!-- PRISM: {task.title} -->\n### PRISM Context\n\n**Relevant Skills:**\n"]
-    used = 0
+    used, exact = 0, False
     for r in results:
         fm = r.skill.frontmatter
         line = f"- **{fm.skill_id}** ({fm.type}): {r.skill.title}\n"
-        used += count_tokens(line)
+        # A line never has more tokens than UTF-8 bytes, so the tokenizer is
+        # only needed once that bound could cross the budget
+        if not exact and used + len(line.encode("utf-8")) > _PER_TASK_BUDGET:
+            used, exact = sum(count_tokens(kept) for kept in lines[1:]), True
+        used += count_tokens(line) if exact else len(line.encode("utf-8"))
         if used > _PER_TASK_BUDGET:
             break
         lines.append(line)
@@ -1,37 +1,73 @@
 from __future__ import annotations
 
 import logging
+import os
 import platform
+import threading
+import time
 from pathlib import Path
-from threading import Timer
 from typing import Optional
 
 log = logging.getLogger("prism.watcher")
 
 _DEBOUNCE = 2.0
+# Event types that can change a file's content
+_CONTENT_EVENTS = frozenset({"created", "modified"})
 
 
 class _DebounceHandler:
+    """Runs one augmentation per burst of tasks.md events.
+
+    A single worker thread sleeps until the debounce deadline, which each
+    event pushes back, instead of spawning a Timer thread per event.
+    """
+
     def __init__(self) -> None:
-        self._timer: Optional[Timer] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._deadline = 0.0
+        self._pending: Optional[Path] = None
+        self._worker: Optional[threading.Thread] = None
 
     def dispatch(self, event) -> None:
-        if not event.src_path.endswith("tasks.md"):
+        # Runs for every event under the specs dir (thousands during a
+        # checkout): reject directories, opens/reads and other files cheaply
+        if event.is_directory or event.event_type not in _CONTENT_EVENTS:
+            return
+        if event.src_path.rpartition(os.sep)[2] != "tasks.md":
             return
         log.info("[FILE WATCHER] tasks.md detected → %s", event.src_path)
-        if self._timer:
-            self._timer.cancel()
-        self._timer = Timer(_DEBOUNCE, self._augment, args=(Path(event.src_path),))
-        self._timer.start()
+        with self._lock:
+            self._pending = Path(event.src_path)
+            self._deadline = time.monotonic() + _DEBOUNCE
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="prism-watcher-debounce", daemon=True
+                )
+                self._worker.start()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            with self._lock:
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    path, self._pending = self._pending, None
+                    self._wake.clear()
+            if remaining > 0:
+                time.sleep(remaining)
+            elif path is not None:
+                self._augment(path)
 
     def _augment(self, path: Path) -> None:
         try:
-            from prism.spec.augmenter import augment_tasks_md, is_augmented
+            from prism.spec.augmenter import augment_tasks_md, is_augmented, shared_store
             output = path.with_name("tasks.prism.md")
             if is_augmented(output):
                 log.info("[FILE WATCHER] already augmented — skipping")
                 return
-            result = augment_tasks_md(path)
+            result = augment_tasks_md(path, store=shared_store())
             log.info("[FILE WATCHER] augmented → %s", result)
         except Exception as exc:
             log.error("[FILE WATCHER] augment failed: %s", exc)
@@ -0,0 +1,23 @@
+"""Executable lookup cached per $PATH value."""
+
+from __future__ import annotations
+
+import functools
+import os
+import shutil
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str, path: Optional[str]) -> Optional[str]:
+    return shutil.which(name, path=path)
+
+
+def find_executable(name: str) -> Optional[str]:
+    """Return the full path of ``name`` on $PATH, or None.
+
+    Each lookup stats every $PATH directory, so results are cached for the
+    process; the current $PATH is part of the key, so changing it (as tests
+    and virtualenv activations do) is still honoured.
+    """
+    return _which(name, os.environ.get("PATH"))
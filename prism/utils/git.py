@@ -1,48 +1,51 @@
 import subprocess
 from pathlib import Path
 
+# Resolved paths already known to be inside a work tree. Only positive
+# answers are kept: a directory can become a repo, but rarely stops being one.
+_KNOWN_REPOS: set[Path] = set()
 
-def is_git_repo(path: Path) -> bool:
+
+def _git(path: Path, *args: str) -> bool:
     result = subprocess.run(
-        ["git", "rev-parse", "--is-inside-work-tree"],
-        cwd=str(path), capture_output=True, text=True,
+        ["git", *args], cwd=str(path), capture_output=True, text=True,
     )
     return result.returncode == 0
 
 
+def is_git_repo(path: Path) -> bool:
+    resolved = path.resolve()
+    if resolved in _KNOWN_REPOS:
+        return True
+    # A .git entry in the directory or an ancestor answers without forking;
+    # anything else (GIT_DIR, odd layouts) still asks git itself
+    found = any((p / ".git").exists() for p in (resolved, *resolved.parents))
+    if found or _git(path, "rev-parse", "--is-inside-work-tree"):
+        _KNOWN_REPOS.add(resolved)
+        return True
+    return False
+
+
 def git_init(path: Path) -> bool:
-    result = subprocess.run(
-        ["git", "init"], cwd=str(path), capture_output=True, text=True,
-    )
-    return result.returncode == 0
+    if not _git(path, "init"):
+        return False
+    _KNOWN_REPOS.add(path.resolve())
+    return True
 
 
 def git_add_all(path: Path) -> bool:
-    result = subprocess.run(
-        ["git", "add", "."], cwd=str(path), capture_output=True, text=True,
-    )
-    return result.returncode == 0
+    return _git(path, "add", ".")
 
 
 def git_commit(path: Path, message: str) -> bool:
     if not git_add_all(path):
         return False
-    result = subprocess.run(
-        ["git", "commit", "-m", message],
-        cwd=str(path), capture_output=True, text=True,
-    )
-    return result.returncode == 0
+    return _git(path, "commit", "-m", message)
 
 
 def git_push(path: Path) -> bool:
-    result = subprocess.run(
-        ["git", "push"], cwd=str(path), capture_output=True, text=True,
-    )
-    return result.returncode == 0
+    return _git(path, "push")
 
 
 def git_pull(path: Path) -> bool:
-    result = subprocess.run(
-        ["git", "pull"], cwd=str(path), capture_output=True, text=True,
-    )
-    return result.returncode == 0
+    return _git(path, "pull")
@@ -3,11 +3,27 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
+import os
+import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
 
-from prism.config import load_global_config
+from prism import config as prism_config
+from prism.config import PrismConfig, load_global_config
+
+# ((config path, (mtime_ns, size) or None), parsed config) of the last load
+_CONFIG_CACHE: Optional[tuple[tuple, PrismConfig]] = None
+
+# (kind, path, resolved path, file stat, role, config key) ->
+# (expires_at, decision), least recently used first. Allow and deny results
+# are both kept: listings repeat the same checks, and most of them are denials.
+_DECISION_TTL = 60.0
+_DECISION_CACHE_SIZE = 10_000
+_DECISION_CACHE: OrderedDict[tuple, tuple[float, tuple[bool, str]]] = OrderedDict()
 
 
 @dataclass
@@ -23,23 +39,124 @@ class FilePermissions:
 
 def _matches_pattern(path: str, pattern: str) -> bool:
     """Check if a path matches a glob pattern."""
-    return fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(Path(path).name, pattern)
+    return _is_path_allowed(path, [pattern])
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+class _CompiledPatterns(NamedTuple):
+    """Glob patterns split by shape so most checks skip the regex."""
+
+    literals: frozenset[str]
+    prefixes: tuple[str, ...]  # "dir/*"
+    suffixes: tuple[str, ...]  # "*.ext"
+    regex: Optional[re.Pattern]  # everything else, unioned
+
+    def matches(self, text: str) -> bool:
+        return (
+            text in self.literals
+            or text.startswith(self.prefixes)
+            or text.endswith(self.suffixes)
+            or (self.regex is not None and self.regex.match(text) is not None)
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> _CompiledPatterns:
+    """Classify glob patterns once; the rest are unioned into one regex."""
+    literals, prefixes, suffixes, globs = set(), [], [], []
+    for pattern in map(os.path.normcase, patterns):
+        if _GLOB_CHARS.isdisjoint(pattern):
+            literals.add(pattern)
+        elif pattern.endswith("*") and _GLOB_CHARS.isdisjoint(pattern[:-1]):
+            prefixes.append(pattern[:-1])
+        elif pattern.startswith("*") and _GLOB_CHARS.isdisjoint(pattern[1:]):
+            suffixes.append(pattern[1:])
+        else:
+            globs.append(pattern)
+    regex = (
+        re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs))
+        if globs
+        else None
+    )
+    return _CompiledPatterns(frozenset(literals), tuple(prefixes), tuple(suffixes), regex)
 
 
 def _is_path_allowed(path: str, allowed_patterns: list[str]) -> bool:
     """Check if path matches any allowed pattern."""
-    for pattern in allowed_patterns:
-        if _matches_pattern(path, pattern):
-            return True
-    return False
+    # Same semantics as fnmatch on the full path or its basename
+    # (fnmatch's "*" also crosses "/"), without a per-pattern loop
+    compiled = _compile_patterns(tuple(allowed_patterns))
+    path = os.path.normcase(path)
+    name = os.path.basename(path.rstrip(os.sep))
+    return compiled.matches(path) or compiled.matches(name)
 
 
 def _is_path_protected(path: str, protected_patterns: list[str]) -> bool:
     """Check if path matches any protected pattern."""
-    for pattern in protected_patterns:
-        if _matches_pattern(path, pattern):
-            return True
-    return False
+    return _is_path_allowed(path, protected_patterns)
+
+
+def _load_config() -> PrismConfig:
+    """``load_global_config()``, reparsed only when the config file changes.
+
+    Permission checks run per file during listings, so re-reading and
+    validating the YAML on every call dominated their cost.
+    """
+    global _CONFIG_CACHE
+    path = prism_config.GLOBAL_CONFIG_PATH
+    try:
+        st = os.stat(path)
+        key = (path, (st.st_mtime_ns, st.st_size))
+    except OSError:
+        key = (path, None)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == key:
+        return _CONFIG_CACHE[1]
+    config = load_global_config()
+    _CONFIG_CACHE = (key, config)
+    return config
+
+
+def invalidate_cache() -> None:
+    """Drop the cached config and decisions, e.g. after rewriting the config."""
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
+    _DECISION_CACHE.clear()
+
+
+def _cached_decision(
+    kind: str,
+    path: Path,
+    role: Optional[str],
+    check: Callable[[Path, Optional[str], PrismConfig], tuple[bool, str]],
+) -> tuple[bool, str]:
+    """Run ``check`` for a path, reusing its decision for ``_DECISION_TTL``.
+
+    The key includes the config file's identity and the target's
+    ``(mtime_ns, size)``, so editing either takes effect immediately. The
+    resolved path keeps a relative path from reusing a decision made in
+    another working directory.
+    """
+    config = _load_config()
+    resolved = path.resolve()
+    try:
+        st = os.stat(resolved)
+        stat_key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stat_key = None
+    key = (kind, str(path), str(resolved), stat_key, role, _CONFIG_CACHE[0])
+    now = time.monotonic()
+    hit = _DECISION_CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        _DECISION_CACHE.move_to_end(key)
+        return hit[1]
+    decision = check(path, role, config)
+    _DECISION_CACHE[key] = (now + _DECISION_TTL, decision)
+    _DECISION_CACHE.move_to_end(key)
+    if len(_DECISION_CACHE) > _DECISION_CACHE_SIZE:
+        _DECISION_CACHE.popitem(last=False)
+    return decision
 
 
 def can_read_file(
@@ -58,14 +175,16 @@ def can_read_file(
         - reason: Explanation of the decision
     """
     path = Path(file_path)
-    path_str = str(path)
 
     # If explicit permission granted, always allow
     if explicit_permission:
         return True, "Explicit permission granted"
 
-    # Load configuration
-    config = load_global_config()
+    return _cached_decision("read", path, role, _check_read)
+
+
+def _check_read(path: Path, role: Optional[str], config: PrismConfig) -> tuple[bool, str]:
+    path_str = str(path)
     perm_config = getattr(config, "permissions", None)
 
     if not perm_config:
@@ -118,7 +237,7 @@ def get_permissions_summary(role: Optional[str] = None) -> dict:
     Returns:
         Dictionary with permission settings
     """
-    config = load_global_config()
+    config = _load_config()
     perm_config = getattr(config, "permissions", {})
 
     summary = {
@@ -140,6 +259,27 @@ def get_permissions_summary(role: Optional[str] = None) -> dict:
     return summary
 
 
+def _validation_report(
+    path: str, allowed: list[str], protected: list[str], verdict_key: str
+) -> dict:
+    """Shared body of the read/write validators; each match is computed once."""
+    is_allowed = _is_path_allowed(path, allowed)
+    is_protected = _is_path_protected(path, protected)
+    return {
+        "path": path,
+        "is_allowed": is_allowed,
+        "is_protected": is_protected,
+        verdict_key: is_allowed and not is_protected,
+        # Per-pattern detail is only needed when the union matched at all
+        "matching_allow_patterns": (
+            [p for p in allowed if _matches_pattern(path, p)] if is_allowed else []
+        ),
+        "matching_protect_patterns": (
+            [p for p in protected if _matches_pattern(path, p)] if is_protected else []
+        ),
+    }
+
+
 def validate_path_for_auto_read(path: str) -> dict:
     """Validate a specific path and return detailed info.
 
@@ -149,25 +289,13 @@ def validate_path_for_auto_read(path: str) -> dict:
     Returns:
         Dictionary with validation results
     """
-    config = load_global_config()
+    config = _load_config()
     perm_config = getattr(config, "permissions", {})
 
     auto_read_paths = perm_config.get("auto_read_paths", [])
     protected_paths = perm_config.get("protected_paths", [])
 
-    return {
-        "path": path,
-        "is_allowed": _is_path_allowed(path, auto_read_paths),
-        "is_protected": _is_path_protected(path, protected_paths),
-        "can_auto_read": _is_path_allowed(path, auto_read_paths)
-        and not _is_path_protected(path, protected_paths),
-        "matching_allow_patterns": [
-            p for p in auto_read_paths if _matches_pattern(path, p)
-        ],
-        "matching_protect_patterns": [
-            p for p in protected_paths if _matches_pattern(path, p)
-        ],
-    }
+    return _validation_report(path, auto_read_paths, protected_paths, "can_auto_read")
 
 
 def can_write_file(
@@ -186,14 +314,16 @@ def can_write_file(
         - reason: Explanation of the decision
     """
     path = Path(file_path)
-    path_str = str(path)
 
     # If explicit permission granted, always allow
     if explicit_permission:
         return True, "Explicit permission granted"
 
-    # Load configuration
-    config = load_global_config()
+    return _cached_decision("write", path, role, _check_write)
+
+
+def _check_write(path: Path, role: Optional[str], config: PrismConfig) -> tuple[bool, str]:
+    path_str = str(path)
     perm_config = getattr(config, "permissions", None)
 
     if not perm_config:
@@ -246,7 +376,7 @@ def get_write_permissions_summary(role: Optional[str] = None) -> dict:
     Returns:
         Dictionary with write permission settings
     """
-    config = load_global_config()
+    config = _load_config()
     perm_config = getattr(config, "permissions", {})
     write_config = perm_config.get("write_permissions", {})
 
@@ -279,26 +409,16 @@ def validate_path_for_auto_write(path: str) -> dict:
     Returns:
         Dictionary with validation results
     """
-    config = load_global_config()
+    config = _load_config()
     perm_config = getattr(config, "permissions", {})
     write_config = perm_config.get("write_permissions", {})
 
     auto_write_paths = write_config.get("auto_write_paths", [])
     protected_write_paths = write_config.get("protected_write_paths", [])
 
-    return {
-        "path": path,
-        "is_allowed": _is_path_allowed(path, auto_write_paths),
-        "is_protected": _is_path_protected(path, protected_write_paths),
-        "can_auto_write": _is_path_allowed(path, auto_write_paths)
-        and not _is_path_protected(path, protected_write_paths),
-        "matching_allow_patterns": [
-            p for p in auto_write_paths if _matches_pattern(path, p)
-        ],
-        "matching_protect_patterns": [
-            p for p in protected_write_paths if _matches_pattern(path, p)
-        ],
-    }
+    return _validation_report(
+        path, auto_write_paths, protected_write_paths, "can_auto_write"
+    )
 
 
 def get_full_permissions_summary(role: Optional[str] = None) -> dict:
@@ -1,16 +1,37 @@
+import os
 from pathlib import Path
 
 import yaml
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# path -> ((mtime_ns, size), parsed data)
+_YAML_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
 
 def read_yaml(path: Path) -> dict:
-    if not path.exists():
+    """Parse a YAML mapping, reusing the last result while the file is unchanged.
+
+    The returned dict is shared between callers; treat it as read-only.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _YAML_CACHE.pop(path, None)
         return {}
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    # Binary handle: libyaml decodes the bytes itself
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    _YAML_CACHE[path] = (key, data)
+    return data
 
 
 def write_yaml(path: Path, data: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w") as f:
         yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+    _YAML_CACHE.pop(path, None)
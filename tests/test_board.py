@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -177,9 +178,9 @@ def test_augment_adds_prism_context(sample_tasks_md, tmp_path, mem_dir):
         with patch("prism.spec.augmenter.load_global_config") as mock_cfg:
             mock_cfg.return_value.memory.embeddings_enabled = False
             with patch("prism.spec.augmenter.SkillStore") as MockStore:
-                MockStore.return_value.__enter__.return_value.search.return_value = [
-                    MagicMock(skill=skill)
-                ]
+                MockStore.return_value.__enter__.return_value.search_batch.side_effect = (
+                    lambda queries, top_k: [[MagicMock(skill=skill)] for _ in queries]
+                )
                 output = augment_tasks_md(sample_tasks_md)
 
     assert output.exists()
@@ -204,11 +205,94 @@ def test_augment_force_overwrites(sample_tasks_md, tmp_path, mem_dir):
         with patch("prism.spec.augmenter.load_global_config") as mock_cfg:
             mock_cfg.return_value.memory.embeddings_enabled = False
             with patch("prism.spec.augmenter.SkillStore") as MockStore:
-                MockStore.return_value.__enter__.return_value.search.return_value = []
+                MockStore.return_value.__enter__.return_value.search_batch.return_value = []
                 result = augment_tasks_md(sample_tasks_md, force=True)
     assert "old content" not in result.read_text()
 
 
+def test_is_augmented_checks_only_the_head(tmp_path):
+    from prism.spec.augmenter import is_augmented
+    path = tmp_path / "tasks.prism.md"
+    assert is_augmented(path) is False
+    path.write_text("<!-- PRISM AUGMENTED -->\n" + "x" * 100_000)
+    assert is_augmented(path) is True
+    path.write_text("x" * 200 + "<!-- PRISM AUGMENTED -->")
+    assert is_augmented(path) is False
+
+
+def test_augment_uses_injected_store(sample_tasks_md):
+    from prism.spec.augmenter import augment_tasks_md
+    store = MagicMock()
+    store.search_batch.return_value = []
+    with patch("prism.spec.augmenter.SkillStore") as MockStore:
+        augment_tasks_md(sample_tasks_md, force=True, store=store)
+    MockStore.assert_not_called()
+    store.search_batch.assert_called_once()
+
+
+def test_augment_removes_temp_file_on_failure(sample_tasks_md):
+    from prism.spec.augmenter import augment_tasks_md
+    store = MagicMock()
+    store.search_batch.return_value = []
+    with patch("prism.spec.augmenter.shutil.copyfileobj", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            augment_tasks_md(sample_tasks_md, force=True, store=store)
+    assert not sample_tasks_md.with_name("tasks.prism.tmp").exists()
+
+
+def test_context_block_counts_tokens_only_near_budget():
+    from prism.spec.augmenter import _PER_TASK_BUDGET, _context_block
+    fm = SkillFrontmatter(
+        skill_id="jwt-auth", type="skill", domain_tags=["auth"],
+        scope="global", created=date(2026, 2, 21), project_origin="test",
+    )
+    short = [MagicMock(skill=Skill(fm, "JWT Auth", "", None))] * 3
+    long = [MagicMock(skill=Skill(fm, "x" * _PER_TASK_BUDGET, "", None))] * 3
+    task = MagicMock(title="Login")
+    with patch("prism.spec.augmenter.count_tokens", side_effect=lambda t: len(t) // 4) as counter:
+        assert _context_block(task, short).count("jwt-auth") == 3
+        counter.assert_not_called()
+        assert _context_block(task, long).count("jwt-auth") == 3
+        assert counter.called
+
+
+def test_find_latest_tasks_md_picks_newest(tmp_path):
+    from prism.spec.augmenter import find_latest_tasks_md
+    assert find_latest_tasks_md(tmp_path) is None
+    for n, name in enumerate(["001-auth", "002-billing", "003-search"]):
+        path = tmp_path / name / "tasks.md"
+        path.parent.mkdir()
+        path.write_text("# Tasks")
+        os.utime(path, (1000 + n, 1000 + n))
+    os.utime(tmp_path / "002-billing" / "tasks.md", (5000, 5000))
+    assert find_latest_tasks_md(tmp_path) == tmp_path / "002-billing" / "tasks.md"
+
+
+def test_watcher_debounces_burst_into_one_augment(monkeypatch):
+    import threading
+
+    from prism.spec import watcher
+
+    monkeypatch.setattr(watcher, "_DEBOUNCE", 0.05)
+    handler = watcher._DebounceHandler()
+    done = threading.Event()
+    calls = []
+    handler._augment = lambda path: (calls.append(path), done.set())
+
+    def event(path, event_type="modified", is_directory=False):
+        return MagicMock(src_path=path, event_type=event_type, is_directory=is_directory)
+
+    for name in ("a", "b", "c"):
+        handler.dispatch(event(f"/specs/{name}/tasks.md"))
+    handler.dispatch(event("/specs/c/notes.md"))
+    handler.dispatch(event("/specs/d/mytasks.md"))
+    handler.dispatch(event("/specs/e/tasks.md", event_type="opened"))
+    handler.dispatch(event("/specs/f/tasks.md", is_directory=True))
+    assert done.wait(timeout=5)
+    assert calls == [Path("/specs/c/tasks.md")]
+    assert handler._worker.is_alive()
+
+
 # ── 2.4 Sync / task_mapper ────────────────────────────────────────────────────
 
 def test_parse_tasks_md_extracts_epics(sample_tasks_md):
@@ -382,6 +466,15 @@ def test_normalize_mapping_migrates_strings():
     assert mapping["__epic__Auth"] == "e-1"
 
 
+def test_save_mapping_tags_schema(tmp_path):
+    from prism.cli.sync import _MAPPING_SCHEMA, _load_project_data, _save_mapping
+
+    (tmp_path / ".prism").mkdir()
+    _save_mapping(tmp_path, {"Login": {"flux_id": "t-1", "content_hash": ""}})
+    data = _load_project_data(tmp_path)
+    assert data["flux_task_map_schema"] == _MAPPING_SCHEMA
+
+
 def test_sync_epics_returns_dict_counts(sample_tasks_md):
     epics = _parse_epics(sample_tasks_md.read_text())
     mapping: dict = {}
@@ -126,3 +126,114 @@ def test_resolve_agent_roles_project_adds_new_role():
     roles = resolve_agent_roles(global_cfg, project_cfg)
     assert "developer" in roles
     assert roles["developer"].default.tool == "cursor"
+
+
+def test_permission_patterns_match_path_or_basename():
+    from prism.utils.permissions import _is_path_allowed, _is_path_protected
+
+    patterns = ["src/*", "*.env", "Makefile"]
+    assert _is_path_allowed("src/app.py", patterns)
+    assert _is_path_allowed("deploy/prod.env", patterns)
+    assert _is_path_allowed("tools/Makefile", patterns)
+    assert not _is_path_allowed("lib/src/app.py", patterns)
+    assert not _is_path_protected("README.md", patterns)
+    assert not _is_path_allowed("anything", [])
+
+
+def test_permission_patterns_skip_regex_for_simple_globs():
+    from prism.utils.permissions import _compile_patterns
+
+    compiled = _compile_patterns((".env", "build/*", "*.key", "src/*.py"))
+    assert compiled.literals == {".env"}
+    assert compiled.prefixes == ("build/",)
+    assert compiled.suffixes == (".key",)
+    assert compiled.regex.pattern.count("(?:") == 1
+    assert compiled.matches("src/app.py") and not compiled.matches("lib/app.py")
+
+
+def test_permission_config_reparsed_only_on_change(tmp_prism_global):
+    import os
+
+    from prism.utils.permissions import _load_config, invalidate_cache
+
+    invalidate_cache()
+    config_path = tmp_prism_global / "prism.config.yaml"
+    config_path.write_text('version: "2.0"\n')
+    first = _load_config()
+    assert _load_config() is first
+    config_path.write_text('version: "3.0"\n')
+    os.utime(config_path, ns=(0, 0))
+    assert _load_config().version == "3.0"
+    invalidate_cache()
+
+
+def test_permission_decisions_cached_until_invalidated(tmp_prism_global, tmp_path):
+    from unittest.mock import patch
+
+    from prism.utils.permissions import can_read_file, invalidate_cache
+
+    invalidate_cache()
+    target = tmp_path / "notes.md"
+    with patch("prism.utils.permissions._check_read", return_value=(False, "denied")) as check:
+        assert can_read_file(target) == (False, "denied")
+        assert can_read_file(target) == (False, "denied")
+        assert check.call_count == 1
+        invalidate_cache()
+        can_read_file(target)
+        assert check.call_count == 2
+    invalidate_cache()
+
+
+def test_permission_decision_follows_file_changes_and_cwd(tmp_prism_global, tmp_path, monkeypatch):
+    import os
+    from unittest.mock import patch
+
+    from prism.utils.permissions import can_read_file, invalidate_cache
+
+    invalidate_cache()
+    for sub in ("a", "b"):
+        (tmp_path / sub).mkdir()
+        (tmp_path / sub / "notes.md").write_text("x")
+    monkeypatch.chdir(tmp_path / "a")
+    with patch("prism.utils.permissions._check_read", return_value=(True, "ok")) as check:
+        can_read_file("notes.md")
+        (tmp_path / "a" / "notes.md").write_text("x" * 2048)
+        os.utime(tmp_path / "a" / "notes.md", ns=(0, 0))
+        can_read_file("notes.md")
+        assert check.call_count == 2
+        monkeypatch.chdir(tmp_path / "b")
+        can_read_file("notes.md")
+        assert check.call_count == 3
+    invalidate_cache()
+
+
+def test_validate_path_reports_matching_patterns(tmp_prism_global):
+    from unittest.mock import MagicMock, patch
+
+    from prism.utils.permissions import validate_path_for_auto_read
+
+    config = MagicMock(permissions={"auto_read_paths": ["*.md", "docs/*"], "protected_paths": []})
+    with patch("prism.utils.permissions._load_config", return_value=config):
+        report = validate_path_for_auto_read("docs/intro.md")
+    assert report["can_auto_read"] is True
+    assert report["is_protected"] is False
+    assert report["matching_allow_patterns"] == ["*.md", "docs/*"]
+    assert report["matching_protect_patterns"] == []
+
+
+def test_read_yaml_reparses_only_on_change(tmp_path):
+    import os
+    from unittest.mock import patch
+
+    from prism.utils.yaml_utils import read_yaml
+
+    path = tmp_path / "conf.yaml"
+    assert read_yaml(path) == {}
+    path.write_text("a: 1\n")
+    assert read_yaml(path) == {"a": 1}
+    with patch("prism.utils.yaml_utils.yaml.load") as load:
+        assert read_yaml(path) == {"a": 1}
+    load.assert_not_called()
+    path.write_text("a: 2\n")
+    os.utime(path, ns=(0, 0))
+    assert read_yaml(path) == {"a": 2}
@@ -1,13 +1,16 @@
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from prism.project import (
+    check_docker,
     create_prism_dir,
     has_existing_code,
     has_prism_spec,
     init_global_memory,
     init_project,
+    render_template,
     seed_skills,
     write_prism_files,
 )
@@ -33,6 +36,13 @@ def test_init_global_memory_creates_subdirs(tmp_prism_global):
     assert (memory_dir / "episodes").exists()
 
 
+def test_init_global_memory_skips_mkdir_once_ready(tmp_prism_global):
+    init_global_memory()
+    with patch("prism.project.os.makedirs") as makedirs:
+        init_global_memory()
+    makedirs.assert_not_called()
+
+
 def test_has_prism_spec_false(tmp_path):
     assert has_prism_spec(tmp_path) is False
 
@@ -60,6 +70,19 @@ def test_has_existing_code_detects_typescript(tmp_path):
     assert has_existing_code(tmp_path) is True
 
 
+def test_has_existing_code_ignores_vendored_dirs(tmp_path):
+    (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "lib" / "index.js").write_text("")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "site.py").write_text("")
+    (tmp_path / "venv").mkdir()
+    (tmp_path / "venv" / "site.py").write_text("")
+    assert has_existing_code(tmp_path) is False
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.go").write_text("")
+    assert has_existing_code(tmp_path) is True
+
+
 def test_seed_skills_copies_all_seeds(tmp_prism_global):
     memory_dir = init_global_memory()
     count = seed_skills(memory_dir)
@@ -131,3 +154,67 @@ def test_init_project_creates_global_config(tmp_path, tmp_prism_global):
     init_project(project_dir)
     config_path = tmp_prism_global / "prism.config.yaml"
     assert config_path.exists()
+
+
+def test_check_docker_looks_up_path_once_per_path(monkeypatch):
+    from prism.utils.executables import _which
+
+    _which.cache_clear()
+    monkeypatch.setenv("PATH", "/opt/a")
+    with patch("shutil.which", return_value="/opt/a/docker") as which:
+        assert check_docker() is True
+        assert check_docker() is True
+        assert which.call_count == 1
+        monkeypatch.setenv("PATH", "/opt/b")
+        check_docker()
+        assert which.call_count == 2
+    _which.cache_clear()
+
+
+def test_schedule_resolves_prism_without_forking(monkeypatch):
+    from prism.cli.schedule import _get_prism_path
+    from prism.utils.executables import _which
+
+    _which.cache_clear()
+    monkeypatch.setenv("PATH", "/opt/a")
+    with patch("shutil.which", return_value=None), patch("subprocess.run") as run:
+        assert _get_prism_path() == "~/.local/bin/prism"
+    run.assert_not_called()
+    _which.cache_clear()
+
+
+def test_render_template_keeps_braces_and_unknown_placeholders(tmp_path, monkeypatch):
+    (tmp_path / "t.template").write_text("{a: 1} {{ name }} {{ other }} {{name}}")
+    monkeypatch.setattr("prism.project.TEMPLATES_DIR", tmp_path)
+    assert render_template("t.template", {"name": "x{y}"}) == (
+        "{a: 1} x{y} {{ other }} x{y}"
+    )
+
+
+def test_render_template_rereads_edited_template(tmp_path, monkeypatch):
+    import os
+
+    template = tmp_path / "t.template"
+    template.write_text("v1 {{ name }}")
+    monkeypatch.setattr("prism.project.TEMPLATES_DIR", tmp_path)
+    assert render_template("t.template", {"name": "x"}) == "v1 x"
+    with patch("pathlib.Path.read_text") as read_text:
+        assert render_template("t.template", {"name": "y"}) == "v1 y"
+    read_text.assert_not_called()
+
+    template.write_text("v2 {{ name }}")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert render_template("t.template", {"name": "x"}) == "v2 x"
+
+
+def test_is_git_repo_answers_from_dot_git_without_forking(tmp_path):
+    from prism.utils.git import is_git_repo
+
+    (tmp_path / ".git").mkdir()
+    nested = tmp_path / "src" / "pkg"
+    nested.mkdir(parents=True)
+    with patch("subprocess.run") as run:
+        assert is_git_repo(nested) is True
+        assert is_git_repo(nested) is True
+    run.assert_not_called()
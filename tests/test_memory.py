@@ -31,6 +31,12 @@ def _make_skill(skill_id: str = "test-skill", tags: list[str] | None = None) ->
     return Skill(frontmatter=fm, title="Test Skill", content="# Test Skill\n\nKey insight here.")
 
 
+@pytest.fixture(autouse=True)
+def _no_model_warmup(monkeypatch):
+    # The warmup thread would otherwise race tests that patch _load_model
+    monkeypatch.setattr("prism.memory.store._warm_model", lambda: None)
+
+
 @pytest.fixture
 def db_path(tmp_path) -> Path:
     return tmp_path / "index.db"
@@ -112,6 +118,106 @@ def test_store_search_returns_empty_for_no_match(db_path, mem_dir):
     assert results == []
 
 
+def test_store_uses_wal_and_pooled_readers(db_path, mem_dir):
+    from concurrent.futures import ThreadPoolExecutor
+
+    skill = _make_skill()
+    skill.file_path = save_skill_to_file(skill, mem_dir)
+    with SkillStore(db_path, readers=2) as store:
+        store.upsert(skill)
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        with ThreadPoolExecutor(4) as pool:
+            counts = list(pool.map(lambda _: store.count(), range(8)))
+        assert counts == [1] * 8
+        assert len(store._opened) <= 2
+
+
+def test_store_search_filters_by_status(db_path, mem_dir):
+    active = _make_skill(skill_id="active-skill")
+    stale = _make_skill(skill_id="stale-skill")
+    stale.frontmatter.status = "deprecated"
+    with SkillStore(db_path) as store:
+        for s in (active, stale):
+            s.file_path = save_skill_to_file(s, mem_dir)
+            store.upsert(s)
+        assert len(store.search("insight")) == 2
+        results = store.search("insight", status="active")
+    assert [r.skill.frontmatter.skill_id for r in results] == ["active-skill"]
+
+
+def test_store_warms_model_in_background(db_path):
+    import threading
+
+    warmed = threading.Event()
+    with patch("prism.memory.store._warm_model", side_effect=warmed.set):
+        with SkillStore(db_path, embeddings_enabled=True):
+            assert warmed.wait(timeout=5)
+
+
+def test_store_search_loads_only_top_k_files(db_path, mem_dir):
+    with SkillStore(db_path) as store:
+        for i in range(5):
+            s = _make_skill(skill_id=f"skill-{i}", tags=["python"])
+            s.file_path = save_skill_to_file(s, mem_dir)
+            store.upsert(s)
+        with patch(
+            "prism.memory.store.load_skill_from_file", wraps=load_skill_from_file
+        ) as loader:
+            results = store.search("insight", top_k=2)
+    assert len(results) == 2
+    assert loader.call_count == 2
+
+
+def test_store_upsert_many(db_path, mem_dir):
+    skills = []
+    for i in range(3):
+        s = _make_skill(skill_id=f"skill-{i}", tags=["python"])
+        s.file_path = save_skill_to_file(s, mem_dir)
+        skills.append(s)
+    with SkillStore(db_path) as store:
+        store.upsert_many(skills + skills[:1])
+        assert store.count() == 3
+        assert len(store.search("insight")) == 3
+
+
+def test_upsert_many_skips_model_for_unchanged_skills(db_path, mem_dir, monkeypatch):
+    import prism.memory.store as store_mod
+
+    monkeypatch.setattr(store_mod, "_MAX_SQL_VARS", 2)
+    skills = [_make_skill(skill_id=f"skill-{i}", tags=["python"]) for i in range(5)]
+    model = _FakeEncoder()
+    with SkillStore(db_path, embeddings_enabled=True) as store:
+        with patch("prism.memory.store._load_model", return_value=model) as loader:
+            store.upsert_many(skills)
+            assert len(model.calls) == 1
+            store.upsert_many(skills)
+    assert loader.call_count == 1
+
+
+def test_store_rekeys_legacy_fts_rows(db_path, mem_dir):
+    import sqlite3
+
+    skill = _make_skill()
+    skill.file_path = save_skill_to_file(skill, mem_dir)
+    with SkillStore(db_path) as store:
+        store.upsert(skill)
+    conn = sqlite3.connect(db_path)
+    conn.execute("DELETE FROM skills_fts")
+    conn.execute(
+        "INSERT INTO skills_fts(rowid, skill_id, title, content, domain_tags, type, status, stack_context) "
+        "VALUES (1, 'test-skill', 'Test Skill', 'Key insight here.', 'python', 'skill', 'active', '')"
+    )
+    conn.execute("PRAGMA user_version = 1")
+    conn.commit()
+    conn.close()
+
+    with SkillStore(db_path) as store:
+        store.upsert(skill)
+        assert store._conn.execute("SELECT COUNT(*) FROM skills_fts").fetchone()[0] == 1
+        store.delete("test-skill")
+        assert store.search("insight") == []
+
+
 def test_store_delete(db_path, mem_dir):
     skill = _make_skill()
     skill.file_path = save_skill_to_file(skill, mem_dir)
@@ -141,6 +247,192 @@ def test_store_clear(db_path, mem_dir):
         assert store.count() == 0
 
 
+class _FakeEncoder:
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        import numpy as np
+        self.calls.append(texts)
+        if isinstance(texts, str):
+            return np.ones(4, dtype=np.float32)
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+def test_hybrid_rerank_batches_uncached_candidates(db_path, mem_dir):
+    model = _FakeEncoder()
+    with SkillStore(db_path, embeddings_enabled=True) as store:
+        with patch("prism.memory.store._load_model", return_value=None):
+            for i in range(3):
+                s = _make_skill(skill_id=f"skill-{i}", tags=["python"])
+                s.file_path = save_skill_to_file(s, mem_dir)
+                store.upsert(s)
+        with patch("prism.memory.store._load_model", return_value=model):
+            results = store.search("insight")
+            assert len(results) == 3
+            assert all(r.semantic_score == pytest.approx(1.0) for r in results)
+            # query + one call for all three candidates
+            assert len(model.calls) == 2
+            store.search("insight")
+    # embeddings were persisted, so only the query is encoded the second time
+    assert len(model.calls) == 3
+
+
+def test_search_batch_encodes_queries_once(db_path, mem_dir):
+    model = _FakeEncoder()
+    with SkillStore(db_path, embeddings_enabled=True) as store:
+        with patch("prism.memory.store._load_model", return_value=None):
+            for i in range(3):
+                s = _make_skill(skill_id=f"skill-{i}", tags=["python"])
+                s.file_path = save_skill_to_file(s, mem_dir)
+                store.upsert(s)
+        with patch("prism.memory.store._load_model", return_value=model):
+            found = store.search_batch(["insight", "nothing-matches", "key insight"], top_k=2)
+    assert [len(results) for results in found] == [2, 0, 2]
+    # one batch for both matching queries, one for the uncached candidates
+    assert model.calls[0] == ["insight", "key insight"]
+    assert len(model.calls) == 2
+
+
+def test_embeddings_from_another_model_are_recomputed(db_path, mem_dir):
+    model = _FakeEncoder()
+    with SkillStore(db_path, embeddings_enabled=True) as store:
+        with patch("prism.memory.store._load_model", return_value=model):
+            for i in range(2):
+                s = _make_skill(skill_id=f"skill-{i}", tags=["python"])
+                s.file_path = save_skill_to_file(s, mem_dir)
+                store.upsert(s)
+            assert len(model.calls) == 2
+            with patch("prism.memory.store._model_name", return_value="int8-model"):
+                store.search("insight")
+                # query + both candidates: fp32 rows are not reused for an int8 query
+                assert len(model.calls) == 4
+                models = {r[0] for r in store._conn.execute("SELECT model FROM skill_embeddings")}
+                assert models == {"int8-model"}
+                store.search("insight")
+                assert len(model.calls) == 5
+
+
+def test_content_hash_accepts_legacy_md5():
+    import hashlib
+    from prism.memory.store import _content_hash, _hash_matches
+
+    text = "Title body"
+    assert _hash_matches(_content_hash(text), text)
+    assert _hash_matches(hashlib.md5(text.encode()).hexdigest(), text)
+    assert not _hash_matches(_content_hash(text), "Title changed")
+
+
+def test_onnx_encoder_mean_pools_over_mask():
+    import numpy as np
+    from prism.memory.onnx_encoder import OnnxEncoder
+
+    session = MagicMock()
+    session.get_inputs.return_value = [MagicMock(), MagicMock()]
+    session.get_inputs.return_value[0].name = "input_ids"
+    session.get_inputs.return_value[1].name = "attention_mask"
+    session.run.side_effect = lambda _, feeds: [
+        feeds["input_ids"][..., None].astype(np.float32).repeat(2, axis=2)
+    ]
+    tokenizer = MagicMock(return_value={
+        "input_ids": np.array([[2, 4, 0]]),
+        "attention_mask": np.array([[1, 1, 0]]),
+    })
+
+    emb = OnnxEncoder(session, tokenizer).encode("text")
+    assert emb.tolist() == [3.0, 3.0]
+
+
+def test_onnx_model_is_prepared_only_outside_the_load_path(tmp_path, caplog):
+    from prism.memory import onnx_encoder
+
+    with patch.object(onnx_encoder, "_onnx_available", return_value=True), patch.object(
+        onnx_encoder, "_ensure_int8_model", side_effect=OSError("offline")
+    ) as ensure:
+        assert onnx_encoder.load_onnx_encoder(tmp_path) is None
+        ensure.assert_not_called()
+        assert onnx_encoder.prepare_onnx_model(tmp_path) is None
+    assert "offline" in caplog.text
+
+
+def test_vec_similarities_scores_in_sql(db_path):
+    import numpy as np
+    from prism.memory.store import _vec_similarities
+
+    def distance(a, b):
+        va, vb = np.frombuffer(a, np.float32), np.frombuffer(b, np.float32)
+        return 1 - float(va @ vb / (np.linalg.norm(va) * np.linalg.norm(vb)))
+
+    with SkillStore(db_path) as store:
+        conn = store._conn
+        conn.create_function("vec_distance_cosine", 2, distance)
+        conn.execute(
+            "INSERT INTO skill_embeddings VALUES (?,?,?,?,?)",
+            ("a", np.array([1, 0], np.float32).tobytes(), "m", "h", "t"),
+        )
+        sims = _vec_similarities(conn, ["a", "b"], np.array([1, 0], np.float32), "m")
+    assert sims == {"a": pytest.approx(1.0)}
+
+
+def test_store_migrates_pickled_embeddings(db_path):
+    import pickle
+    import sqlite3
+
+    import numpy as np
+    from prism.memory.store import _get_cached_embedding
+
+    vec = np.arange(4, dtype=np.float32)
+    with SkillStore(db_path):
+        pass
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO skill_embeddings VALUES (?,?,?,?,?)",
+        ("legacy", pickle.dumps(vec), "m", "h", "2026-01-01"),
+    )
+    conn.execute("PRAGMA user_version = 0")
+    conn.commit()
+    conn.close()
+
+    with SkillStore(db_path) as store:
+        blob = store._conn.execute("SELECT embedding FROM skill_embeddings").fetchone()[0]
+        assert blob == vec.tobytes()
+        assert np.array_equal(_get_cached_embedding(store._conn, "legacy"), vec)
+
+
+def test_store_migration_survives_blocked_and_corrupt_embeddings(db_path, mem_dir):
+    import sqlite3
+
+    from prism.memory.store import _fts_rowid
+
+    skill = _make_skill()
+    skill.file_path = save_skill_to_file(skill, mem_dir)
+    with SkillStore(db_path) as store:
+        store.upsert(skill)
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO skills_fts(rowid, skill_id, title, content, domain_tags, type, status, stack_context) "
+        "VALUES (1, 'test-skill', 'Old title', 'Old content.', 'python', 'skill', 'active', '')"
+    )
+    conn.execute(
+        "INSERT INTO skill_embeddings VALUES (?,?,?,?,?)",
+        ("broken", b"not a pickle", "m", "h", "2026-01-01"),
+    )
+    conn.execute("PRAGMA user_version = 0")
+    conn.commit()
+    conn.close()
+
+    with patch("pickle.loads", side_effect=ImportError("numpy")):
+        with SkillStore(db_path) as store:
+            rowids = [r[0] for r in store._conn.execute("SELECT rowid FROM skills_fts")]
+            assert rowids == [_fts_rowid("test-skill")]
+            assert store._conn.execute("PRAGMA user_version").fetchone()[0] == 0
+
+    with SkillStore(db_path) as store:
+        assert store._conn.execute("PRAGMA user_version").fetchone()[0] == 2
+        assert store._conn.execute("SELECT COUNT(*) FROM skill_embeddings").fetchone()[0] == 0
+        assert len(store.search("insight")) == 1
+
+
 # ── File I/O ─────────────────────────────────────────────────────────────────
 
 def test_save_and_load_roundtrip(mem_dir):
@@ -153,6 +445,43 @@ def test_save_and_load_roundtrip(mem_dir):
     assert loaded.frontmatter.domain_tags == ["python", "testing"]
 
 
+def test_load_skill_reuses_parse_until_file_changes(mem_dir):
+    from prism.memory.store import _split_frontmatter
+
+    skill = _make_skill()
+    path = save_skill_to_file(skill, mem_dir)
+    with patch("prism.memory.store._split_frontmatter", wraps=_split_frontmatter) as loader:
+        first = load_skill_from_file(path)
+        first.frontmatter.reuse_count = 99
+        second = load_skill_from_file(path)
+        assert loader.call_count == 1
+        assert second.frontmatter.reuse_count == 0
+
+        skill.content += "\n\nMore detail."
+        save_skill_to_file(skill, mem_dir)
+        assert "More detail" in load_skill_from_file(path).content
+        assert loader.call_count == 2
+
+
+def test_frontmatter_format_matches_python_frontmatter():
+    import frontmatter
+    from prism.memory.store import _format_frontmatter, _split_frontmatter
+
+    skill = _make_skill()
+    metadata = skill.frontmatter.model_dump(mode="json")
+    text = _format_frontmatter(metadata, skill.content)
+    assert text == frontmatter.dumps(frontmatter.Post(skill.content, **metadata))
+    post = frontmatter.loads(text)
+    assert _split_frontmatter(text) == (post.metadata, post.content)
+
+
+def test_load_skill_normalizes_crlf(mem_dir):
+    path = save_skill_to_file(_make_skill(), mem_dir)
+    path.write_bytes(path.read_bytes().replace(b"\n", b"\r\n"))
+    loaded = load_skill_from_file(path)
+    assert loaded.content == "# Test Skill\n\nKey insight here."
+
+
 def test_load_skill_missing_file(tmp_path):
     result = load_skill_from_file(tmp_path / "nonexistent.md")
     assert result is None
@@ -268,6 +597,26 @@ def test_evaluator_handles_malformed_response(monkeypatch):
     assert result.decision == "NOOP"
 
 
+def test_evaluate_batch_keeps_input_order(monkeypatch):
+    from prism.memory.evaluator import evaluate_batch
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+
+    def entry(idx, decision):
+        e = MagicMock(custom_id=f"req-{idx}")
+        e.result.type = "succeeded"
+        e.result.message.content = [MagicMock(text=json.dumps({"decision": decision}))]
+        return e
+
+    with patch("anthropic.Anthropic") as MockClient:
+        batches = MockClient.return_value.messages.batches
+        batches.create.return_value = MagicMock(processing_status="ended")
+        batches.results.return_value = [entry(1, "ADD"), entry(0, "NOOP")]
+        results = evaluate_batch(["first", "second", "third"])
+
+    assert [r.decision for r in results] == ["NOOP", "ADD", "NOOP"]
+    assert results[2].reason == "Batch request failed"
+
+
 # ── 1.7 Git sync ─────────────────────────────────────────────────────────────
 
 def test_git_commit_generated_on_skill_add(mem_dir):
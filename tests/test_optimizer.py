@@ -167,6 +167,16 @@ def test_get_compression_candidates(large_skill, sample_skill):
     assert len(candidates) >= 1  # At least the large skill
 
 
+def test_backup_sort_key_orders_legacy_before_ns():
+    """Test that backups sort by filename suffix, legacy names first."""
+    from prism.memory.compressor import _backup_sort_key
+
+    legacy = Path("test-skill_20260223_101010.md")
+    newer = Path("test-skill_1771840000000000000.md")
+
+    assert _backup_sort_key(newer, "test-skill") > _backup_sort_key(legacy, "test-skill")
+
+
 # ── 4.3 Deduplication Detector Tests ────────────────────────────────────────
 
 
@@ -214,6 +224,180 @@ def test_find_duplicates_similar_skills():
     assert len(result) >= 0  # May or may not match depending on threshold
 
 
+def test_find_duplicates_sparse_matches_python_path():
+    """Test the sparse matmul path scores pairs exactly like the fallback."""
+    pytest.importorskip("scipy")
+    from prism.memory import dedup
+
+    skills = []
+    for i, extra in enumerate(["", " Also use mocks.", " Prefer fixtures.", ""]):
+        fm = SkillFrontmatter(
+            skill_id=f"skill-{i}",
+            type="skill",
+            domain_tags=["python"] if i < 3 else ["go"],
+            scope="global",
+            created=date.today(),
+            project_origin="test",
+        )
+        content = "Use pytest for testing Python code. Always write unit tests."
+        skills.append(Skill(frontmatter=fm, title=f"Skill {i}", content=content + extra))
+
+    fast = dedup.find_duplicates(skills, threshold=0.1)
+    with patch.object(dedup, "_vectorized_similar_pairs", return_value=None):
+        slow = dedup.find_duplicates(skills, threshold=0.1)
+
+    assert [(r.skill_a, r.skill_b) for r in fast] == [(r.skill_a, r.skill_b) for r in slow]
+    assert [r.similarity for r in fast] == pytest.approx([r.similarity for r in slow])
+
+
+def test_domain_candidate_pairs_dedupes_shared_tags():
+    """Test pairs are generated within domains and only once."""
+    from prism.memory.dedup import domain_candidate_pairs
+
+    tags = [["python", "testing"], ["python", "testing"], ["go"], ["testing"]]
+    skills = [
+        Skill(
+            frontmatter=SkillFrontmatter(
+                skill_id=f"skill-{i}",
+                type="skill",
+                domain_tags=t,
+                scope="global",
+                created=date.today(),
+                project_origin="test",
+            ),
+            title=f"Skill {i}",
+            content="Content",
+        )
+        for i, t in enumerate(tags)
+    ]
+
+    assert sorted(domain_candidate_pairs(skills)) == [(0, 1), (0, 3), (1, 3)]
+
+
+def test_find_duplicates_reuses_cached_term_frequencies(sample_skill, large_skill):
+    """Test unchanged skills are not re-tokenized on a second run."""
+    from prism.memory import dedup
+
+    dedup.find_duplicates([sample_skill, large_skill])
+    with patch.object(dedup, "_tokenize", wraps=dedup._tokenize) as tokenize:
+        dedup.find_duplicates([sample_skill, large_skill])
+
+    tokenize.assert_not_called()
+
+
+def test_find_duplicates_approximate_keeps_near_copies():
+    """Test the SimHash prefilter still reports near-identical skills."""
+    from prism.memory import dedup
+
+    content = "Use pytest fixtures for database setup and teardown in tests. " * 5
+    skills = [
+        Skill(
+            frontmatter=SkillFrontmatter(
+                skill_id=sid,
+                type="skill",
+                domain_tags=["python"],
+                scope="global",
+                created=date.today(),
+                project_origin="test",
+            ),
+            title="Pytest fixtures",
+            content=content + extra,
+        )
+        for sid, extra in (("skill-a", ""), ("skill-b", "Prefer factories."))
+    ]
+    skills.append(
+        Skill(
+            frontmatter=SkillFrontmatter(
+                skill_id="skill-c",
+                type="skill",
+                domain_tags=["python"],
+                scope="global",
+                created=date.today(),
+                project_origin="test",
+            ),
+            title="Docker volumes",
+            content="Mount named volumes for databases in compose files.",
+        )
+    )
+
+    with patch.object(dedup, "_vectorized_similar_pairs", return_value=None):
+        result = dedup.find_duplicates(skills, threshold=0.5, approximate=True)
+
+    assert [(r.skill_a, r.skill_b) for r in result] == [("skill-a", "skill-b")]
+
+
+def test_dense_similar_pairs_matches_sparse():
+    """Test the numpy-only fallback returns the same pairs as scipy."""
+    pytest.importorskip("scipy")
+    from prism.memory.dedup import _dense_similar_pairs, _sparse_similar_pairs
+
+    vectors = [{"a": 0.5, "b": 0.2}, {"a": 0.4, "b": 0.3}, {"c": 1.0}, {}]
+
+    dense = _dense_similar_pairs(vectors, 0.5)
+    sparse = _sparse_similar_pairs(vectors, 0.5)
+
+    assert [(i, j) for i, j, _ in dense] == [(i, j) for i, j, _ in sparse] == [(0, 1)]
+    assert dense[0][2] == pytest.approx(sparse[0][2])
+
+
+def test_dense_similar_pairs_blocks_the_product(monkeypatch):
+    """Test the dense fallback scores in row blocks with the same result."""
+    pytest.importorskip("numpy")
+    from prism.memory import dedup
+
+    vectors = [{"a": 1.0, "b": 0.1 * i} for i in range(7)] + [{"c": 1.0}, {"c": 0.9}]
+
+    whole = dedup._dense_similar_pairs(vectors, 0.9)
+    # 9 rows x 3 terms fits; the product goes in blocks of three rows
+    monkeypatch.setattr(dedup, "_DENSE_MAX_CELLS", 27)
+    blocked = dedup._dense_similar_pairs(vectors, 0.9)
+
+    assert [(i, j) for i, j, _ in blocked] == [(i, j) for i, j, _ in whole]
+    assert [sim for _, _, sim in blocked] == pytest.approx([sim for _, _, sim in whole])
+    assert (7, 8) in [(i, j) for i, j, _ in blocked]
+
+
+def test_find_duplicates_top_k_returns_best_pairs():
+    """Test top_k keeps only the highest-scoring pairs, in order."""
+    from prism.memory import dedup
+
+    base = "Use pytest fixtures for database setup and teardown."
+    extras = ["", " Prefer factories.", " Prefer factories over mocks for models."]
+    skills = [
+        Skill(
+            frontmatter=SkillFrontmatter(
+                skill_id=f"skill-{i}",
+                type="skill",
+                domain_tags=["python"],
+                scope="global",
+                created=date.today(),
+                project_origin="test",
+            ),
+            title="Fixtures",
+            content=base + extra,
+        )
+        for i, extra in enumerate(extras)
+    ]
+
+    everything = dedup.find_duplicates(skills, threshold=0.0)
+    best = dedup.find_duplicates(skills, threshold=0.0, top_k=2)
+
+    assert best == everything[:2]
+
+
+def test_find_duplicates_workers_match_serial(sample_skill, large_skill):
+    """Test process-pool scoring returns the same pairs as the serial loop."""
+    from prism.memory import dedup
+
+    with patch.object(dedup, "_vectorized_similar_pairs", return_value=None):
+        serial = dedup.find_duplicates([sample_skill, large_skill], threshold=0.0)
+        parallel = dedup.find_duplicates(
+            [sample_skill, large_skill], threshold=0.0, workers=2
+        )
+
+    assert parallel == serial
+
+
 def test_similarity_result_structure():
     """Test SimilarityResult dataclass."""
     result = SimilarityResult(
@@ -272,6 +456,172 @@ def test_find_all_conflicts_empty():
     assert result == []
 
 
+def test_find_all_conflicts_runs_pairs_concurrently(sample_skill, tmp_path):
+    """Test pairs are sent through one async client and conflicts collected."""
+    from unittest.mock import AsyncMock
+
+    others = []
+    for sid in ("skill-b", "skill-c"):
+        fm = SkillFrontmatter(
+            skill_id=sid,
+            type="skill",
+            domain_tags=["python"],
+            scope="global",
+            created=date.today(),
+            project_origin="test",
+        )
+        others.append(Skill(frontmatter=fm, title=sid, content="Content"))
+
+    reply = MagicMock()
+    reply.content = [MagicMock(text='{"conflict_detected": true, "conflict_type": "direct"}')]
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=False)
+    client.messages.create = AsyncMock(return_value=reply)
+
+    with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), patch(
+        "anthropic.AsyncAnthropic", return_value=client
+    ), patch("prism.memory.conflict_cache.GLOBAL_CONFIG_DIR", tmp_path):
+        result = find_all_conflicts([sample_skill] + others, max_pairs=10)
+        again = find_all_conflicts([sample_skill] + others, max_pairs=10)
+
+    assert client.messages.create.await_count == 3  # second run served from cache
+    assert again == result
+    assert {(r.skill_a, r.skill_b) for r in result} == {
+        ("test-skill", "skill-b"),
+        ("test-skill", "skill-c"),
+        ("skill-b", "skill-c"),
+    }
+
+
+def test_find_all_conflicts_uses_batch_over_threshold(sample_skill, tmp_path):
+    """Test large pair sets go through one Message Batch."""
+    fm2 = SkillFrontmatter(
+        skill_id="skill-b",
+        type="skill",
+        domain_tags=["python"],
+        scope="global",
+        created=date.today(),
+        project_origin="test",
+    )
+    skill2 = Skill(frontmatter=fm2, title="Skill B", content="Content")
+
+    entry = MagicMock(custom_id="req-0")
+    entry.result.type = "succeeded"
+    entry.result.message.content = [MagicMock(text='{"conflict_detected": true}')]
+    client = MagicMock()
+    client.messages.batches.create.return_value = MagicMock(processing_status="ended")
+    client.messages.batches.results.return_value = [entry]
+
+    with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), patch(
+        "anthropic.Anthropic", return_value=client
+    ), patch("prism.memory.conflict_cache.GLOBAL_CONFIG_DIR", tmp_path):
+        result = find_all_conflicts([sample_skill, skill2], batch_threshold=1)
+
+    client.messages.batches.create.assert_called_once()
+    assert [(r.skill_a, r.skill_b) for r in result] == [("test-skill", "skill-b")]
+
+
+def test_run_message_batch_cancels_after_max_wait():
+    """Test a batch still running at the deadline is canceled, keeping finished results."""
+    from prism.memory.llm import run_message_batch
+
+    done = MagicMock(custom_id="req-1")
+    done.result.type = "succeeded"
+    done.result.message.content = [MagicMock(text="ok")]
+    unfinished = MagicMock(custom_id="req-0")
+    unfinished.result.type = "canceled"
+    client = MagicMock()
+    client.messages.batches.create.return_value = MagicMock(id="b", processing_status="in_progress")
+    client.messages.batches.cancel.return_value = MagicMock(id="b", processing_status="canceling")
+    client.messages.batches.retrieve.return_value = MagicMock(id="b", processing_status="ended")
+    client.messages.batches.results.return_value = [unfinished, done]
+
+    with patch("time.sleep"):
+        texts = run_message_batch(client, ["a", "b"], "m", 16, max_wait=0)
+
+    client.messages.batches.cancel.assert_called_once_with("b")
+    assert texts == {1: "ok"}
+
+
+def test_find_all_conflicts_skips_caching_unusable_replies(sample_skill, tmp_path):
+    """Test non-object or unparseable replies neither crash nor get cached."""
+    from unittest.mock import AsyncMock
+
+    from prism.memory.conflict import _parse_conflict_response
+
+    assert _parse_conflict_response("[1]") is None
+    assert _parse_conflict_response('"x"') is None
+
+    fm2 = SkillFrontmatter(
+        skill_id="skill-b",
+        type="skill",
+        domain_tags=["python"],
+        scope="global",
+        created=date.today(),
+        project_origin="test",
+    )
+    skill2 = Skill(frontmatter=fm2, title="Skill B", content="Content")
+
+    reply = MagicMock()
+    reply.content = [MagicMock(text="[1]")]
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=False)
+    client.messages.create = AsyncMock(return_value=reply)
+
+    with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}), patch(
+        "anthropic.AsyncAnthropic", return_value=client
+    ), patch("prism.memory.conflict_cache.GLOBAL_CONFIG_DIR", tmp_path):
+        assert find_all_conflicts([sample_skill, skill2]) == []
+        reply.content = [MagicMock(text="```json\n{}\n```")]
+        assert find_all_conflicts([sample_skill, skill2]) == []
+        find_all_conflicts([sample_skill, skill2])
+
+    # Nothing usable was cached, so every run asked again
+    assert client.messages.create.await_count == 3
+
+
+def test_token_budget_tracker_waits_for_window():
+    """Test reservations over the budget wait for the window to roll."""
+    import asyncio
+    import time
+
+    from prism.memory.llm import TokenBudgetTracker
+
+    async def run():
+        tracker = TokenBudgetTracker(tokens_per_minute=100, window=0.05)
+        slot = await tracker.acquire(80)
+        tracker.record(slot, 90)
+        start = time.monotonic()
+        await tracker.acquire(20)
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.04
+
+
+def test_conflict_cache_key_tracks_content(sample_skill, tmp_path):
+    """Test pair keys ignore order but change when content changes."""
+    from prism.memory.conflict_cache import ConflictCache, pair_key
+
+    fm2 = SkillFrontmatter(
+        skill_id="skill-b",
+        type="skill",
+        domain_tags=["python"],
+        scope="global",
+        created=date.today(),
+        project_origin="test",
+    )
+    skill2 = Skill(frontmatter=fm2, title="Skill B", content="Content")
+    key = pair_key(sample_skill, skill2, "model")
+
+    with ConflictCache(tmp_path / "cache.db") as cache:
+        cache.put(key, '{"conflict_detected": false}')
+        assert cache.get(pair_key(skill2, sample_skill, "model")) is not None
+        skill2.content = "Edited"
+        assert cache.get(pair_key(sample_skill, skill2, "model")) is None
+
+
 def test_conflict_result_structure():
     """Test ConflictResult dataclass."""
     result = ConflictResult(
@@ -6,10 +6,15 @@ import pytest
 from unittest.mock import MagicMock, Mock, patch
 
 from prism.pipeline.container_manager import ContainerManager, TestContainer
-from prism.pipeline.quality_gates import QualityGatesRunner, GateResult, QualityReport
+from prism.pipeline.quality_gates import (
+    GateResult,
+    PytestWorker,
+    QualityGatesRunner,
+    QualityReport,
+)
 from prism.pipeline.pr_manager import PRManager, PullRequest
 from prism.pipeline.orchestrator import PipelineOrchestrator, PipelineResult
-from prism.qa.approval_workflow import QAApprovalWorkflow, QAReviewResult
+from prism.qa.approval_workflow import QAApprovalWorkflow, QAReviewResult, QAReviewStore
 from prism.qa.container_access import ContainerAccess, ContainerSession
 
 
@@ -75,54 +80,313 @@ class TestQualityGatesRunner:
         actual_gates = [g["name"] for g in runner.GATES]
         assert actual_gates == expected_gates
 
-    @patch("subprocess.run")
-    def test_run_single_gate_success(self, mock_run):
-        """Test running a single successful gate."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="All checks passed",
-            stderr="",
-        )
+    @staticmethod
+    def _python_gate(name: str, code: str, timeout: int = 60) -> dict:
+        import sys
+
+        return {
+            "name": name,
+            "command": [sys.executable, "-c", code],
+            "timeout": timeout,
+            "description": name,
+        }
 
+    def test_run_single_gate_success(self):
+        """Test running a single successful gate."""
         runner = QualityGatesRunner()
+        runner.GATES = [self._python_gate("linting", "print('All checks passed')")]
+
         result = runner.run_single("linting")
 
         assert result.passed is True
         assert result.name == "linting"
-        assert result.output == "All checks passed"
-        mock_run.assert_called_once()
+        assert result.output == "All checks passed\n"
 
-    @patch("subprocess.run")
-    def test_run_single_gate_failure(self, mock_run):
+    def test_run_single_gate_failure(self):
         """Test running a gate that fails."""
-        mock_run.return_value = Mock(
-            returncode=1,
-            stdout="",
-            stderr="Error found",
-        )
-
         runner = QualityGatesRunner()
+        runner.GATES = [
+            self._python_gate(
+                "linting", "import sys; sys.stderr.write('Error found'); sys.exit(1)"
+            )
+        ]
+
         result = runner.run_single("linting")
 
         assert result.passed is False
         assert result.error_output == "Error found"
 
-    @patch("subprocess.run")
-    def test_run_all_gates_success(self, mock_run):
+    def test_run_all_gates_success(self):
         """Test running all gates successfully."""
-        mock_run.return_value = Mock(
-            returncode=0,
-            stdout="Success",
-            stderr="",
-        )
+        import subprocess
 
         runner = QualityGatesRunner()
-        report = runner.run_all("TASK-42")
+        runner.GATES = [
+            self._python_gate(g["name"], "print('Success')")
+            for g in QualityGatesRunner.GATES
+        ]
+
+        with patch("subprocess.Popen", wraps=subprocess.Popen) as popen:
+            report = runner.run_all("TASK-42")
 
         assert report.all_passed is True
         assert report.task_id == "TASK-42"
         assert len(report.gates) == len(runner.GATES)
-        assert mock_run.call_count == len(runner.GATES)
+        assert popen.call_count == len(runner.GATES)
+
+    def test_gate_output_streams_and_times_out(self, capsys):
+        """Test gate output is shown live and a hung gate is killed."""
+        runner = QualityGatesRunner(verbose=True)
+        runner.GATES = [
+            self._python_gate(
+                "linting",
+                "import time; print('started', flush=True); time.sleep(30)",
+                timeout=1,
+            )
+        ]
+
+        result = runner.run_single("linting")
+
+        assert result.passed is False
+        assert result.error_output == "Timeout after 1s"
+        assert result.output == "started\n"
+        assert "started" in capsys.readouterr().out
+
+    def test_passing_gate_output_is_trimmed_and_quiet(self, capsys):
+        """Test a chatty passing gate keeps only its tail and prints nothing."""
+        runner = QualityGatesRunner()
+        runner.GATES = [
+            self._python_gate(
+                "linting", "for i in range(5000): print('x' * 60, i)\nprint('done')"
+            )
+        ]
+
+        result = runner.run_single("linting")
+
+        assert result.passed is True
+        assert len(result.output) <= 4096
+        assert result.output.endswith("done\n")
+        assert "xxxx" not in capsys.readouterr().out
+
+    def test_failing_gate_stderr_keeps_only_its_tail(self):
+        """Test a gate flooding stderr keeps just its last lines."""
+        runner = QualityGatesRunner()
+        runner.GATES = [
+            self._python_gate(
+                "linting",
+                "import sys\nfor i in range(5000): print('noise', i, file=sys.stderr)\n"
+                "sys.stderr.write('last'); sys.exit(1)",
+            )
+        ]
+
+        result = runner.run_single("linting")
+
+        assert result.passed is False
+        assert result.error_output.count("\n") < 5000
+        assert result.error_output.endswith("noise 4999\nlast")
+        assert "noise 0\n" not in result.error_output
+
+    def test_cancelling_arun_all_terminates_running_gate(self, tmp_path):
+        """Test cancelling the async runner kills the gate in flight."""
+        import asyncio
+        import os
+
+        pid_file = tmp_path / "pid"
+        runner = QualityGatesRunner()
+        runner.GATES = [
+            self._python_gate(
+                "linting",
+                f"import os, time; open({str(pid_file)!r}, 'w').write(str(os.getpid()));"
+                " time.sleep(30)",
+            )
+        ]
+
+        async def run():
+            task = asyncio.create_task(runner.arun_all("TASK-42"))
+            while not pid_file.exists() or not pid_file.read_text():
+                await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
+    def test_in_process_pytest_gates_share_one_session(self, tmp_path, monkeypatch):
+        """Test pytest gates run in one in-process session, split per gate."""
+        (tmp_path / "tests" / "unit").mkdir(parents=True)
+        (tmp_path / "tests" / "integration").mkdir()
+        (tmp_path / "tests" / "unit" / "test_ok.py").write_text(
+            "def test_ok():\n    assert True\n"
+        )
+        (tmp_path / "tests" / "integration" / "test_bad.py").write_text(
+            "def test_bad():\n    assert False\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        runner = QualityGatesRunner(in_process=True)
+        runner.GATES = [
+            {
+                "name": "unit_tests",
+                "command": ["pytest", "tests/unit", "-p", "no:cacheprovider"],
+                "timeout": 60,
+                "description": "Unit tests",
+            },
+            {
+                "name": "integration_tests",
+                "command": ["pytest", "tests/integration", "-p", "no:cacheprovider"],
+                "timeout": 60,
+                "description": "Integration tests",
+            },
+        ]
+
+        with patch("pytest.main", wraps=pytest.main) as main:
+            report = runner.run_all("TASK-42")
+
+        assert main.call_count == 1
+        assert [g.passed for g in report.gates] == [True, False]
+        assert report.failed_gate == "integration_tests"
+        assert "test_bad" in report.gates[1].error_output
+
+    def test_in_process_gate_tests_can_call_asyncio_run(self, tmp_path, monkeypatch):
+        """Test project tests using asyncio.run pass under the in-process worker."""
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_async.py").write_text(
+            "import asyncio\n\n"
+            "async def answer():\n    return 42\n\n"
+            "def test_async():\n    assert asyncio.run(answer()) == 42\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        runner = QualityGatesRunner(in_process=True)
+        runner.GATES = [
+            {
+                "name": "unit_tests",
+                "command": ["pytest", "tests", "-p", "no:cacheprovider"],
+                "timeout": 60,
+                "description": "Unit tests",
+            },
+        ]
+
+        report = runner.run_all("TASK-42")
+
+        assert report.all_passed, report.gates[0].output
+
+    def test_in_process_output_is_trimmed_and_streamed_when_verbose(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        """Test worker output gets the subprocess gates' tail trimming and --verbose."""
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_many.py").write_text(
+            "import pytest\n\n"
+            "@pytest.mark.parametrize('n', range(300))\n"
+            "def test_many(n):\n    pass\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        gate = {
+            "name": "unit_tests",
+            "command": ["pytest", "tests", "-v", "-p", "no:cacheprovider"],
+            "timeout": 60,
+            "description": "Unit tests",
+        }
+
+        quiet = PytestWorker().run([gate])["unit_tests"]
+        assert quiet.passed is True
+        assert len(quiet.output) <= 4096
+        assert "300 passed" in quiet.output
+        assert "test_many" not in capsys.readouterr().out
+
+        PytestWorker(verbose=True).run([gate])
+        assert "test_many[0]" in capsys.readouterr().out
+
+    def test_in_process_mode_runs_coverage_as_subprocess(self):
+        """Test coverage gates never run inside the already-importing process."""
+        import asyncio
+
+        runner = QualityGatesRunner(in_process=True)
+        gate = {
+            "name": "coverage",
+            "command": ["pytest", "--cov=prism"],
+            "timeout": 60,
+            "description": "Coverage",
+        }
+        sentinel = GateResult("coverage", True, 1, "", None, "pytest --cov=prism")
+
+        async def fake_arun_gate(config, stream=False):
+            return sentinel
+
+        with patch.object(runner, "_arun_gate", side_effect=fake_arun_gate), patch.object(
+            runner._worker, "run"
+        ) as worker_run:
+            result = asyncio.run(runner._adispatch_gate(gate))
+
+        assert result is sentinel
+        worker_run.assert_not_called()
+
+    def test_run_all_parallel_stops_at_first_failure(self):
+        """Test a failing gate cancels the gates still running."""
+        import sys
+
+        runner = QualityGatesRunner()
+        runner.GATES = [
+            {
+                "name": "slow",
+                "command": [sys.executable, "-c", "import time; time.sleep(30)"],
+                "timeout": 60,
+            },
+            {
+                "name": "broken",
+                "command": [sys.executable, "-c", "raise SystemExit(1)"],
+                "timeout": 60,
+            },
+        ]
+
+        report = runner.run_all_parallel("TASK-42")
+
+        assert report.all_passed is False
+        assert report.failed_gate == "broken"
+        assert [g.name for g in report.gates] == ["broken"]
+        assert report.total_duration_ms < 20_000
+
+    def test_run_all_parallel_verbose_streams_labelled_lines(self, capsys):
+        """Test --verbose streams parallel gates' output, prefixed by gate name."""
+        import sys
+
+        runner = QualityGatesRunner(verbose=True)
+        runner.GATES = [
+            {
+                "name": "lint",
+                "command": [sys.executable, "-c", "print('one'); print('two', end='')"],
+                "timeout": 60,
+            },
+        ]
+
+        report = runner.run_all_parallel("TASK-42")
+
+        out = capsys.readouterr().out
+        assert report.all_passed is True
+        assert "[lint] one\n" in out
+        assert "[lint] two\n" in out
+
+    def test_run_all_parallel_skips_subsumed_gates(self):
+        """Test unit and integration tests are not rerun when coverage runs them."""
+        import sys
+
+        ok = [sys.executable, "-c", "print('ok')"]
+        runner = QualityGatesRunner()
+        runner.GATES = [
+            {"name": "unit_tests", "command": ok, "timeout": 60},
+            {"name": "coverage", "command": ok, "timeout": 60},
+            {"name": "integration_tests", "command": ok, "timeout": 60},
+        ]
+
+        report = runner.run_all_parallel("TASK-42")
+
+        assert report.all_passed is True
+        assert [g.name for g in report.gates] == ["coverage"]
+        assert report.gates[0].output.strip() == "ok"
 
 
 # =============================================================================
@@ -167,6 +431,102 @@ class TestContainerManager:
 
         assert manager.ROLE_LIMITS == expected_limits
 
+    def test_launch_uses_docker_sdk(self):
+        """Test that launching creates the container via the SDK."""
+        with patch("prism.pipeline.container_manager.docker.from_env") as from_env, \
+                patch.dict("os.environ", {"GITHUB_TOKEN": "test"}):
+            client = from_env.return_value
+            client.containers.list.return_value = []
+            container = client.containers.run.return_value
+            container.id = "abc123"
+            container.attrs = {
+                "NetworkSettings": {"Ports": {"7681/tcp": [{"HostPort": "32768"}]}}
+            }
+
+            result = ContainerManager().launch_test_container(
+                "TASK-42", "feat/TASK-42", role="test"
+            )
+
+        kwargs = client.containers.run.call_args.kwargs
+        assert kwargs["name"] == "prism-test-TASK-42"
+        assert kwargs["labels"]["prism.test.role"] == "test"
+        assert kwargs["ports"] == {"7681/tcp": None}
+        assert result.id == "abc123"
+        assert result.web_terminal_url == "http://localhost:32768"
+
+    def test_compose_template_resolves_relative_paths(self, tmp_path):
+        """Test bind mounts and env_files resolve against the compose file's dir."""
+        from prism.pipeline.container_manager import load_compose_template
+
+        (tmp_path / ".env").write_text("# comment\nLOG_LEVEL=debug\n")
+        compose = tmp_path / "docker-compose.yml"
+        compose.write_text(
+            "services:\n"
+            "  app:\n"
+            "    image: app:latest\n"
+            "    env_file: .env\n"
+            "    volumes:\n"
+            "      - ./data:/data:ro\n"
+            "      - cache:/root/.cache\n"
+        )
+
+        run = load_compose_template(compose)["app"]["run"]
+
+        assert run["volumes"] == {
+            str((tmp_path / "data").resolve()): {"bind": "/data", "mode": "ro"},
+            "cache": {"bind": "/root/.cache", "mode": "rw"},
+        }
+        assert run["environment"] == {"LOG_LEVEL": "debug"}
+
+    def test_launch_drops_cached_session_of_previous_container(self):
+        """Test a relaunch doesn't keep serving the old container's port."""
+        from prism.qa.container_access import _SESSIONS
+
+        _SESSIONS["TASK-42"] = ContainerSession(
+            "TASK-42", "prism-test-TASK-42", "http://localhost:1", "docker exec"
+        )
+        with patch("prism.pipeline.container_manager.docker.from_env") as from_env, \
+                patch.dict("os.environ", {"GITHUB_TOKEN": "test"}):
+            client = from_env.return_value
+            client.containers.list.return_value = []
+            client.containers.run.return_value.attrs = {
+                "NetworkSettings": {"Ports": {"7681/tcp": [{"HostPort": "32769"}]}}
+            }
+
+            ContainerManager().launch_test_container("TASK-42", "feat/TASK-42")
+
+        assert "TASK-42" not in _SESSIONS
+
+    def test_list_active_containers_uses_one_call(self):
+        """Test that listing builds models from the sparse list summaries."""
+        summary = MagicMock(attrs={
+            "Id": "abc123",
+            "Names": ["/prism-test-TASK-42"],
+            "Labels": {"prism.test.task": "TASK-42", "prism.test.role": "test"},
+            "Ports": [{"PrivatePort": 7681, "PublicPort": 32768, "Type": "tcp"}],
+            "Status": "Up 2 minutes (healthy)",
+        })
+        with patch("prism.pipeline.container_manager.docker.from_env") as from_env:
+            client = from_env.return_value
+            client.containers.list.return_value = [summary]
+
+            [container] = ContainerManager().list_active_containers()
+
+        client.containers.get.assert_not_called()
+        assert container.name == "prism-test-TASK-42"
+        assert container.status == "ready_for_qa"
+        assert container.web_terminal_url == "http://localhost:32768"
+
+    def test_wait_for_ready_reacts_to_health_event(self):
+        """Test that a healthy event ends the wait without exec polling."""
+        with patch("prism.pipeline.container_manager.docker.from_env") as from_env:
+            client = from_env.return_value
+            client.events.return_value = iter([{"status": "health_status: healthy"}])
+
+            assert ContainerManager().wait_for_ready("TASK-42", timeout=60) is True
+
+        client.containers.get.assert_not_called()
+
 
 # =============================================================================
 # PR Manager Tests
@@ -220,6 +580,201 @@ class TestPRManager:
             assert "&" not in branch
             assert "!" not in branch
 
+    def test_cli_import_does_not_load_requests(self):
+        """Test requests is only imported once a GitHub session is built."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, prism.cli, prism.pipeline.pr_manager; "
+            "print('requests' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_api_calls_share_one_session(self):
+        """Test GitHub calls reuse a session that carries the auth headers."""
+        with patch.dict(
+            "os.environ", {"GITHUB_TOKEN": "test", "GITHUB_REPO": "user/repo"}
+        ):
+            manager = PRManager()
+
+        assert manager.session.headers["Authorization"] == "token test"
+        adapter = manager.session.get_adapter("https://api.github.com")
+        assert adapter.max_retries.total == 3
+        assert 502 in adapter.max_retries.status_forcelist
+
+        with patch.object(manager.session, "post") as post:
+            manager.approve_pr(7, "LGTM")
+            manager.request_changes(7, "Nope")
+
+        assert post.call_count == 2
+        assert "Authorization" not in post.call_args.kwargs.get("headers", {})
+        assert post.call_args.args[0].endswith("/pulls/7/reviews")
+
+    def test_token_verified_once_before_pushing(self):
+        """Test a rejected token stops PR creation before any git work."""
+        with patch.dict(
+            "os.environ", {"GITHUB_TOKEN": "test", "GITHUB_REPO": "user/repo"}
+        ):
+            manager = PRManager()
+
+        with patch.object(
+            manager.session, "get", return_value=Mock(status_code=401)
+        ), patch.object(manager, "_create_branch_and_commit") as commit:
+            with pytest.raises(RuntimeError):
+                manager.create_pr_from_task("TASK-42", "Title")
+        commit.assert_not_called()
+
+        with patch.object(
+            manager.session, "get", return_value=Mock(status_code=200)
+        ) as get:
+            manager.verify_token()
+            manager.verify_token()
+        assert get.call_count == 1
+        assert get.call_args.args[0] == "https://api.github.com/user"
+
+    def test_token_check_lets_non_401_errors_through(self):
+        """Test 403 (app/Actions tokens) and 5xx don't block PR creation."""
+        with patch.dict(
+            "os.environ", {"GITHUB_TOKEN": "test", "GITHUB_REPO": "user/repo"}
+        ):
+            manager = PRManager()
+
+        for status in (403, 503):
+            response = Mock(status_code=status, ok=False)
+            response.raise_for_status.side_effect = AssertionError("should not raise")
+            with patch.object(manager.session, "get", return_value=response):
+                manager.verify_token()
+            assert manager._token_verified is False
+
+    def test_post_payload_encoded_with_orjson(self):
+        """Test POST bodies are pre-encoded when orjson is available."""
+        import json
+
+        with patch.dict(
+            "os.environ", {"GITHUB_TOKEN": "test", "GITHUB_REPO": "user/repo"}
+        ):
+            manager = PRManager()
+
+        fake_orjson = Mock()
+        fake_orjson.dumps.side_effect = lambda data: json.dumps(data).encode()
+        with patch("prism.pipeline.pr_manager.orjson", fake_orjson), patch.object(
+            manager.session, "post"
+        ) as post:
+            manager.add_pr_comment(7, "Hola ✅")
+
+        kwargs = post.call_args.kwargs
+        assert json.loads(kwargs["data"]) == {"body": "Hola ✅"}
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+
+    def test_pr_status_cached_with_etag(self):
+        """Test status polls hit the cache, then revalidate with the ETag."""
+        with patch.dict(
+            "os.environ", {"GITHUB_TOKEN": "test", "GITHUB_REPO": "user/repo"}
+        ):
+            manager = PRManager()
+
+        fresh = Mock(status_code=200, headers={"ETag": '"v1"'})
+        fresh.json.return_value = {"number": 7, "state": "open"}
+        not_modified = Mock(status_code=304, headers={"ETag": '"v1"'})
+
+        with patch.object(manager.session, "get", return_value=fresh) as get:
+            assert manager.get_pr_status(7)["state"] == "open"
+            assert manager.get_pr_status(7)["state"] == "open"
+        assert get.call_count == 1
+
+        # Expire the entry: the next call sends If-None-Match and keeps the data
+        fetched_at, etag, data = manager._status_cache[7]
+        manager._status_cache[7] = (fetched_at - 60, etag, data)
+        with patch.object(manager.session, "get", return_value=not_modified) as get:
+            assert manager.get_pr_status(7) == {"number": 7, "state": "open"}
+        assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+        with patch.object(manager.session, "post"):
+            manager.approve_pr(7, "LGTM")
+        assert 7 not in manager._status_cache
+
+    def test_async_manager_bulk_status(self):
+        """Test AsyncPRManager fetches several PR statuses concurrently."""
+        import asyncio
+
+        import httpx
+
+        from prism.pipeline.async_pr_manager import AsyncPRManager
+
+        def handler(request):
+            assert request.headers["Authorization"] == "token test"
+            number = int(request.url.path.rsplit("/", 1)[1])
+            if number == 404:
+                return httpx.Response(404)
+            return httpx.Response(200, json={"number": number, "state": "open"})
+
+        async def run():
+            async with AsyncPRManager() as prs:
+                return await prs.bulk_get_status([1, 2, 404])
+
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        with patch.dict(
+            "os.environ", {"GITHUB_TOKEN": "test", "GITHUB_REPO": "user/repo"}
+        ), patch(
+            "httpx.AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        ):
+            statuses = asyncio.run(run())
+
+        assert statuses[1] == {"number": 1, "state": "open"}
+        assert statuses[2]["number"] == 2
+        assert statuses[404] is None
+
+    def test_create_branch_and_commit_single_shell(self, tmp_path, monkeypatch):
+        """Test branch, commit and push run as one quoted shell chain."""
+        import subprocess
+
+        origin = tmp_path / "origin.git"
+        work = tmp_path / "work"
+        subprocess.run(["git", "init", "-q", "--bare", str(origin)], check=True)
+        subprocess.run(["git", "init", "-q", str(work)], check=True)
+        subprocess.run(
+            ["git", "-C", str(work), "remote", "add", "origin", str(origin)],
+            check=True,
+        )
+        (work / "a.txt").write_text("x")
+        monkeypatch.chdir(work)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+
+        with patch.dict(
+            "os.environ", {"GITHUB_TOKEN": "test", "GITHUB_REPO": "user/repo"}
+        ):
+            manager = PRManager()
+            with patch(
+                "prism.pipeline.pr_manager.subprocess.run", wraps=subprocess.run
+            ) as run:
+                manager._create_branch_and_commit(
+                    "feat/TASK-42-x", "TASK-42", "it's $(rm -rf /) `done`"
+                )
+
+        assert run.call_count == 1
+        log = subprocess.run(
+            ["git", "-C", str(origin), "log", "-1", "--format=%B", "feat/TASK-42-x"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert log.stdout.startswith("feat: it's $(rm -rf /) `done`")
+        assert "Task: TASK-42" in log.stdout
+        upstream = subprocess.run(
+            ["git", "-C", str(work), "rev-parse", "--abbrev-ref", "@{upstream}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert upstream.stdout.strip() == "origin/feat/TASK-42-x"
+
 
 # =============================================================================
 # Pipeline Orchestrator Tests
@@ -314,6 +869,60 @@ class TestQAApprovalWorkflow:
         assert workflow._results[123].approved is False
         assert workflow._results[123].message == "Needs work"
 
+    @patch("prism.qa.approval_workflow.ContainerManager")
+    @patch("prism.qa.approval_workflow.PRManager")
+    def test_monitor_wakes_on_decision(self, mock_pr_cls, mock_cm_cls):
+        """Test the monitor acts as soon as QA decides, without polling."""
+        workflow = QAApprovalWorkflow()
+
+        workflow.start_monitoring(123, "prism-test-TASK-42", "TASK-42")
+        thread = workflow._monitored_prs[123]
+        workflow.reject(123, "Needs work", "qa-agent", "TASK-42")
+        thread.join(timeout=5)
+
+        # The thread is released at once; cleanup is left to a timer
+        assert not thread.is_alive()
+        workflow.pr_manager.request_changes.assert_called_once_with(
+            123, "Needs work", "qa-agent"
+        )
+        assert workflow._timers[123].is_alive()
+        assert workflow._results == workflow._events == workflow._monitored_prs == {}
+
+        timer = workflow._timers[123]
+        workflow.shutdown()
+        timer.join(timeout=5)
+        workflow.container_manager.destroy_container.assert_not_called()
+
+    @patch("prism.qa.approval_workflow._CONTAINER_GRACE_SECONDS", 0)
+    @patch("prism.qa.approval_workflow.ContainerManager")
+    @patch("prism.qa.approval_workflow.PRManager")
+    def test_cleanup_timer_forgets_itself(self, mock_pr_cls, mock_cm_cls):
+        """Test nothing about a resolved PR is kept once its container is gone."""
+        workflow = QAApprovalWorkflow()
+
+        workflow.start_monitoring(123, "prism-test-TASK-42", "TASK-42")
+        thread = workflow._monitored_prs[123]
+        workflow.approve(123, "LGTM", "qa-agent", "TASK-42")
+        thread.join(timeout=5)
+        with workflow._lock:
+            timer = workflow._timers.get(123)
+        if timer is not None:
+            timer.join(timeout=5)
+
+        workflow.container_manager.destroy_container.assert_called_once_with("TASK-42")
+        assert workflow._timers == {}
+
+    def test_review_store_returns_latest_per_pr(self):
+        """Test the review store keeps a per-PR history and returns the newest."""
+        store = QAReviewStore()
+        for approved in (False, True):
+            store.save_review(QAReviewResult(123, approved, "", "qa-agent", "TASK-42"))
+        store.save_review(QAReviewResult(7, False, "", "qa-agent", "TASK-7"))
+
+        assert store.get_review(123).approved is True
+        assert store.get_review(7).approved is False
+        assert store.get_review(999) is None
+
 
 # =============================================================================
 # Container Access Tests
@@ -337,6 +946,43 @@ class TestContainerAccess:
         assert session.web_terminal_url == "http://localhost:7681"
         assert "docker exec" in session.shell_command
 
+    def test_check_status_execs_through_sdk(self):
+        """Test status checks reuse the SDK client instead of docker exec."""
+        client = MagicMock()
+        container = client.containers.get.return_value
+        container.exec_run.return_value = (0, (b"approved\n", None))
+
+        with patch(
+            "prism.qa.container_access._docker_client", return_value=client
+        ), patch("prism.qa.container_access.subprocess.run") as run:
+            status = ContainerAccess().check_status("TASK-42")
+
+        assert status == "approved"
+        run.assert_not_called()
+        client.containers.get.assert_called_once_with("prism-test-TASK-42")
+        assert container.exec_run.call_args.kwargs["demux"] is True
+
+    def test_get_session_cached_until_invalidated(self):
+        """Test the session is built once per container lifetime."""
+        access = ContainerAccess()
+        access.invalidate("TASK-42")
+        port_result = Mock(returncode=0, stdout="0.0.0.0:49153\n")
+
+        with patch(
+            "prism.qa.container_access.subprocess.run", return_value=port_result
+        ) as run:
+            first = access.get_session("TASK-42")
+            second = ContainerAccess().get_session("TASK-42")
+            assert run.call_count == 1
+
+            access.invalidate("TASK-42")
+            access.get_session("TASK-42")
+            assert run.call_count == 2
+
+        assert first.web_terminal_url == "http://localhost:49153"
+        assert second is first
+        access.invalidate("TASK-42")
+
 
 # =============================================================================
 # Integration Tests